@@ -0,0 +1,142 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import datetime
+import gzip
+import json
+import logging
+import os
+import re
+import time
+from typing import Optional
+
+from bs4 import Tag
+
+from amazonorders import util
+from amazonorders.conf import AmazonOrdersConfig
+from amazonorders.entity.order import Order
+
+logger = logging.getLogger(__name__)
+
+SETTLED_DELIVERY_STATUSES = ("delivered", "return complete", "refund")
+
+
+class OrderDetailsCache:
+    """
+    A persistent, on-disk cache of Order details pages, keyed by Order number, so repeated ``full_details`` queries
+    only request details from Amazon for Orders that are new or may still change. Each Order is stored as a single
+    gzipped file in ``order_details_cache_dir`` (which defaults to an ``order-details`` directory alongside
+    ``cookie_jar_path``).
+
+    Once an Order is settled (see :func:`is_settled`), its cached details never expire. Otherwise they expire after
+    ``order_details_cache_ttl`` seconds.
+    """
+
+    def __init__(self,
+                 config: AmazonOrdersConfig) -> None:
+        #: The config to use.
+        self.config: AmazonOrdersConfig = config
+
+        #: The directory in which cached Order details are stored.
+        self.cache_dir: str = config.order_details_cache_dir or os.path.join(
+            os.path.dirname(config.cookie_jar_path), "order-details")
+
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(self,
+            order_id: str) -> Optional[Tag]:
+        """
+        Get the parsed details page for the given Order, if it is cached and has not expired.
+
+        :param order_id: The Amazon Order ID to lookup.
+        :return: The parsed details page, or ``None`` if there is no fresh entry.
+        """
+        path = self._get_path(order_id)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            logger.debug(f"Cached details for Order {order_id} could not be read, ignoring", exc_info=True)
+            self.invalidate(order_id)
+            return None
+
+        if not entry.get("immutable") and time.time() - entry.get("fetched_at", 0) > \
+                self.config.order_details_cache_ttl:
+            logger.debug(f"Cached details for Order {order_id} have expired")
+            return None
+
+        logger.debug(f"Using cached details for Order {order_id}")
+
+        html = entry["html"]
+        if self.config.strip_scripts:
+            html = util.strip_scripts(html, self.config.constants.KEEP_SCRIPT_TAG_REGEX)
+
+        return util.parse_html(html, self.config.bs4_parser)
+
+    def put(self,
+            order_id: str,
+            html: str,
+            order: Order) -> None:
+        """
+        Cache the details page for the given Order.
+
+        :param order_id: The Amazon Order ID the details page is for.
+        :param html: The raw HTML of the details page.
+        :param order: The Order parsed from ``html``, used to determine if the entry can ever expire.
+        """
+        entry = {
+            "fetched_at": time.time(),
+            "immutable": is_settled(order),
+            "html": html
+        }
+
+        util.atomic_write(self._get_path(order_id), gzip.compress(json.dumps(entry).encode("utf-8")))
+
+    def invalidate(self,
+                   order_id: str) -> None:
+        """
+        Remove the given Order from the cache, if present.
+
+        :param order_id: The Amazon Order ID to remove.
+        """
+        try:
+            os.remove(self._get_path(order_id))
+        except FileNotFoundError:
+            pass
+
+    def _get_path(self,
+                  order_id: str) -> str:
+        return os.path.join(self.cache_dir, f"{re.sub(r'[^A-Za-z0-9-]', '_', order_id)}.json.gz")
+
+
+def is_settled(order: Order,
+               today: Optional[datetime.date] = None) -> bool:
+    """
+    Determine if an Order's details can no longer change: it was cancelled, or every Shipment has been delivered
+    (or returned) and no Item is still within its return window.
+
+    :param order: The Order to check.
+    :param today: The date to compare return windows against. Defaults to today.
+    :return: ``True`` if the Order is settled.
+    """
+    if order.cancelled:
+        return True
+
+    if not order.shipments:
+        return False
+
+    for shipment in order.shipments:
+        if not shipment.delivery_status or not shipment.delivery_status.strip().lower().startswith(
+                SETTLED_DELIVERY_STATUSES):
+            return False
+
+    today = today or datetime.date.today()
+    for item in order.items:
+        if item.return_eligible_date and item.return_eligible_date >= today:
+            return False
+
+    return True
@@ -0,0 +1,216 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import atexit
+import collections
+import gzip
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Deque, Optional, Tuple
+from urllib.parse import urlparse
+
+from amazonorders.conf import debug_output_file_lock
+from amazonorders.exception import AmazonOrdersError
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Distinguishes writers created in the same second by the same process
+_writer_ids = itertools.count()
+
+
+class DebugCaptureWriter:
+    """
+    Writes the HTML pages captured when :attr:`~amazonorders.session.AmazonSession.debug` is enabled to
+    ``output_dir``, on a background thread, so capturing a page never blocks the request it was captured from.
+
+    Each page is named for the last part of its URL's path, this writer's run, and a per-run counter (ex.
+    ``order-history_20250102-030405-1234-0_17.html``), so a name is assigned in constant time, without probing
+    ``output_dir`` for existing files. Pages can be compressed with ``gzip`` or ``zstd`` (``pip install
+    amazon-orders[zstd]``), and ``output_dir`` can be rotated, so that once more than ``max_files`` captures (or
+    ``max_bytes`` of captures) are in it, the oldest are deleted.
+    """
+
+    #: The supported values of ``compression``, mapped to the extension added to captured pages.
+    COMPRESSION_EXTENSIONS = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+    def __init__(self,
+                 output_dir: str,
+                 compression: Optional[str] = None,
+                 max_files: int = 0,
+                 max_bytes: int = 0,
+                 max_queued: int = 256) -> None:
+        if compression not in self.COMPRESSION_EXTENSIONS:
+            raise AmazonOrdersError(f"Debug output compression '{compression}' is not supported, use one of "
+                                    f"{', '.join(str(c) for c in self.COMPRESSION_EXTENSIONS)}.")
+        if compression == "zstd" and not zstandard:
+            raise AmazonOrdersError("Debug output compression 'zstd' requires zstandard, install it with "
+                                    "`pip install amazon-orders[zstd]`.")
+
+        #: The directory captured pages are written to.
+        self.output_dir: str = output_dir
+        #: The compression to write captured pages with, ``None`` to write them uncompressed.
+        self.compression: Optional[str] = compression
+        #: The maximum number of captures to keep in :attr:`output_dir`, ``0`` for no limit.
+        self.max_files: int = max_files
+        #: The maximum total size in bytes of the captures to keep in :attr:`output_dir`, ``0`` for no limit.
+        self.max_bytes: int = max_bytes
+        #: Identifies this writer's run in the names of the pages it captures.
+        self.run_id: str = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_writer_ids)}"
+
+        self._counter = itertools.count()
+        # Pages waiting to be written, bounded so a slow disk can't grow memory without limit
+        self._queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue(maxsize=max_queued)
+        # The (path, size) of the captures in output_dir, oldest first, populated when the writer thread starts
+        self._captures: Deque[Tuple[str, int]] = collections.deque()
+        self._captures_bytes = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def capture(self,
+                url: str,
+                text: str) -> str:
+        """
+        Queue a captured page to be written. This only blocks if the queue of pages waiting to be written is full.
+
+        :param url: The URL of the page.
+        :param text: The page's HTML.
+        :return: The path the page will be written to.
+        """
+        page_name = os.path.splitext(os.path.basename(urlparse(url).path))[0] or "index"
+        filename = (f"{page_name}_{self.run_id}_{next(self._counter)}.html"
+                    f"{self.COMPRESSION_EXTENSIONS[self.compression]}")
+        path = os.path.join(self.output_dir, filename)
+
+        if not self._start():
+            logger.warning(f"Debug capture writer thread is not running, dropping capture: {path}")
+            return path
+
+        self._queue.put((path, text))
+
+        return path
+
+    def flush(self) -> None:
+        """
+        Block until all queued pages have been written.
+        """
+        thread = self._thread
+        if thread is not None:
+            if not thread.is_alive():
+                self._drain_queue()
+                return
+            self._queue.join()
+
+    def close(self) -> None:
+        """
+        Write all queued pages, then stop the writer thread. If another page is captured, the thread is restarted.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            if thread.is_alive():
+                self._queue.put(None)
+        thread.join()
+        atexit.unregister(self.close)
+
+    def _start(self) -> bool:
+        with self._lock:
+            if self._thread is not None:
+                if self._thread.is_alive():
+                    return True
+
+                # The thread died unexpectedly, so the pages it left queued are dropped rather than blocking on them
+                logger.warning("Debug capture writer thread stopped, restarting it")
+                self._drain_queue()
+
+            self._thread = threading.Thread(target=self._run, name="amazon-orders-debug-capture", daemon=True)
+            try:
+                self._thread.start()
+            except RuntimeError:
+                # Ex. the interpreter is shutting down, so no new threads can be started
+                self._thread = None
+                return False
+        # Daemon threads are killed at exit, so anything still queued is written first
+        atexit.register(self.close)
+
+        return True
+
+    def _drain_queue(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._queue.task_done()
+
+    def _run(self) -> None:
+        if not self._captures and (self.max_files or self.max_bytes):
+            try:
+                self._load_captures()
+            except OSError:
+                logger.warning(f"Existing debug captures in {self.output_dir} could not be found for rotation",
+                               exc_info=True)
+
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception:
+                logger.warning("Debug capture could not be written", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    def _write(self,
+               path: str,
+               text: str) -> None:
+        data = text.encode("utf-8")
+        if self.compression == "gzip":
+            data = gzip.compress(data, compresslevel=6)
+        elif self.compression == "zstd":
+            data = zstandard.ZstdCompressor().compress(data)
+
+        with open(path, "wb") as f:
+            f.write(data)
+        logger.debug(f"Response written to file: {path}")
+
+        if self.max_files or self.max_bytes:
+            self._captures.append((path, len(data)))
+            self._captures_bytes += len(data)
+            self._rotate()
+
+    def _load_captures(self) -> None:
+        # Captures from earlier runs are found once, when the writer starts, not on every capture
+        with debug_output_file_lock:
+            captures = []
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith((".html", ".html.gz", ".html.zst")):
+                        stat = entry.stat()
+                        captures.append((stat.st_mtime, entry.path, stat.st_size))
+
+        for _, path, size in sorted(captures):
+            self._captures.append((path, size))
+            self._captures_bytes += size
+
+    def _rotate(self) -> None:
+        while len(self._captures) > 1 and \
+                ((self.max_files and len(self._captures) > self.max_files) or
+                 (self.max_bytes and self._captures_bytes > self.max_bytes)):
+            path, size = self._captures.popleft()
+            self._captures_bytes -= size
+            with debug_output_file_lock:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,163 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from amazonorders.conf import AmazonOrdersConfig
+from amazonorders.entity.parsable import Parsable
+
+logger = logging.getLogger(__name__)
+
+# The persistent ID the config is pickled as, so it isn't stored with every entity
+_CONFIG_ID = "config"
+
+
+class Checkpoint:
+    """
+    A record of the progress of a long-running query (ex. paging through many years of Order history), persisted to
+    ``checkpoint_dir`` (which defaults to a ``checkpoints`` directory alongside ``cookie_jar_path``) as each part of
+    it completes, so the query can be resumed from where it stopped if it is interrupted, without re-fetching or
+    re-parsing anything that completed.
+
+    Each query (identified by ``kind`` and ``query``) has its own file, to which a record of the progress made and
+    the entities completed is appended with :func:`append`. Entities are stored pickled, without their parsed HTML
+    (as if :func:`~amazonorders.entity.parsable.Parsable.detach` had been called) or the config, which is
+    re-attached when they are loaded. Since they are pickled, checkpoint files should never be loaded from
+    untrusted sources.
+    """
+
+    #: The version of the file format, checkpoints written with any other version are discarded.
+    VERSION = 1
+
+    def __init__(self,
+                 config: AmazonOrdersConfig,
+                 kind: str,
+                 query: Dict[str, Any]) -> None:
+        #: The config to use.
+        self.config: AmazonOrdersConfig = config
+        #: The kind of query being checkpointed (ex. ``order-history``).
+        self.kind: str = kind
+        #: The parameters that identify the query, which must be JSON serializable.
+        self.query: Dict[str, Any] = query
+
+        #: The directory in which checkpoints are stored.
+        self.checkpoint_dir: str = config.checkpoint_dir or os.path.join(
+            os.path.dirname(config.cookie_jar_path), "checkpoints")
+        key = hashlib.sha256(json.dumps(query, sort_keys=True).encode("utf-8")).hexdigest()[:32]
+        #: The path of this query's checkpoint file.
+        self.path: str = os.path.join(self.checkpoint_dir, f"{kind}-{key}.pickle")
+
+        self._file: Optional[BinaryIO] = None
+
+    def load(self) -> List[Tuple[Any, List[Parsable]]]:
+        """
+        Load the records appended to the checkpoint by a previous run of the query. A record that was only partially
+        written (ex. because the run was killed while writing it) is discarded.
+
+        :return: The ``(progress, entities)`` of each record, in the order they were appended, empty if there is no
+            checkpoint.
+        """
+        records: List[Tuple[Any, List[Parsable]]] = []
+        if not os.path.exists(self.path):
+            return records
+
+        with open(self.path, "rb") as f:
+            try:
+                header = _CheckpointUnpickler(f, self.config).load()
+                if header != {"version": self.VERSION, "kind": self.kind, "query": self.query}:
+                    logger.debug(f"Checkpoint {self.path} is for a different query or version, discarding it")
+                    return records
+
+                # Each record is pickled on its own (so it shares no memo with the others), so is unpickled on its own
+                while True:
+                    records.append(_CheckpointUnpickler(f, self.config).load())
+            except EOFError:
+                pass
+            except (pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError, ValueError):
+                logger.debug(f"Checkpoint {self.path} ends with a partial record, discarding it", exc_info=True)
+
+        return records
+
+    def append(self,
+               progress: Any,
+               entities: List[Parsable]) -> None:
+        """
+        Append a record to the checkpoint. The first time this is called, any existing checkpoint is rewritten with
+        just the records loaded from it.
+
+        :param progress: What's needed to continue the query after ``entities`` (ex. the next ``index``).
+        :param entities: The entities completed since the last record.
+        """
+        if self._file is None:
+            self._open()
+
+        _CheckpointPickler(self._file, self.config).dump((progress, entities))
+        # Flushed, not synced, so a killed process loses nothing, while a single query needn't wait on the disk
+        self._file.flush()  # type: ignore[union-attr]
+
+    def clear(self) -> None:
+        """
+        Delete the checkpoint, once the query completes.
+        """
+        self.close()
+
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def close(self) -> None:
+        """
+        Close the checkpoint file, leaving it in place so the query can be resumed.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self) -> None:
+        if not os.path.exists(self.checkpoint_dir):
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+
+        # Any partial record at the end of the existing checkpoint is dropped by rewriting it with the valid records
+        records = self.load()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            _CheckpointPickler(f, self.config).dump({"version": self.VERSION, "kind": self.kind, "query": self.query})
+            for record in records:
+                _CheckpointPickler(f, self.config).dump(record)
+        os.replace(tmp_path, self.path)
+
+        self._file = open(self.path, "ab")
+
+
+class _CheckpointPickler(pickle.Pickler):
+    def __init__(self,
+                 file: BinaryIO,
+                 config: AmazonOrdersConfig) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.config = config
+
+    def persistent_id(self,
+                      obj: Any) -> Optional[str]:
+        return _CONFIG_ID if obj is self.config else None
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+    def __init__(self,
+                 file: BinaryIO,
+                 config: AmazonOrdersConfig) -> None:
+        super().__init__(file)
+
+        self.config = config
+
+    def persistent_load(self,
+                        pid: Any) -> Any:
+        if pid == _CONFIG_ID:
+            return self.config
+        raise pickle.UnpicklingError(f"Unknown persistent ID {pid}")
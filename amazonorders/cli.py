@@ -8,7 +8,7 @@ import logging
 import os
 import platform
 import time
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import click
 from click.core import Context
@@ -115,6 +115,9 @@ def amazon_orders_cli(ctx: Context,
 @click.option("--year", type=int, default=None,
               help="The year for which to get Order history. Defaults to the current year if no "
                    "time filter is specified.")
+@click.option("--years", default=None,
+              help="A range of years for which to get Order history, ex. 2010-2025. Years are fetched "
+                   "concurrently.")
 @click.option("--last-30-days", "last_30_days", is_flag=True, default=False,
               help="Get Order history for the last 30 days.")
 @click.option("--last-3-months", "last_3_months", is_flag=True, default=False,
@@ -126,6 +129,9 @@ def amazon_orders_cli(ctx: Context,
 @click.option("--full-details", is_flag=True, default=False,
               help="Get the full details for each Order in the history. "
                    "This will execute an additional request per Order.")
+@click.option("--resume", is_flag=True, default=False,
+              help="Checkpoint the history as it's fetched, and continue from the checkpoint if a previous run "
+                   "with the same options was interrupted.")
 def history(ctx: Context,
             **kwargs: Any) -> None:
     """
@@ -133,9 +139,27 @@ def history(ctx: Context,
     """
     amazon_session = ctx.obj["amazon_session"]
 
+    years = kwargs["years"]
+    if years:
+        if kwargs["year"] or kwargs["last_30_days"] or kwargs["last_3_months"] or kwargs["start_index"] or \
+                kwargs["single_page"] or kwargs["resume"]:
+            ctx.fail("--years may not be used with --year, --last-30-days, --last-3-months, --start-index, "
+                     "--single-page, or --resume.")
+
+        try:
+            start, _, end = years.partition("-")
+            start_year = int(start)
+            end_year = int(end) if end else start_year
+        except ValueError:
+            ctx.fail(f"--years must be a range of years, ex. 2010-2025, not '{years}'.")
+
     try:
         _authenticate(amazon_session)
 
+        if years:
+            _history_range(ctx, amazon_session, start_year, end_year, kwargs["full_details"])
+            return
+
         year = kwargs["year"]
         last_30_days = kwargs["last_30_days"]
         last_3_months = kwargs["last_3_months"]
@@ -171,23 +195,30 @@ Order History for {filter_description}{optional_start_index}{optional_full_detai
         click.echo("Info: Fetching Order history, this might take a minute ...")
 
         config = ctx.obj["conf"]
-        amazon_orders = AmazonOrders(amazon_session,
-                                     config=config)
-
-        start_time = time.time()
-        total = 0
-        for o in amazon_orders.get_order_history(year=year,
-                                                 start_index=start_index,
-                                                 full_details=full_details,
-                                                 keep_paging=not single_page,
-                                                 time_filter=time_filter):
-            click.echo(f"{_order_output(o, config)}\n")
-            total += 1
-        end_time = time.time()
+        with AmazonOrders(amazon_session,
+                          config=config) as amazon_orders:
+            start_time = time.time()
+            total = 0
+            details_errors = 0
+            for o in amazon_orders.iter_order_history(year=year,
+                                                      start_index=start_index,
+                                                      full_details=full_details,
+                                                      keep_paging=not single_page,
+                                                      time_filter=time_filter,
+                                                      resume=kwargs["resume"]):
+                if o.details_error:
+                    details_errors += 1
+                    click.echo(f"Error: Order {o.order_number}'s details could not be fetched: {o.details_error}")
+                click.echo(f"{_order_output(o, config)}\n")
+                total += 1
+            end_time = time.time()
 
         click.echo(
             "... {total} Orders parsed in {time} seconds.\n".format(total=total,
                                                                     time=int(end_time - start_time)))
+        if details_errors:
+            click.echo(f"Warning: {details_errors} of {total} Orders were partially populated, since their details "
+                       f"could not be fetched.\n")
     except AmazonOrdersAuthRedirectError:
         _prompt_to_reauth_flow()
     except AmazonOrdersError as e:
@@ -197,24 +228,47 @@ Order History for {filter_description}{optional_start_index}{optional_full_detai
 
 @amazon_orders_cli.command()
 @click.pass_context
-@click.argument("order_id")
+@click.argument("order_ids", nargs=-1)
 def order(ctx: Context,
-          order_id: str) -> None:
+          order_ids: Tuple[str, ...]) -> None:
     """
-    Get the full details for a given Amazon Order ID.
+    Get the full details for the given Amazon Order IDs. Pass ``-`` (or no IDs, when stdin is piped) to read IDs from
+    stdin, one per line.
     """
     amazon_session = ctx.obj["amazon_session"]
 
+    stdin = click.get_text_stream("stdin")
+    # Only read stdin when asked to, or when it's piped, since an interactive terminal would block until EOF
+    if order_ids == ("-",) or (not order_ids and not stdin.isatty()):
+        order_ids = tuple(order_id for line in stdin for order_id in line.split())
+    if not order_ids:
+        ctx.fail("At least one Order ID must be given.")
+
     try:
         _authenticate(amazon_session)
 
         config = ctx.obj["conf"]
-        amazon_orders = AmazonOrders(amazon_session,
-                                     config=config)
-
-        o = amazon_orders.get_order(order_id)
-
-        click.echo(f"{_order_output(o, config)}\n")
+        with AmazonOrders(amazon_session,
+                          config=config) as amazon_orders:
+            if len(order_ids) == 1:
+                orders: Dict[str, Union[Order, AmazonOrdersError]] = {
+                    order_ids[0]: amazon_orders.get_order(order_ids[0])
+                }
+            else:
+                orders = amazon_orders.get_orders(order_ids)
+
+        errors = 0
+        for order_id, o in orders.items():
+            if isinstance(o, AmazonOrdersError):
+                errors += 1
+                click.echo(f"Error: Order {order_id} could not be fetched: {o}\n")
+            else:
+                click.echo(f"{_order_output(o, config)}\n")
+
+        if any(isinstance(o, AmazonOrdersAuthRedirectError) for o in orders.values()):
+            _prompt_to_reauth_flow()
+        elif errors:
+            ctx.fail(f"{errors} of {len(orders)} Orders could not be fetched.")
     except AmazonOrdersAuthRedirectError:
         _prompt_to_reauth_flow()
     except AmazonOrdersError as e:
@@ -226,6 +280,9 @@ def order(ctx: Context,
 @click.pass_context
 @click.option("--days", default=365,
               help="The number of days of Transactions to get.")
+@click.option("--resume", is_flag=True, default=False,
+              help="Checkpoint the Transactions as they're fetched, and continue from the checkpoint if a previous "
+                   "run with the same options was interrupted.")
 def transactions(ctx: Context, **kwargs: Any):
     """
     Get Amazon Transaction history for a given number of days.
@@ -250,7 +307,8 @@ Transaction History for {days} days
 
         start_time = time.time()
         total = 0
-        for t in amazon_transactions.get_transactions(days=days):
+        for t in amazon_transactions.get_transactions(days=days,
+                                                      resume=kwargs["resume"]):
             click.echo(f"{_transaction_output(t, config)}\n")
             total += 1
         end_time = time.time()
@@ -374,6 +432,43 @@ def _prompt_to_reauth_flow() -> None:
                "out, so try running the command again.\n")
 
 
+def _history_range(ctx: Context,
+                   amazon_session: AmazonSession,
+                   start_year: int,
+                   end_year: int,
+                   full_details: bool) -> None:
+    optional_full_details = ", with full details" if full_details else ""
+    click.echo("""-----------------------------------------------------------------------
+Order History for {start_year}-{end_year}, all pages{optional_full_details}
+-----------------------------------------------------------------------\n"""
+               .format(start_year=start_year,
+                       end_year=end_year,
+                       optional_full_details=optional_full_details))
+    click.echo("Info: Fetching Order history, this might take a minute ...")
+
+    def report_progress(year: int,
+                        orders: List[Order]) -> None:
+        click.echo(f"Info: ... {len(orders)} Orders fetched for {year}.")
+
+    config = ctx.obj["conf"]
+    with AmazonOrders(amazon_session,
+                      config=config) as amazon_orders:
+        start_time = time.time()
+        orders = amazon_orders.get_order_history_range(start_year,
+                                                       end_year,
+                                                       full_details=full_details,
+                                                       progress_callback=report_progress)
+        end_time = time.time()
+
+    click.echo()
+    for o in orders:
+        click.echo(f"{_order_output(o, config)}\n")
+
+    click.echo(
+        "... {total} Orders parsed in {time} seconds.\n".format(total=len(orders),
+                                                                time=int(end_time - start_time)))
+
+
 def _order_output(o: Order,
                   config: AmazonOrdersConfig) -> str:
     order_str = """-----------------------------------------------------------------------
@@ -17,6 +17,7 @@ DEFAULT_CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".config", "amazonord
 config_file_lock = threading.Lock()
 cookies_file_lock = threading.Lock()
 debug_output_file_lock = threading.Lock()
+sync_state_file_lock = threading.Lock()
 
 
 class AmazonOrdersConfig:
@@ -50,16 +51,80 @@ class AmazonOrdersConfig:
             "auth_reattempt_wait": 5,
             # Where output files (for instance, HTML pages, when ``debug`` mode is enabled) will be written
             "output_dir": os.path.join(os.getcwd(), "output"),
+            # The compression to write pages captured in ``debug`` mode with, ``gzip``, ``zstd`` (``pip install
+            # amazon-orders[zstd]``), or ``None`` to write them uncompressed
+            "debug_output_compression": None,
+            # The maximum number of pages captured in ``debug`` mode to keep in ``output_dir`` (the oldest are
+            # deleted), ``0`` for no limit
+            "debug_output_max_files": 0,
+            # The maximum total size in bytes of the pages captured in ``debug`` mode to keep in ``output_dir`` (the
+            # oldest are deleted), ``0`` for no limit
+            "debug_output_max_bytes": 0,
             "cookie_jar_path": os.path.join(DEFAULT_CONFIG_DIR, "cookies.json"),
+            # The number of seconds to wait, coalescing any other changes, before persisting changed cookies to
+            # ``cookie_jar_path`` on a background thread. ``0`` to persist them before each request returns
+            "cookie_persist_delay": 1,
+            # Where the newest Order seen by ``AmazonOrders.sync_order_history()`` is stored, per account and domain,
+            # defaults to ``sync-state.json`` alongside ``cookie_jar_path``
+            "sync_state_path": None,
             "constants_class": "amazonorders.constants.Constants",
             "selectors_class": "amazonorders.selectors.Selectors",
             "order_class": "amazonorders.entity.order.Order",
             "shipment_class": "amazonorders.entity.shipment.Shipment",
             "item_class": "amazonorders.entity.item.Item",
+            # The BeautifulSoup parser to use. ``auto`` uses ``lxml`` (which builds the tree faster) when it is
+            # installed, otherwise falling back to ``html.parser``
             "bs4_parser": "html.parser",
+            # Set ``True`` to remove the ``<script>`` and ``<style>`` blocks (which contain no Order data with the
+            # default selectors) from Order history and details pages before they're parsed, which parses them faster
+            "strip_scripts": False,
             "auth_forms_classes": [],
             "thread_pool_size": (os.cpu_count() or 1) * 4,
+            # The number of Order history pages to request ahead of the page currently being parsed, ``0`` to page
+            # serially
+            "history_prefetch_depth": 1,
+            # Set ``True`` to read the Order count from the first page of history and request the remaining pages
+            # concurrently by ``startIndex``, rather than following each page's next link
+            "history_planned_paging": False,
+            # The maximum number of times to retry getting an Order's details when the request fails transiently (a
+            # ``429`` or ``5xx``, a timeout, or a connection error) when ``full_details`` are requested in bulk
+            "details_max_retries": 3,
+            # The number of seconds to wait before the first retry of an Order's details (doubled for each retry)
+            "details_retry_wait": 1,
             "connection_pool_size": thread_pool_size * 2,
+            # The number of seconds to wait to connect to Amazon before a request times out, ``None`` to wait forever
+            "request_connect_timeout": 10,
+            # The number of seconds to wait between bytes received from Amazon before a request times out, ``None``
+            # to wait forever
+            "request_read_timeout": 30,
+            # Set ``True`` to cache Order details pages on disk, so ``full_details`` queries only request details
+            # for Orders that are new or may still change
+            "order_details_cache": False,
+            # Where cached Order details are stored, defaults to an ``order-details`` directory alongside
+            # ``cookie_jar_path``
+            "order_details_cache_dir": None,
+            # The number of seconds cached details are used for Orders that are not yet settled (delivered and past
+            # their return window, or cancelled). Settled Orders never expire from the cache.
+            "order_details_cache_ttl": 60 * 60 * 24,
+            # Where the checkpoints of queries called with ``resume=True`` are stored, defaults to a ``checkpoints``
+            # directory alongside ``cookie_jar_path``
+            "checkpoint_dir": None,
+            # Set ``True`` to limit the rate of requests to Amazon, adapting to how Amazon responds: the rate is
+            # reduced when requests are throttled (``429``, ``5xx``, or a bot check page) and ramped back up on
+            # success. Throttled ``429`` and ``5xx`` responses are also retried.
+            "rate_limit": False,
+            # The maximum (and initial) number of requests per second when ``rate_limit`` is enabled
+            "rate_limit_max_requests_per_second": 10,
+            # The minimum number of requests per second when ``rate_limit`` is enabled
+            "rate_limit_min_requests_per_second": 0.5,
+            # The maximum number of requests in flight at a time when ``rate_limit`` is enabled
+            "rate_limit_max_in_flight": thread_pool_size,
+            # The maximum number of times to retry a throttled request when ``rate_limit`` is enabled
+            "rate_limit_max_retries": 3,
+            # The number of seconds to wait before the first retry of a throttled request (doubled for each retry)
+            # if Amazon doesn't send ``Retry-After``. A longer ``Retry-After`` is capped at this, doubled
+            # ``rate_limit_max_retries`` times.
+            "rate_limit_retry_wait": 1,
             # The maximum number of failed attempts to allow before failing CLI authentication
             "max_auth_retries": 1,
             # Set ``True`` to log a warning message instead of raising an exception when a required field is missing.
@@ -104,15 +169,28 @@ class AmazonOrdersConfig:
         self.shipment_cls = util.load_class(shipment_class_split[:-1], shipment_class_split[-1])
         self.item_cls = util.load_class(item_class_split[:-1], item_class_split[-1])
 
+        # Validate all selectors up front, rather than on first selection
+        util.validate_selectors(self.selectors)
+
     def _validate_bs4_parser(self) -> None:
+        auto = self._data["bs4_parser"] == "auto"
+        bs4_parser = "lxml" if auto else str(self._data["bs4_parser"])
+
         try:
-            BeautifulSoup("", str(self._data["bs4_parser"]))
+            BeautifulSoup("", bs4_parser)
+            self._data["bs4_parser"] = bs4_parser
         except FeatureNotFound:
-            logger.debug(
-                f"Configured bs4_parser '{self._data['bs4_parser']}' is unavailable; "
-                f"using the default 'html.parser'. To use it, install the parser "
-                f"(e.g. `pip install amazon-orders[lxml]`)."
-            )
+            if auto:
+                logger.debug(
+                    "bs4_parser 'auto' is using 'html.parser', since 'lxml' isn't installed. To parse faster, "
+                    "install it (e.g. `pip install amazon-orders[lxml]`)."
+                )
+            else:
+                logger.debug(
+                    f"Configured bs4_parser '{self._data['bs4_parser']}' is unavailable; "
+                    f"using the default 'html.parser'. To use it, install the parser "
+                    f"(e.g. `pip install amazon-orders[lxml]`)."
+                )
             self._data["bs4_parser"] = "html.parser"
 
     def _instantiate_constants(self) -> Any:
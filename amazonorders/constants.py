@@ -30,6 +30,14 @@ _REGION_CURRENCIES = {
     "sg": "S$",
 }
 
+#: Amazon sites, keyed by the TLD suffix that follows ``amazon.``, whose prices use ``,`` as the decimal separator
+#: (and ``.`` or a space to group thousands), ex. ``1.234,56 €``. Sets ``DECIMAL_COMMA``.
+_REGION_DECIMAL_COMMAS = frozenset(["com.be", "com.br", "com.tr", "de", "es", "fr", "it", "nl", "pl", "se"])
+
+#: Amazon sites, keyed by the TLD suffix that follows ``amazon.``, that write dates day first, ex. ``5 October 2023``.
+#: Sets ``DATE_DAY_FIRST``.
+_REGION_DATE_DAY_FIRST = _REGION_DECIMAL_COMMAS | {"co.uk", "com.au", "in", "sg"}
+
 
 def _normalize_base_url(value: str) -> str:
     value = value.strip().rstrip("/")
@@ -142,6 +150,20 @@ class Constants:
 
     COOKIES_SET_WHEN_AUTHENTICATED = ["x-main"]
     JS_ROBOT_TEXT_REGEX = r"[.\s\S]*verify that you're not a robot[.\s\S]*Enable JavaScript[.\s\S]*"
+    #: Text found on the pages Amazon serves in place of the requested page when it suspects automated access, which
+    #: the :class:`~amazonorders.ratelimit.RateLimiter` treats as a signal to slow down.
+    BOT_CHECK_TEXT_REGEX = r"api-services-support@amazon\.com|/errors/validateCaptcha"
+    #: Text found in a page only if it may contain ``SIGN_IN_FORM_SELECTOR``, so responses without it needn't be
+    #: parsed to check for a redirect to login. Override this along with ``SIGN_IN_FORM_SELECTOR``.
+    SIGN_IN_FORM_TEXT_REGEX = r"name\s*=\s*[\"']?signIn\b"
+
+    ##########################################################################
+    # Parsing
+    ##########################################################################
+
+    #: When ``strip_scripts`` is enabled, ``<script>`` and ``<style>`` blocks are removed from Order pages before
+    #: they're parsed, except those whose opening tag matches this (for ``FIELD_ORDER_ADDRESS_FALLBACK_2_SELECTOR``).
+    KEEP_SCRIPT_TAG_REGEX = r"\bid=[\"']?shipToData"
 
     ##########################################################################
     # Currency
@@ -149,6 +171,14 @@ class Constants:
 
     CURRENCY_SYMBOL = os.environ.get("AMAZON_CURRENCY_SYMBOL", "$")
 
+    #: ``True`` if prices use ``,`` as the decimal separator (and ``.`` groups thousands). Set automatically for the
+    #: domains that do.
+    DECIMAL_COMMA = False
+
+    #: ``True`` if dates are written day first (ex. ``5 October 2023``), so that format is tried first and ambiguous
+    #: numeric dates are parsed day first. Set automatically for the domains that do.
+    DATE_DAY_FIRST = False
+
     def __init__(self,
                  config: Optional["AmazonOrdersConfig"] = None) -> None:
         domain = None
@@ -200,6 +230,11 @@ class Constants:
         if not os.environ.get("AMAZON_CURRENCY_SYMBOL") and tld in _REGION_CURRENCIES:
             self.CURRENCY_SYMBOL = _REGION_CURRENCIES[tld]
 
+        if tld in _REGION_DECIMAL_COMMAS:
+            self.DECIMAL_COMMA = True
+        if tld in _REGION_DATE_DAY_FIRST:
+            self.DATE_DAY_FIRST = True
+
     def format_currency(self,
                         amount: float) -> str:
         formatted_amt = "{currency_symbol}{amount:,.2f}".format(currency_symbol=self.CURRENCY_SYMBOL,
@@ -11,6 +11,7 @@ from urllib.parse import urlparse
 from bs4 import Tag
 from requests import Response
 
+from amazonorders import util
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.exception import AmazonOrdersError
 from amazonorders.forms import AuthForm
@@ -85,7 +86,7 @@ class AwsWafForm(AuthForm):
         except json.JSONDecodeError:
             return False
 
-        challenge_tag = parsed.select_one('script[src*="awswaf.com"]')
+        challenge_tag = util.select_one(parsed, 'script[src*="awswaf.com"]')
         if not challenge_tag:
             return False
         src = challenge_tag.get("src")
@@ -0,0 +1,129 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import json
+import logging
+import threading
+from typing import Dict, Optional
+
+from amazonorders import util
+from amazonorders.conf import cookies_file_lock
+
+logger = logging.getLogger(__name__)
+
+
+class CookieJarPersister:
+    """
+    Persists an :class:`~amazonorders.session.AmazonSession`'s cookies to ``cookie_jar_path``, so many threads and
+    processes can safely share one authenticated session.
+
+    Writes are made atomically (to a temporary file that is then moved in to place) while holding a cross-process
+    lock on a ``.lock`` file alongside ``cookie_jar_path``, and only the cookies that changed since they were last
+    loaded or persisted are merged in to the file, so processes don't clobber each other's cookies. Nothing is
+    written if the cookies haven't changed, and if ``delay`` is given, a burst of calls to :func:`persist` is
+    coalesced in to a single write made on a background thread ``delay`` seconds after the first, off the request's
+    hot path.
+    """
+
+    def __init__(self,
+                 path: str,
+                 delay: float = 0) -> None:
+        #: The path of the cookie jar file.
+        self.path: str = path
+        #: The number of seconds to wait, coalescing any other changes, before writing changed cookies. ``0`` to write
+        #: them immediately.
+        self.delay: float = delay
+
+        # The cookies as they were last loaded from or written to the file
+        self._persisted: Dict[str, str] = {}
+        # The cookies to write on the next flush(), if they've changed
+        self._pending: Optional[Dict[str, str]] = None
+        self._replace: bool = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def load(self) -> Dict[str, str]:
+        """
+        Load the persisted cookies.
+
+        :return: The persisted cookies, empty if none have been persisted.
+        """
+        with util.file_lock(self.path, cookies_file_lock):
+            cookies = self._read()
+
+        with self._lock:
+            self._persisted = dict(cookies)
+
+        return cookies
+
+    def persist(self,
+                cookies: Dict[str, str],
+                replace: bool = False) -> None:
+        """
+        Persist the given cookies, if they've changed. If :attr:`delay` is set, they're written on a background
+        thread once it elapses, otherwise they're written before this returns.
+
+        :param cookies: The session's cookies.
+        :param replace: ``True`` if the file should be replaced with just these cookies, rather than having only the
+            changed cookies merged in to it.
+        """
+        with self._lock:
+            if not replace and not self._replace and cookies == self._persisted:
+                self._pending = None
+                return
+
+            self._pending = dict(cookies)
+            self._replace = self._replace or replace
+
+            if self.delay > 0:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.delay, self._flush_in_background)
+                    self._timer.start()
+                return
+
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Write any pending cookies now, rather than waiting for :attr:`delay` to elapse.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            cookies, replace = self._pending, self._replace
+            self._pending, self._replace = None, False
+            if cookies is None:
+                return
+
+            with util.file_lock(self.path, cookies_file_lock):
+                if replace:
+                    merged = cookies
+                else:
+                    merged = self._read()
+                    for name, value in cookies.items():
+                        if self._persisted.get(name) != value:
+                            merged[name] = value
+                    for name in self._persisted.keys() - cookies.keys():
+                        merged.pop(name, None)
+
+                util.atomic_write(self.path, json.dumps(merged).encode("utf-8"))
+
+            self._persisted = cookies
+
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush()
+        except OSError:
+            logger.warning(f"Cookies could not be persisted to {self.path}", exc_info=True)
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.debug(f"Cookies persisted to {self.path} could not be read, ignoring", exc_info=True)
+            return {}
@@ -3,13 +3,14 @@ __license__ = "MIT"
 
 import logging
 from datetime import date
-from typing import Optional, TypeVar
+from typing import Iterable, Optional, TypeVar
 
 from bs4 import Tag
 
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.parsable import Parsable
 from amazonorders.entity.seller import Seller
+from amazonorders.entity.snapshot import ItemSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -24,42 +25,52 @@ class Item(Parsable):
     down querying).
     """
 
+    snapshot_class = ItemSnapshot
+
     def __init__(self,
                  parsed: Tag,
-                 config: AmazonOrdersConfig) -> None:
-        super().__init__(parsed, config)
+                 config: AmazonOrdersConfig,
+                 fields: Optional[Iterable[str]] = None) -> None:
+        super().__init__(parsed, config, fields)
 
         #: The Item title.
-        self.title: str = self.safe_simple_parse(selector=self.config.selectors.FIELD_ITEM_TITLE_SELECTOR,
-                                                 required=True)
+        self.title: str = self._field(
+            "title", lambda: self.safe_simple_parse(selector=self.config.selectors.FIELD_ITEM_TITLE_SELECTOR,
+                                                    required=True))
         #: The Item link.
-        self.link: str = self.safe_simple_parse(selector=self.config.selectors.FIELD_ITEM_LINK_SELECTOR,
-                                                attr_name="href", required=True)
+        self.link: str = self._field(
+            "link", lambda: self.safe_simple_parse(selector=self.config.selectors.FIELD_ITEM_LINK_SELECTOR,
+                                                   attr_name="href", required=True))
         #: The Item price.
-        self.price: Optional[float] = self.to_currency(
-            self.safe_simple_parse(selector=self.config.selectors.FIELD_ITEM_PRICE_SELECTOR)
-        )
+        self.price: Optional[float] = self._field(
+            "price", lambda: self.to_currency(
+                self.safe_simple_parse(selector=self.config.selectors.FIELD_ITEM_PRICE_SELECTOR)))
         #: The Item Seller.
-        self.seller: Optional[Seller] = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ITEM_SELLER_SELECTOR,
-            text_contains="Sold by:",
-            wrap_tag=Seller)
+        self.seller: Optional[Seller] = self._field(
+            "seller", lambda: self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_ITEM_SELLER_SELECTOR,
+                text_contains="Sold by:",
+                wrap_tag=Seller))
         #: The Item condition.
-        self.condition: Optional[str] = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ITEM_TAG_ITERATOR_SELECTOR,
-            prefix_split="Condition:")
+        self.condition: Optional[str] = self._field(
+            "condition", lambda: self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_ITEM_TAG_ITERATOR_SELECTOR,
+                prefix_split="Condition:"))
         #: The Item return eligible date.
-        self.return_eligible_date: Optional[date] = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ITEM_RETURN_SELECTOR,
-            text_contains="Return",
-            parse_date=True)
+        self.return_eligible_date: Optional[date] = self._field(
+            "return_eligible_date", lambda: self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_ITEM_RETURN_SELECTOR,
+                text_contains="Return",
+                parse_date=True))
         #: The Item image URL.
-        self.image_link: Optional[str] = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ITEM_IMG_LINK_SELECTOR,
-            attr_name="src")
+        self.image_link: Optional[str] = self._field(
+            "image_link", lambda: self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_ITEM_IMG_LINK_SELECTOR,
+                attr_name="src"))
         #: The Item quantity.
-        self.quantity: Optional[int] = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ITEM_QUANTITY_SELECTOR)
+        self.quantity: Optional[int] = self._field(
+            "quantity", lambda: self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_ITEM_QUANTITY_SELECTOR))
 
     def __repr__(self) -> str:
         return f"<Item: \"{self.title}\">"
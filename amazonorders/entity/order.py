@@ -4,9 +4,9 @@ __license__ = "MIT"
 import json
 import logging
 from datetime import date
-from typing import Any, List, Optional, TypeVar, Union
+from typing import Any, Dict, Iterable, List, Optional, TypeVar, Union
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from amazonorders import util
 from amazonorders.conf import AmazonOrdersConfig
@@ -14,6 +14,7 @@ from amazonorders.entity.item import Item
 from amazonorders.entity.parsable import Parsable
 from amazonorders.entity.recipient import Recipient
 from amazonorders.entity.shipment import Shipment
+from amazonorders.entity.snapshot import OrderSnapshot
 from amazonorders.exception import AmazonOrdersError
 
 logger = logging.getLogger(__name__)
@@ -28,14 +29,27 @@ class Order(Parsable):
     by default it is ``False`` (enabling slows down querying).
     """
 
+    snapshot_class = OrderSnapshot
+
+    #: The fields only populated when ``full_details`` is ``True`` (or, for ``items``, more fully populated). When
+    #: ``fields`` are given, details requests are only made if one of these is requested.
+    DETAILS_FIELDS = frozenset(["items", "payment_method", "payment_method_last_4", "subtotal", "shipping_total",
+                                "free_shipping", "promotion_applied", "coupon_savings", "reward_points",
+                                "subscription_discount", "total_before_tax", "estimated_tax", "refund_total",
+                                "multibuy_discount", "amazon_discount", "gift_card", "gift_wrap"])
+
     def __init__(self,
                  parsed: Tag,
                  config: AmazonOrdersConfig,
                  full_details: bool = False,
                  clone: Optional[OrderEntity] = None,
                  index: Optional[int] = None,
-                 order_number: Optional[str] = None) -> None:
-        super().__init__(parsed, config)
+                 order_number: Optional[str] = None,
+                 fields: Optional[Iterable[str]] = None) -> None:
+        super().__init__(parsed, config, fields)
+
+        # Built on first use by _parse_currency(), so the subtotals are only ever scanned once
+        self._subtotals: Optional[Dict[str, List[Optional[float]]]] = None
 
         #: If the Orders full details were populated from its details page.
         self.full_details: bool = full_details
@@ -47,80 +61,91 @@ class Order(Parsable):
         #: the ``clone`` has its ``index`` set.
         self.index: Optional[int] = index if index is not None else (clone.index if clone else None)
 
+        #: The error raised getting the Order's details, if they were requested (ex. ``full_details`` when getting
+        #: Order history) but could not be fetched, in which case ``full_details`` is ``False`` and only the fields
+        #: from the history page are populated.
+        self.details_error: Optional[AmazonOrdersError] = None
+
         #: ``True`` if the Order was cancelled. When ``True``, fields like ``grand_total`` and the totals on the
         #: details page may be ``None`` because Amazon stops rendering them.
-        self.cancelled: bool = clone.cancelled if clone else bool(
-            self.parsed and util.select(self.parsed, self.config.selectors.ORDER_SKIP_TOTALS))
+        self.cancelled: bool = self._field(
+            "cancelled", lambda: clone.cancelled if clone else bool(
+                self.parsed and util.select(self.parsed, self.config.selectors.ORDER_SKIP_TOTALS)))
 
         #: The Order Shipments.
-        self.shipments: List[Shipment] = clone.shipments if clone else self._parse_shipments()
+        self.shipments: List[Shipment] = self._field(
+            "shipments", lambda: clone.shipments if clone else self._parse_shipments())
         #: The Order Items.
-        self.items: List[Item] = clone.items if clone and not full_details else self._parse_items()
+        self.items: List[Item] = self._field(
+            "items", lambda: clone.items if clone and not full_details else self._parse_items())
         #: The Order number. May be ``None`` only when the Order is :attr:`cancelled` and Amazon stripped the order
         #: number from the details page (the ``order_number`` parameter is used as a fallback in that case).
-        self.order_number: Optional[str] = clone.order_number if clone else self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ORDER_NUMBER_SELECTOR,
-            required=not self.cancelled,
-            prefix_split="#",
-            prefix_split_fuzzy=True) or order_number
+        self.order_number: Optional[str] = self._field(
+            "order_number", lambda: clone.order_number if clone else self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_ORDER_NUMBER_SELECTOR,
+                required=not self.cancelled,
+                prefix_split="#",
+                prefix_split_fuzzy=True) or order_number)
         #: The Order details link.
-        self.order_details_link: Optional[str] = clone.order_details_link if clone else self.safe_parse(
-            self._parse_order_details_link)
+        self.order_details_link: Optional[str] = self._field(
+            "order_details_link", lambda: clone.order_details_link if clone else self.safe_parse(
+                self._parse_order_details_link))
         #: The Order grand total.
-        self.grand_total: Optional[float] = clone.grand_total if clone else self.safe_parse(self._parse_grand_total)
+        self.grand_total: Optional[float] = self._field(
+            "grand_total", lambda: clone.grand_total if clone else self.safe_parse(self._parse_grand_total))
         #: The Order placed date.
-        self.order_placed_date: date = clone.order_placed_date if clone else self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ORDER_PLACED_DATE_SELECTOR,
-            suffix_split="Order #",
-            suffix_split_fuzzy=True,
-            parse_date=True)
+        self.order_placed_date: date = self._field(
+            "order_placed_date", lambda: clone.order_placed_date if clone else self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_ORDER_PLACED_DATE_SELECTOR,
+                suffix_split="Order #",
+                suffix_split_fuzzy=True,
+                parse_date=True))
         #: The Order Recipients.
-        self.recipient: Recipient = clone.recipient if clone else self.safe_parse(self._parse_recipient)
+        self.recipient: Recipient = self._field(
+            "recipient", lambda: clone.recipient if clone else self.safe_parse(self._parse_recipient))
 
         # Fields below this point are only populated if `full_details` is True
 
         #: The Order payment method. Only populated when ``full_details`` is ``True``.
-        self.payment_method: Optional[str] = self._if_full_details(
-            self.safe_simple_parse(selector=self.config.selectors.FIELD_ORDER_PAYMENT_METHOD_SELECTOR,
-                                   attr_name="alt"))
+        self.payment_method: Optional[str] = self._field(
+            "payment_method", lambda: self._if_full_details(
+                self.safe_simple_parse(selector=self.config.selectors.FIELD_ORDER_PAYMENT_METHOD_SELECTOR,
+                                       attr_name="alt")))
         #: The Order payment method's last 4 digits. Only populated when ``full_details`` is ``True``.
-        self.payment_method_last_4: Optional[int] = self._if_full_details(
-            self.safe_simple_parse(selector=self.config.selectors.FIELD_ORDER_PAYMENT_METHOD_LAST_4_SELECTOR,
-                                   prefix_split="ending in"))
+        self.payment_method_last_4: Optional[int] = self._field(
+            "payment_method_last_4", lambda: self._if_full_details(
+                self.safe_simple_parse(selector=self.config.selectors.FIELD_ORDER_PAYMENT_METHOD_LAST_4_SELECTOR,
+                                       prefix_split="ending in")))
         #: The Order subtotal. Only populated when ``full_details`` is ``True``.
-        self.subtotal: Optional[float] = self._if_full_details(self._parse_currency("subtotal"))
+        self.subtotal: Optional[float] = self._currency_field("subtotal", "subtotal")
         #: The Order shipping total. Only populated when ``full_details`` is ``True``.
-        self.shipping_total: Optional[float] = self._if_full_details(self._parse_currency("shipping"))
+        self.shipping_total: Optional[float] = self._currency_field("shipping_total", "shipping")
         #: The Order free shipping. Only populated when ``full_details`` is ``True``.
-        self.free_shipping: Optional[float] = self._if_full_details(self._parse_currency("free shipping"))
+        self.free_shipping: Optional[float] = self._currency_field("free_shipping", "free shipping")
         #: The Order promotion applied. Only populated when ``full_details`` is ``True``.
-        self.promotion_applied: Optional[float] = self._if_full_details(
-            self._parse_currency("promotion", combine_multiple=True))
+        self.promotion_applied: Optional[float] = self._currency_field("promotion_applied", "promotion",
+                                                                       combine_multiple=True)
         #: The Order coupon savings. Only populated when ``full_details`` is ``True``.
-        self.coupon_savings: Optional[float] = self._if_full_details(
-            self._parse_currency("coupon", combine_multiple=True))
+        self.coupon_savings: Optional[float] = self._currency_field("coupon_savings", "coupon", combine_multiple=True)
         #: The Order reward points. Only populated when ``full_details`` is ``True``.
-        self.reward_points: Optional[float] = self._if_full_details(
-            self._parse_currency("reward", combine_multiple=True))
-        subscribe_discount = self._if_full_details(self._parse_currency("subscribe"))
-        subscription_discount = self._if_full_details(self._parse_currency("subscription"))
+        self.reward_points: Optional[float] = self._currency_field("reward_points", "reward", combine_multiple=True)
         #: The Order Subscribe & Save discount. Only populated when ``full_details`` is ``True``.
-        self.subscription_discount: Optional[float] = subscribe_discount if subscribe_discount is not None \
-            else subscription_discount
+        self.subscription_discount: Optional[float] = self._field(
+            "subscription_discount", lambda: self._if_full_details(self._parse_subscription_discount()))
         #: The Order total before tax. Only populated when ``full_details`` is ``True``.
-        self.total_before_tax: Optional[float] = self._if_full_details(self._parse_currency("before tax"))
+        self.total_before_tax: Optional[float] = self._currency_field("total_before_tax", "before tax")
         #: The Order estimated tax. Only populated when ``full_details`` is ``True``.
-        self.estimated_tax: Optional[float] = self._if_full_details(self._parse_currency("estimated tax"))
+        self.estimated_tax: Optional[float] = self._currency_field("estimated_tax", "estimated tax")
         #: The Order refund total. Only populated when ``full_details`` is ``True``.
-        self.refund_total: Optional[float] = self._if_full_details(self._parse_currency("refund total"))
+        self.refund_total: Optional[float] = self._currency_field("refund_total", "refund total")
         #: The Multibuy discount. Only populated when ``full_details`` is ``True``.
-        self.multibuy_discount: Optional[float] = self._if_full_details(self._parse_currency("multibuy discount"))
+        self.multibuy_discount: Optional[float] = self._currency_field("multibuy_discount", "multibuy discount")
         #: The Amazon discount. Only populated when ``full_details`` is ``True``.
-        self.amazon_discount: Optional[float] = self._if_full_details(self._parse_currency("amazon discount"))
+        self.amazon_discount: Optional[float] = self._currency_field("amazon_discount", "amazon discount")
         #: The Gift Card total. Only populated when ``full_details`` is ``True``.
-        self.gift_card: Optional[float] = self._if_full_details(self._parse_currency("gift card amount"))
+        self.gift_card: Optional[float] = self._currency_field("gift_card", "gift card amount")
         #: The Gift Wrap total. Only populated when ``full_details`` is ``True``.
-        self.gift_wrap: Optional[float] = self._if_full_details(self._parse_currency("gift wrap"))
+        self.gift_wrap: Optional[float] = self._currency_field("gift_wrap", "gift wrap")
 
     def __repr__(self) -> str:
         return f"<Order #{self.order_number}: \"{self.items}\">"
@@ -132,7 +157,7 @@ class Order(Parsable):
         if not self.parsed or len(util.select(self.parsed, self.config.selectors.ORDER_SKIP_ITEMS)) > 0:
             return []
 
-        shipments: List[Shipment] = [self.config.shipment_cls(x, self.config)
+        shipments: List[Shipment] = [self.config.shipment_cls(x, self.config, **self._nested_fields("shipments"))
                                      for x in util.select(self.parsed,
                                                           self.config.selectors.SHIPMENT_ENTITY_SELECTOR)]
         shipments.sort()
@@ -142,7 +167,7 @@ class Order(Parsable):
         if not self.parsed or len(util.select(self.parsed, self.config.selectors.ORDER_SKIP_ITEMS)) > 0:
             return []
 
-        items: List[Item] = [self.config.item_cls(x, self.config)
+        items: List[Item] = [self.config.item_cls(x, self.config, **self._nested_fields("items"))
                              for x in util.select(self.parsed,
                                                   self.config.selectors.ITEM_ENTITY_SELECTOR)]
         items.sort()
@@ -201,7 +226,7 @@ class Order(Parsable):
                 data_popover = value.get("data-a-popover", {})  # type: ignore[var-annotated]
                 inline_content = data_popover.get("inlineContent")  # type: ignore[union-attr]
                 if inline_content:
-                    value = BeautifulSoup(json.loads(inline_content), self.config.bs4_parser)
+                    value = util.parse_html(json.loads(inline_content), self.config.bs4_parser)
 
         if not value:
             # TODO: there are multiple shipToData tags, we should double check we're picking the right one
@@ -225,35 +250,58 @@ class Order(Parsable):
             )
 
             if parent_tag:
-                value = BeautifulSoup(str(parent_tag.contents[0]).strip(), self.config.bs4_parser)
+                value = util.parse_html(str(parent_tag.contents[0]).strip(), self.config.bs4_parser)
 
         if not value:
             return None
 
-        return Recipient(value, self.config)
+        return Recipient(value, self.config, **self._nested_fields("recipient"))
 
     def _parse_currency(self,
                         contains: str,
                         combine_multiple: bool = False) -> Optional[float]:
         value = None
 
-        for tag in util.select(self.parsed, self.config.selectors.FIELD_ORDER_SUBTOTALS_TAG_ITERATOR_SELECTOR):
-            if (contains in tag.text.lower() and
-                    not util.select_one(tag,
-                                        self.config.selectors.FIELD_ORDER_SUBTOTALS_TAG_POPOVER_PRELOAD_SELECTOR)):
-                inner_tag = util.select_one(tag, self.config.selectors.FIELD_ORDER_SUBTOTALS_INNER_TAG_SELECTOR)
-                if inner_tag:
-                    currency = self.to_currency(inner_tag.text)
+        for label, amounts in self._get_subtotals().items():
+            if contains in label:
+                for currency in amounts:
                     if currency is not None:
                         if value is None:
                             value = 0.0
                         value += currency
 
                     if not combine_multiple:
-                        break
+                        return value
 
         return value
 
+    def _get_subtotals(self) -> Dict[str, List[Optional[float]]]:
+        # Index the subtotal rows in a single pass, mapping each row's lower-cased label to the amounts of the rows
+        # with that label, in the order they appear
+        if self._subtotals is None:
+            self._subtotals = {}
+
+            for tag in util.select(self.parsed, self.config.selectors.FIELD_ORDER_SUBTOTALS_TAG_ITERATOR_SELECTOR):
+                if util.select_one(tag, self.config.selectors.FIELD_ORDER_SUBTOTALS_TAG_POPOVER_PRELOAD_SELECTOR):
+                    continue
+
+                inner_tag = util.select_one(tag, self.config.selectors.FIELD_ORDER_SUBTOTALS_INNER_TAG_SELECTOR)
+                if inner_tag:
+                    self._subtotals.setdefault(tag.text.lower(), []).append(self.to_currency(inner_tag.text))
+
+        return self._subtotals
+
+    def _currency_field(self,
+                        name: str,
+                        contains: str,
+                        combine_multiple: bool = False) -> Any:
+        return self._field(name, lambda: self._if_full_details(self._parse_currency(contains, combine_multiple)))
+
+    def _parse_subscription_discount(self) -> Optional[float]:
+        subscribe_discount = self._parse_currency("subscribe")
+
+        return subscribe_discount if subscribe_discount is not None else self._parse_currency("subscription")
+
     def _if_full_details(self,
                          value: Any) -> Union[Any, None]:
         return value if self.full_details else None
@@ -2,39 +2,147 @@ __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
 import logging
-import re
 from datetime import date
-from typing import Any, Callable, Dict, Optional, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Type, Union
 
 from bs4 import Tag
-from dateutil import parser
 
 from amazonorders import util
 from amazonorders.conf import AmazonOrdersConfig
+from amazonorders.entity.snapshot import Snapshot
 from amazonorders.exception import AmazonOrdersEntityError, AmazonOrdersError
 
 logger = logging.getLogger(__name__)
 
+# Returned by Parsable._field() in place of a value that will be parsed on first access
+_LAZY = object()
+
 
 class Parsable:
     """
     A base class that contains a parsed representation of the entity, which can be extended to build an entity that
     utilizes the common the helper methods.
+
+    If ``fields`` is given, only those fields are parsed when the entity is built, and any other field is parsed
+    (and cached) the first time it is accessed. Fields of nested entities can be given with a ``.``, ex.
+    ``items.title``, and giving a nested entity's field alone (ex. ``items``) parses all of its fields.
     """
 
+    #: The :class:`~amazonorders.entity.snapshot.Snapshot` class built by :func:`snapshot`.
+    snapshot_class: Optional[Type[Snapshot]] = None
+
     def __init__(self,
                  parsed: Tag,
-                 config: AmazonOrdersConfig) -> None:
-        #: Parsed HTML data that can be used to populate the fields of the entity.
+                 config: AmazonOrdersConfig,
+                 fields: Optional[Iterable[str]] = None) -> None:
+        #: Parsed HTML data that can be used to populate the fields of the entity, or ``None`` once the entity is
+        #: detached (see :func:`detach`).
         self.parsed: Tag = parsed
         #: The config to use.
         self.config: AmazonOrdersConfig = config
+        #: The fields parsed when the entity was built, or ``None`` if all fields were. Any other field is parsed the
+        #: first time it is accessed.
+        self.fields: Optional[Set[str]] = set(fields) if fields is not None else None
+
+        self._requested_fields: Optional[Set[str]] = {f.split(".", 1)[0] for f in self.fields} \
+            if self.fields is not None else None
+        self._lazy_fields: Dict[str, Callable[[], Any]] = {}
 
     def __getstate__(self) -> Dict:
+        self.parse_fields()
+
         state = self.__dict__.copy()
-        state.pop("parsed")
+        # Unpickled as if it were detached, so it can be pickled again
+        state["parsed"] = None
+        state.pop("_lazy_fields", None)
         return state
 
+    def __setattr__(self,
+                    name: str,
+                    value: Any) -> None:
+        # A lazy field is left unset, so it is parsed by __getattr__() on first access
+        if value is not _LAZY:
+            super().__setattr__(name, value)
+
+    def __getattr__(self,
+                    name: str) -> Any:
+        lazy_fields = self.__dict__.get("_lazy_fields")
+        if lazy_fields and name in lazy_fields:
+            value = lazy_fields[name]()
+            super().__setattr__(name, value)
+            lazy_fields.pop(name, None)
+            return value
+
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def parse_fields(self) -> None:
+        """
+        Parse any fields (including those of nested entities) that have not yet been parsed, because they were not
+        given in ``fields`` when the entity was built.
+        """
+        for name in list(self.__dict__.get("_lazy_fields", {})):
+            getattr(self, name)
+
+        for entity in self._nested_entities():
+            entity.parse_fields()
+
+    def detach(self) -> None:
+        """
+        Parse any fields that have not yet been parsed (see :func:`parse_fields`), then drop the references this
+        entity (and its nested entities) hold to the parsed HTML, so the page it was built from can be garbage
+        collected. Once detached, :attr:`parsed` is ``None``.
+        """
+        self.parse_fields()
+
+        self.parsed = None  # type: ignore[assignment]
+
+        for entity in self._nested_entities():
+            entity.detach()
+
+    def snapshot(self) -> Snapshot:
+        """
+        Build a compact, immutable :class:`~amazonorders.entity.snapshot.Snapshot` of this entity (and its nested
+        entities), parsing any fields that have not yet been parsed. The snapshot holds no reference to the entity or
+        its parsed HTML.
+
+        :return: The snapshot, an instance of :attr:`snapshot_class`.
+        """
+        if self.snapshot_class is None:
+            raise AmazonOrdersError(f"{self.__class__.__name__} does not define a `snapshot_class`.")
+
+        return self.snapshot_class(*(_to_snapshot_value(getattr(self, name, None))
+                                     for name in self.snapshot_class._fields))
+
+    def _nested_entities(self) -> List["Parsable"]:
+        entities = []
+        for value in list(self.__dict__.values()):
+            for entity in (value if isinstance(value, list) else [value]):
+                if isinstance(entity, Parsable):
+                    entities.append(entity)
+        return entities
+
+    def _field(self,
+               name: str,
+               parse_function: Callable[[], Any]) -> Any:
+        # Parse the named field now if it was requested, otherwise defer parsing it until it is first accessed. The
+        # return value must be assigned to the attribute of the same name.
+        if self._requested_fields is None or name in self._requested_fields:
+            return parse_function()
+
+        self._lazy_fields[name] = parse_function
+
+        return _LAZY
+
+    def _nested_fields(self,
+                       name: str) -> Dict[str, Any]:
+        # The kwargs for a nested entity built for the named field, so it parses only the fields requested for it
+        # (ex. ``title`` when ``items.title`` was requested)
+        if self.fields is None or name in self.fields:
+            return {}
+
+        prefix = f"{name}."
+        return {"fields": {f[len(prefix):] for f in self.fields if f.startswith(prefix)}}
+
     def safe_parse(self,
                    parse_function: Callable[..., Any],
                    **kwargs: Any) -> Any:
@@ -91,7 +199,7 @@ class Parsable:
         :param prefix_split: Only select the field with the given prefix, returning the right side of the split if so.
         :param wrap_tag: Wrap the selected tag in this class before returning.
         :param parse_date: ``True`` if the resulting value should be fuzzy parsed in to a date (returning ``None`` if
-            parsing fails).
+            parsing fails). See :func:`~amazonorders.util.parse_date`.
         :param prefix_split_fuzzy: ``True`` if the value should still be used even if ``prefix_split`` is not found.
         :param suffix_split: Only select the field with the given suffix, returning the left side of the split if so.
         :param suffix_split_fuzzy: ``True`` if the value should still be used even if ``suffix_split`` is not found.
@@ -103,7 +211,7 @@ class Parsable:
         value: Union[int, float, bool, date, str, None] = None
 
         for s in selector:
-            for tag in self.parsed.select(s):
+            for tag in util.select(self.parsed, s):
                 if tag:
                     if attr_name:
                         value = tag.attrs[attr_name]
@@ -142,10 +250,7 @@ class Parsable:
                             value = util.to_type(value.strip())
 
                         if parse_date and isinstance(value, str):
-                            try:
-                                value = parser.parse(value, fuzzy=True).date()
-                            except ValueError:
-                                value = None
+                            value = util.parse_date(value, self.config.constants.DATE_DAY_FIRST)
                     break
             if value:
                 break
@@ -187,31 +292,24 @@ class Parsable:
         """
         Clean up a currency, stripping non-numeric values and returning it as a primitive.
 
-        Recognizes the ``$``, ``£``, ``€``, and ``₹`` symbols (and leading currency-code
-        letters such as ``A$`` or ``CDN$``), accepts accounting-style negatives in parentheses
-        (e.g. ``($1.99)``), and treats a literal ``FREE`` as ``0.0``.
+        Recognizes the ``$``, ``£``, ``€``, and ``₹`` symbols (and currency codes such as ``A$``
+        or ``CDN$``), accepts accounting-style negatives in parentheses (e.g. ``($1.99)``), and
+        treats a literal ``FREE`` as ``0.0``. On domains that use a decimal comma (see
+        :attr:`~amazonorders.constants.Constants.DECIMAL_COMMA`), ``1.234,56`` is parsed as ``1234.56``.
+        See :func:`~amazonorders.util.parse_amount`.
 
         :param value: The currency to parse.
         :return: The currency as a primitive.
         """
-        if isinstance(value, (int, float)):
-            return value
-
-        if not value:
-            return None
-
-        value = value.strip()
-
-        if value.lower() == "free":
-            return 0.0
-
-        if value.startswith("(") and value.endswith(")"):
-            value = "-" + value[1:-1]
-
-        value = re.sub("[a-zA-Z$£€₹,]+", "", value)
-        currency = util.to_type(value)
-
-        if isinstance(currency, str):
-            return None
-
-        return currency
+        return util.parse_amount(value, self.config.constants.DECIMAL_COMMA)
+
+
+def _to_snapshot_value(value: Any) -> Any:
+    if isinstance(value, Parsable):
+        return value.snapshot()
+    elif isinstance(value, list):
+        return tuple(_to_snapshot_value(v) for v in value)
+    elif isinstance(value, BaseException):
+        # Only the message, since the error's traceback would keep the frames (and pages) it was raised in alive
+        return str(value)
+    return value
@@ -2,12 +2,13 @@ __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 
 from bs4 import Tag
 
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.parsable import Parsable
+from amazonorders.entity.snapshot import RecipientSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -17,16 +18,20 @@ class Recipient(Parsable):
     The person receiving an Amazon :class:`~amazonorders.entity.order.Order`.
     """
 
+    snapshot_class = RecipientSnapshot
+
     def __init__(self,
                  parsed: Tag,
-                 config: AmazonOrdersConfig) -> None:
-        super().__init__(parsed, config)
+                 config: AmazonOrdersConfig,
+                 fields: Optional[Iterable[str]] = None) -> None:
+        super().__init__(parsed, config, fields)
 
         #: The Recipient name.
-        self.name: str = self.safe_simple_parse(selector=self.config.selectors.FIELD_RECIPIENT_NAME_SELECTOR,
-                                                required=True)
+        self.name: str = self._field(
+            "name", lambda: self.safe_simple_parse(selector=self.config.selectors.FIELD_RECIPIENT_NAME_SELECTOR,
+                                                   required=True))
         #: The Recipient address.
-        self.address: Optional[str] = self.safe_parse(self._parse_address)
+        self.address: Optional[str] = self._field("address", lambda: self.safe_parse(self._parse_address))
 
     def __repr__(self) -> str:
         return f"<Recipient: \"{self.name}\">"
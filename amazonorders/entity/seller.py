@@ -2,12 +2,13 @@ __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 
 from bs4 import Tag
 
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.parsable import Parsable
+from amazonorders.entity.snapshot import SellerSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -17,17 +18,22 @@ class Seller(Parsable):
     An Amazon Seller of an Amazon :class:`~amazonorders.entity.item.Item`.
     """
 
+    snapshot_class = SellerSnapshot
+
     def __init__(self,
                  parsed: Tag,
-                 config: AmazonOrdersConfig) -> None:
-        super().__init__(parsed, config)
+                 config: AmazonOrdersConfig,
+                 fields: Optional[Iterable[str]] = None) -> None:
+        super().__init__(parsed, config, fields)
 
         #: The Seller name.
-        self.name: str = self.safe_simple_parse(self.config.selectors.FIELD_SELLER_NAME_SELECTOR,
-                                                prefix_split="Sold by:")
+        self.name: str = self._field(
+            "name", lambda: self.safe_simple_parse(self.config.selectors.FIELD_SELLER_NAME_SELECTOR,
+                                                   prefix_split="Sold by:"))
         #: The Seller link.
-        self.link: Optional[str] = self.safe_simple_parse(selector=self.config.selectors.FIELD_SELLER_LINK_SELECTOR,
-                                                          attr_name="href")
+        self.link: Optional[str] = self._field(
+            "link", lambda: self.safe_simple_parse(selector=self.config.selectors.FIELD_SELLER_LINK_SELECTOR,
+                                                   attr_name="href"))
 
     def __repr__(self) -> str:
         return f"<Seller: \"{self.name}\">"
@@ -2,7 +2,7 @@ __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
 import logging
-from typing import List, Optional, TypeVar
+from typing import Iterable, List, Optional, TypeVar
 
 from bs4 import Tag
 
@@ -10,6 +10,7 @@ from amazonorders import util
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.item import Item
 from amazonorders.entity.parsable import Parsable
+from amazonorders.entity.snapshot import ShipmentSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -21,20 +22,25 @@ class Shipment(Parsable):
     An Amazon Shipment, which should contain one or more :class:`~amazonorders.entity.item.Item`'s.
     """
 
+    snapshot_class = ShipmentSnapshot
+
     def __init__(self,
                  parsed: Tag,
-                 config: AmazonOrdersConfig) -> None:
-        super().__init__(parsed, config)
+                 config: AmazonOrdersConfig,
+                 fields: Optional[Iterable[str]] = None) -> None:
+        super().__init__(parsed, config, fields)
 
         #: The Shipment Items.
-        self.items: List[Item] = self._parse_items()
+        self.items: List[Item] = self._field("items", self._parse_items)
         #: The Shipment delivery status.
-        self.delivery_status: Optional[str] = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_SHIPMENT_DELIVERY_STATUS_SELECTOR)
+        self.delivery_status: Optional[str] = self._field(
+            "delivery_status", lambda: self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_SHIPMENT_DELIVERY_STATUS_SELECTOR))
         #: The Shipment tracking link.
-        self.tracking_link: Optional[str] = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_SHIPMENT_TRACKING_LINK_SELECTOR,
-            attr_name="href")
+        self.tracking_link: Optional[str] = self._field(
+            "tracking_link", lambda: self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_SHIPMENT_TRACKING_LINK_SELECTOR,
+                attr_name="href"))
 
     def __repr__(self) -> str:
         return f"<Shipment: \"{self.items}\">"
@@ -53,7 +59,7 @@ class Shipment(Parsable):
         if not self.parsed:
             return []
 
-        items: List[Item] = [self.config.item_cls(x, self.config)
+        items: List[Item] = [self.config.item_cls(x, self.config, **self._nested_fields("items"))
                              for x in util.select(self.parsed,
                                                   self.config.selectors.ITEM_ENTITY_SELECTOR)]
         items.sort()
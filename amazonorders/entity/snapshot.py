@@ -0,0 +1,139 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import logging
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Snapshot:
+    """
+    A compact, immutable representation of an entity, built with
+    :func:`~amazonorders.entity.parsable.Parsable.snapshot` once its fields have been parsed. Snapshots hold no
+    parsed HTML or config, store their fields in ``__slots__`` rather than a ``__dict__``, and pickle as just a tuple
+    of their field values. Two snapshots are equal (and hash the same) when they are of the same type and all of
+    their fields are equal. Nested entities are snapshotted too, lists become tuples, and errors (ex.
+    :attr:`~amazonorders.entity.order.Order.details_error`) become their message.
+
+    To also snapshot fields added by a custom entity class (ex. a custom ``item_class``), subclass the entity's
+    snapshot class with the new field names in ``__slots__``, and set it as the custom entity class's
+    ``snapshot_class``.
+    """
+
+    __slots__ = ()
+
+    #: The names of the snapshot's fields, in order, including those of parent classes.
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls,
+                          **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls._fields = cls._fields + tuple(cls.__dict__.get("__slots__", ()))
+
+    def __init__(self,
+                 *args: Any,
+                 **kwargs: Any) -> None:
+        if len(args) > len(self._fields):
+            raise TypeError(f"{self.__class__.__name__} takes at most {len(self._fields)} fields, "
+                            f"but {len(args)} were given")
+
+        values = dict(zip(self._fields, args))
+        for name, value in kwargs.items():
+            if name not in self._fields:
+                raise TypeError(f"{self.__class__.__name__} has no field '{name}'")
+            values[name] = value
+
+        for name in self._fields:
+            object.__setattr__(self, name, values.get(name))
+
+    def __setattr__(self,
+                    name: str,
+                    value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self,
+                    name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __eq__(self,
+               other: object) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return self._values() == other._values()  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self._values()))
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        return self.__class__, self._values()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{self.__class__.__name__}({fields})"
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the snapshot's fields as a ``dict``. Nested snapshots are left as-is.
+
+        :return: The snapshot's fields.
+        """
+        return dict(zip(self._fields, self._values()))
+
+
+class SellerSnapshot(Snapshot):
+    """
+    A :class:`Snapshot` of a :class:`~amazonorders.entity.seller.Seller`.
+    """
+
+    __slots__ = ("name", "link")
+
+
+class RecipientSnapshot(Snapshot):
+    """
+    A :class:`Snapshot` of a :class:`~amazonorders.entity.recipient.Recipient`.
+    """
+
+    __slots__ = ("name", "address")
+
+
+class ItemSnapshot(Snapshot):
+    """
+    A :class:`Snapshot` of an :class:`~amazonorders.entity.item.Item`.
+    """
+
+    __slots__ = ("title", "link", "price", "seller", "condition", "return_eligible_date", "image_link", "quantity")
+
+
+class ShipmentSnapshot(Snapshot):
+    """
+    A :class:`Snapshot` of a :class:`~amazonorders.entity.shipment.Shipment`.
+    """
+
+    __slots__ = ("items", "delivery_status", "tracking_link")
+
+
+class OrderSnapshot(Snapshot):
+    """
+    A :class:`Snapshot` of an :class:`~amazonorders.entity.order.Order`.
+    """
+
+    __slots__ = ("full_details", "index", "cancelled", "shipments", "items", "order_number", "order_details_link",
+                 "grand_total", "order_placed_date", "recipient", "payment_method", "payment_method_last_4",
+                 "subtotal", "shipping_total", "free_shipping", "promotion_applied", "coupon_savings", "reward_points",
+                 "subscription_discount", "total_before_tax", "estimated_tax", "refund_total", "multibuy_discount",
+                 "amazon_discount", "gift_card", "gift_wrap", "details_error")
+
+
+class TransactionSnapshot(Snapshot):
+    """
+    A :class:`Snapshot` of a :class:`~amazonorders.entity.transaction.Transaction`.
+    """
+
+    __slots__ = ("completed_date", "payment_method", "grand_total", "is_refund", "order_number",
+                 "order_details_link", "seller")
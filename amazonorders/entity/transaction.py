@@ -4,12 +4,13 @@ __license__ = "MIT"
 import logging
 import re
 from datetime import date
-from typing import Union, Optional
+from typing import Iterable, Union, Optional
 
 from bs4 import Tag
 
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.parsable import Parsable
+from amazonorders.entity.snapshot import TransactionSnapshot
 from amazonorders.exception import AmazonOrdersError
 
 logger = logging.getLogger(__name__)
@@ -20,30 +21,36 @@ class Transaction(Parsable):
     An Amazon Transaction.
     """
 
+    snapshot_class = TransactionSnapshot
+
     def __init__(self,
                  parsed: Tag,
                  config: AmazonOrdersConfig,
-                 completed_date: date) -> None:
-        super().__init__(parsed, config)
+                 completed_date: date,
+                 fields: Optional[Iterable[str]] = None) -> None:
+        super().__init__(parsed, config, fields)
 
         #: The Transaction completed date.
         self.completed_date: date = completed_date
         #: The Transaction payment method.
-        self.payment_method: str = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_TRANSACTION_PAYMENT_METHOD_SELECTOR
-        )
+        self.payment_method: str = self._field(
+            "payment_method", lambda: self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_TRANSACTION_PAYMENT_METHOD_SELECTOR
+            ))
         #: The Transaction grand total.
-        self.grand_total: float = self.safe_parse(self._parse_grand_total)
+        self.grand_total: float = self._field("grand_total", lambda: self.safe_parse(self._parse_grand_total))
         #: The Transaction was a refund or not.
-        self.is_refund: bool = self.grand_total > 0
+        self.is_refund: bool = self._field("is_refund", lambda: self.grand_total > 0)
         #: The Transaction Order number.
-        self.order_number: str = self.safe_parse(self._parse_order_number)
+        self.order_number: str = self._field("order_number", lambda: self.safe_parse(self._parse_order_number))
         #: The Transaction Order details link.
-        self.order_details_link: str = self.safe_parse(self._parse_order_details_link)
+        self.order_details_link: str = self._field(
+            "order_details_link", lambda: self.safe_parse(self._parse_order_details_link))
         #: The Transaction seller name.
-        self.seller: str = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_TRANSACTION_SELLER_NAME_SELECTOR
-        )
+        self.seller: str = self._field(
+            "seller", lambda: self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_TRANSACTION_SELLER_NAME_SELECTOR
+            ))
 
     def __repr__(self) -> str:
         return f"<Transaction {self.completed_date}: \"Order #{self.order_number}, Grand Total: {self.grand_total}\">"
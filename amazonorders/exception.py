@@ -45,3 +45,43 @@ class AmazonOrdersEntityError(AmazonOrdersError):
     Raised when an ``amazon-orders`` entity parsing error has occurred.
     """
     pass
+
+
+class AmazonOrdersResponseError(AmazonOrdersError):
+    """
+    Raised when Amazon responds to a request with an error status code.
+    """
+
+    def __init__(self,
+                 error: Union[str, BaseException],
+                 meta: Optional[Dict[str, Any]] = None,
+                 status_code: Optional[int] = None) -> None:
+        super(AmazonOrdersResponseError, self).__init__(error, meta)
+
+        #: The status code of the response.
+        self.status_code: Optional[int] = status_code
+
+
+class AmazonOrdersTimeoutError(AmazonOrdersError):
+    """
+    Raised when a request to Amazon times out (see ``request_connect_timeout`` and ``request_read_timeout`` in the
+    config).
+    """
+    pass
+
+
+class AmazonOrdersDeadlineError(AmazonOrdersTimeoutError):
+    """
+    Raised when a call given a ``deadline`` runs out of time before it completes. Outstanding work is cancelled,
+    :attr:`results` holds what was completed, and :attr:`~AmazonOrdersError.meta` holds what's needed to continue
+    where it left off.
+    """
+
+    def __init__(self,
+                 error: Union[str, BaseException],
+                 meta: Optional[Dict[str, Any]] = None,
+                 results: Any = None) -> None:
+        super(AmazonOrdersDeadlineError, self).__init__(error, meta)
+
+        #: The results completed before the deadline.
+        self.results: Any = results
@@ -88,7 +88,7 @@ class AuthForm(ABC):
             )  # pragma: no cover
 
         self.data = {}
-        for field in self.form.select("input"):
+        for field in util.select(self.form, "input"):
             try:
                 self.data[str(field["name"])] = field["value"]
             except Exception:
@@ -429,8 +429,8 @@ class CaptchaForm(AuthForm):
                 "https://amazon-orders.readthedocs.io/troubleshooting.html#captcha-blocking-login."
             )  # pragma: no cover
 
-        img_tag = form_parent.select_one("img")
-        solution_tag = form_parent.select_one(f"input[name='{self.solution_attr_key}']")
+        img_tag = util.select_one(form_parent, "img")
+        solution_tag = util.select_one(form_parent, f"input[name='{self.solution_attr_key}']")
 
         if img_tag:
             img_url = str(img_tag["src"])
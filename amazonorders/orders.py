@@ -2,26 +2,57 @@ __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
 import asyncio
+import collections
 import concurrent.futures
 import datetime
+import json
 import logging
-from typing import Any, Callable, List, Optional
+import os
+import queue
+import random
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import requests
 from bs4 import Tag
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
 from amazonorders import util
-from amazonorders.conf import AmazonOrdersConfig
+from amazonorders.cache import OrderDetailsCache
+from amazonorders.checkpoint import Checkpoint
+from amazonorders.conf import AmazonOrdersConfig, sync_state_file_lock
 from amazonorders.entity.order import Order
-from amazonorders.exception import AmazonOrdersError, AmazonOrdersNotFoundError
+from amazonorders.exception import (AmazonOrdersAuthError, AmazonOrdersDeadlineError, AmazonOrdersError,
+                                    AmazonOrdersNotFoundError, AmazonOrdersResponseError, AmazonOrdersTimeoutError)
 from amazonorders.session import AmazonSession
+from amazonorders.util import AmazonSessionResponse
 
 logger = logging.getLogger(__name__)
 
+# Errors from a dropped or reset connection, which (like timeouts) are worth retrying
+_CONNECTION_ERRORS: Tuple[type, ...] = (requests.exceptions.ConnectionError,) + \
+    ((httpx.TransportError,) if httpx else ())
+
 
 class AmazonOrders:
     """
     Using an authenticated :class:`~amazonorders.session.AmazonSession`, can be used to query Amazon
     for Order details and history.
+
+    Requests for Order details are executed on a thread pool that is shared for the lifetime of this object, so
+    ``thread_pool_size`` in the config caps the number of details requests in flight at any time. Call
+    :func:`close` when done to shut the pool down, or use the object as a context manager:
+
+    .. code-block:: python
+
+        with AmazonOrders(amazon_session) as amazon_orders:
+            orders = amazon_orders.get_order_history(full_details=True)
     """
 
     def __init__(self,
@@ -43,23 +74,205 @@ class AmazonOrders:
         if self.debug:
             logger.setLevel(logging.DEBUG)
 
+        #: The on-disk cache of Order details, populated when ``order_details_cache`` is enabled in the config.
+        self.order_details_cache: Optional[OrderDetailsCache] = OrderDetailsCache(self.config) \
+            if self.config.order_details_cache else None
+
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._executor_lock: threading.Lock = threading.Lock()
+
+    def __enter__(self) -> "AmazonOrders":
+        return self
+
+    def __exit__(self,
+                 *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool used to fetch Order details, waiting for any in-flight requests to finish. The
+        object may still be used after this is called, in which case a new thread pool will be started.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
     def get_order(self,
                   order_id: str,
-                  clone: Optional[Order] = None) -> Order:
+                  clone: Optional[Order] = None,
+                  fields: Optional[Iterable[str]] = None,
+                  detach: bool = False) -> Order:
         """
-        Get the full details for a given Amazon Order ID.
+        Get the full details for a given Amazon Order ID. If ``order_details_cache`` is enabled in the config and the
+        Order's details are cached, no request is made.
 
         :param order_id: The Amazon Order ID to lookup.
         :param clone: If a partially populated version of the Order has already been fetched from history.
+        :param fields: Only parse these fields when building the Order (see
+            :class:`~amazonorders.entity.parsable.Parsable`), any others are parsed on first access.
+        :param detach: Drop the Order's references to the parsed details page once it is built (see
+            :func:`~amazonorders.entity.parsable.Parsable.detach`), so the page can be garbage collected.
         :return: The requested Order.
         """
         if not self.amazon_session.is_authenticated:
             raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
 
+        order = self._get_cached_order(order_id, clone, fields)
+        if not order:
+            order_details_response = self.amazon_session.get(
+                f"{self.config.constants.ORDER_DETAILS_URL}?orderID={order_id}",
+                strip_scripts=self.config.strip_scripts)
+
+            order = self._parse_order_details_response(order_details_response, order_id, clone, fields)
+
+        if detach:
+            order.detach()
+
+        return order
+
+    async def aget_order(self,
+                         order_id: str,
+                         clone: Optional[Order] = None,
+                         fields: Optional[Iterable[str]] = None,
+                         detach: bool = False) -> Order:
+        """
+        The ``async`` equivalent of :func:`get_order`.
+
+        :param order_id: The Amazon Order ID to lookup.
+        :param clone: If a partially populated version of the Order has already been fetched from history.
+        :param fields: Only parse these fields when building the Order, any others are parsed on first access.
+        :param detach: Drop the Order's references to the parsed details page once it is built.
+        :return: The requested Order.
+        """
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        order = self._get_cached_order(order_id, clone, fields)
+        if not order:
+            order_details_response = await self.amazon_session.aget(
+                f"{self.config.constants.ORDER_DETAILS_URL}?orderID={order_id}",
+                strip_scripts=self.config.strip_scripts)
+
+            order = self._parse_order_details_response(order_details_response, order_id, clone, fields)
+
+        if detach:
+            order.detach()
+
+        return order
+
+    def get_orders(self,
+                   order_ids: Iterable[str],
+                   deadline: Optional[float] = None) -> Dict[str, Union[Order, AmazonOrdersError]]:
+        """
+        Get the full details for many Amazon Order IDs, with requests made concurrently on the shared thread pool
+        (so at most ``thread_pool_size`` are in flight). Repeated IDs are only fetched once. A failure for one
+        Order does not stop the others from being fetched. Requests that fail transiently (a ``429`` or ``5xx``, a
+        timeout, or a connection error) are retried up to ``details_max_retries`` times, with backoff, and if an
+        Order still can't be fetched, its error (wrapped in an
+        :class:`~amazonorders.exception.AmazonOrdersError` if need be, with the ``order_id`` and ``attempts`` in its
+        :attr:`~amazonorders.exception.AmazonOrdersError.meta`) is returned in place of the Order.
+
+        :param order_ids: The Amazon Order IDs to lookup.
+        :param deadline: The number of seconds to allow for all Orders to be fetched. If it's exceeded, outstanding
+            requests are cancelled and :class:`~amazonorders.exception.AmazonOrdersDeadlineError` is raised, with the
+            ``dict`` of Orders fetched so far in its ``results``, and the IDs still to be fetched in ``order_ids`` in
+            its ``meta``.
+        :return: A ``dict`` of each Order ID (in the order given) to its Order, or the
+            :class:`~amazonorders.exception.AmazonOrdersError` raised when getting it.
+        """
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        budget = util.Deadline(deadline)
+        futures = {order_id: self._get_executor().submit(self._get_order_or_error, order_id)
+                   for order_id in dict.fromkeys(order_ids)}
+
+        orders: Dict[str, Union[Order, AmazonOrdersError]] = {}
+        try:
+            for order_id, future in futures.items():
+                orders[order_id] = budget.result(future)
+        except AmazonOrdersDeadlineError as e:
+            # Orders that completed out of order are returned too, so only the rest need to be fetched again
+            for order_id, future in futures.items():
+                if order_id not in orders and future.done() and not future.cancelled():
+                    orders[order_id] = future.result()
+            e.meta = {"order_ids": [order_id for order_id in futures if order_id not in orders]}
+            e.results = orders
+            raise
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+        return orders
+
+    async def aget_orders(self,
+                          order_ids: Iterable[str],
+                          deadline: Optional[float] = None) -> Dict[str, Union[Order, AmazonOrdersError]]:
+        """
+        The ``async`` equivalent of :func:`get_orders`, with at most ``thread_pool_size`` requests in flight.
+
+        :param order_ids: The Amazon Order IDs to lookup.
+        :param deadline: The number of seconds to allow for all Orders to be fetched, see :func:`get_orders`.
+        :return: A ``dict`` of each Order ID (in the order given) to its Order, or the
+            :class:`~amazonorders.exception.AmazonOrdersError` raised when getting it.
+        """
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        budget = util.Deadline(deadline)
+        semaphore = asyncio.Semaphore(self.config.thread_pool_size)
+        orders: Dict[str, Union[Order, AmazonOrdersError]] = {}
+
+        async def get_order(order_id: str) -> None:
+            async with semaphore:
+                orders[order_id] = await self._aget_order_or_error(order_id)
+
+        unique_order_ids = list(dict.fromkeys(order_ids))
+        try:
+            await budget.wait_for(asyncio.gather(*(get_order(order_id) for order_id in unique_order_ids)))
+        except AmazonOrdersDeadlineError as e:
+            e.meta = {"order_ids": [order_id for order_id in unique_order_ids if order_id not in orders]}
+            e.results = {order_id: orders[order_id] for order_id in unique_order_ids if order_id in orders}
+            raise
+
+        return {order_id: orders[order_id] for order_id in unique_order_ids}
+
+    def _get_order_or_error(self,
+                            order_id: str) -> Union[Order, AmazonOrdersError]:
+        attempt = 0
+        while True:
+            try:
+                return self.get_order(order_id)
+            except Exception as e:
+                retry_wait = self._get_retry_wait(order_id, e, attempt)
+                if retry_wait is None:
+                    return _to_order_error(order_id, e, attempt + 1)
+
+            time.sleep(retry_wait)
+            attempt += 1
+
+    async def _aget_order_or_error(self,
+                                   order_id: str) -> Union[Order, AmazonOrdersError]:
+        attempt = 0
+        while True:
+            try:
+                return await self.aget_order(order_id)
+            except Exception as e:
+                retry_wait = self._get_retry_wait(order_id, e, attempt)
+                if retry_wait is None:
+                    return _to_order_error(order_id, e, attempt + 1)
+
+            await asyncio.sleep(retry_wait)
+            attempt += 1
+
+    def _parse_order_details_response(self,
+                                      order_details_response: AmazonSessionResponse,
+                                      order_id: str,
+                                      clone: Optional[Order],
+                                      fields: Optional[Iterable[str]] = None) -> Order:
         meta = {"index": clone.index} if clone else None
 
-        order_details_response = self.amazon_session.get(
-            f"{self.config.constants.ORDER_DETAILS_URL}?orderID={order_id}")
         self.amazon_session.check_response(order_details_response, meta=meta)
 
         if not order_details_response.response.url.startswith(self.config.constants.ORDER_DETAILS_URL):
@@ -73,16 +286,42 @@ class AmazonOrders:
             raise AmazonOrdersError(f"Could not parse details for Order {order_id}. Check if Amazon changed the HTML.")
 
         order: Order = self.config.order_cls(order_details_tag, self.config, full_details=True, clone=clone,
-                                             order_number=order_id)
+                                             order_number=order_id, **_fields_kwargs(fields))
+
+        if self.order_details_cache:
+            self.order_details_cache.put(order_id, order_details_response.response.text, order)
 
         return order
 
+    def _get_cached_order(self,
+                          order_id: str,
+                          clone: Optional[Order],
+                          fields: Optional[Iterable[str]] = None) -> Optional[Order]:
+        if not self.order_details_cache:
+            return None
+
+        parsed = self.order_details_cache.get(order_id)
+        if parsed is None:
+            return None
+
+        order_details_tag = util.select_one(parsed, self.config.selectors.ORDER_DETAILS_ENTITY_SELECTOR)
+        if not order_details_tag:
+            self.order_details_cache.invalidate(order_id)
+            return None
+
+        return self.config.order_cls(order_details_tag, self.config, full_details=True, clone=clone,
+                                     order_number=order_id, **_fields_kwargs(fields))
+
     def get_order_history(self,
                           year: Optional[int] = None,
                           start_index: Optional[int] = None,
                           full_details: bool = False,
                           keep_paging: bool = True,
-                          time_filter: Optional[str] = None) -> List[Order]:
+                          time_filter: Optional[str] = None,
+                          fields: Optional[Iterable[str]] = None,
+                          detach: bool = False,
+                          deadline: Optional[float] = None,
+                          resume: bool = False) -> List[Order]:
         """
         Get the Amazon Order history for a given time period.
 
@@ -93,16 +332,399 @@ class AmazonOrders:
             out, see ``index`` in the exception's :attr:`~amazonorders.exception.AmazonOrdersError.meta` to continue
             paging where it left off.
         :param full_details: Get the full details for each Order in the history. This will execute an additional
-            request per Order.
+            request per Order. Requests that fail transiently (a ``429`` or ``5xx``, a timeout, or a connection error)
+            are retried up to ``details_max_retries`` times, with backoff. If an Order's details still can't be
+            fetched, it is returned partially populated from the history page, in its usual place in the list, with
+            the error in its :attr:`~amazonorders.entity.order.Order.details_error`, rather than failing the whole
+            history. There is no separate failure report, so filter the returned Orders on ``details_error`` to find
+            those that failed.
         :param keep_paging: ``False`` if only one page should be fetched.
         :param time_filter: The time filter to use. Supported values are ``"last30"`` (last 30 days),
             ``"months-3"`` (past 3 months), or ``"year-YYYY"`` (specific year). If provided, this takes
             precedence over the ``year`` parameter.
+        :param fields: Only parse these fields when building each Order (see
+            :class:`~amazonorders.entity.parsable.Parsable`), any others are parsed on first access. If
+            ``full_details`` is ``True`` but none of the fields are in
+            :attr:`~amazonorders.entity.order.Order.DETAILS_FIELDS`, no details requests are made.
+        :param detach: Drop each Order's references to the parsed history (and details) pages once it is built (see
+            :func:`~amazonorders.entity.parsable.Parsable.detach`), so pages can be garbage collected as history is
+            paged, rather than every page being kept alive for as long as the Orders are. Any fields not given in
+            ``fields`` are parsed before the Order is detached.
+        :param deadline: The number of seconds to allow for the history to be fetched. If it's exceeded, outstanding
+            requests are cancelled and :class:`~amazonorders.exception.AmazonOrdersDeadlineError` is raised, with the
+            Orders fetched so far in its ``results``, and the ``index`` to pass as ``start_index`` to continue where
+            it left off in its ``meta``.
+        :param resume: Checkpoint the history to ``checkpoint_dir`` as each Order is fetched (see
+            :class:`~amazonorders.checkpoint.Checkpoint`), and if a previous call with the same parameters was
+            interrupted (ex. it crashed, was killed, or exceeded its ``deadline``), continue from its checkpoint, so
+            Orders it already fetched (and their details) are not fetched again. Orders whose details could not be
+            fetched (see :attr:`~amazonorders.entity.order.Order.details_error`) are not finished, so their details
+            are requested again on resume. The checkpoint is deleted once the history (and every Order's details)
+            has been fetched.
         :return: A list of the requested Orders.
         """
+        orders: List[Order] = []
+        try:
+            for order in self.iter_order_history(year=year,
+                                                 start_index=start_index,
+                                                 full_details=full_details,
+                                                 keep_paging=keep_paging,
+                                                 time_filter=time_filter,
+                                                 fields=fields,
+                                                 detach=detach,
+                                                 deadline=deadline,
+                                                 resume=resume):
+                orders.append(order)
+        except AmazonOrdersDeadlineError as e:
+            e.results = orders
+            raise
+
+        return orders
+
+    def iter_order_history(self,
+                           year: Optional[int] = None,
+                           start_index: Optional[int] = None,
+                           full_details: bool = False,
+                           keep_paging: bool = True,
+                           time_filter: Optional[str] = None,
+                           fields: Optional[Iterable[str]] = None,
+                           detach: bool = False,
+                           deadline: Optional[float] = None,
+                           resume: bool = False) -> Iterator[Order]:
+        """
+        Get the Amazon Order history for a given time period, yielding each Order (in ``index`` order) as soon as
+        the page it is on (and, if ``full_details`` is ``True``, its details page) has been parsed, instead of
+        waiting for the entire history to be fetched. Takes the same parameters as :func:`get_order_history`.
+
+        :param year: The year for which to get history. Ignored if ``time_filter`` is provided.
+        :param start_index: The index of the Order from which to start fetching in the history.
+        :param full_details: Get the full details for each Order in the history. This will execute an additional
+            request per Order. An Order whose details can't be fetched is yielded partially populated, with the error
+            in its :attr:`~amazonorders.entity.order.Order.details_error`.
+        :param keep_paging: ``False`` if only one page should be fetched.
+        :param time_filter: The time filter to use. If provided, this takes precedence over the ``year`` parameter.
+        :param fields: Only parse these fields when building each Order, any others are parsed on first access.
+        :param detach: Drop each Order's references to the parsed history (and details) pages once it is built.
+        :param deadline: The number of seconds to allow for the history to be fetched, counted from when this is
+            called. If it's exceeded, :class:`~amazonorders.exception.AmazonOrdersDeadlineError` is raised with the
+            ``index`` of the next Order in its ``meta``.
+        :param resume: Checkpoint the history as each Order is yielded, and continue from the checkpoint of a
+            previous call with the same parameters that was interrupted. Orders loaded from the checkpoint are
+            yielded first, with their details requested again if they previously could not be fetched.
+        :return: A generator of the requested Orders.
+        """
         if not self.amazon_session.is_authenticated:
             raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
 
+        next_page = self._build_order_history_url(year, start_index, time_filter)
+        current_index = int(start_index) if start_index else 0
+        fields = set(fields) if fields is not None else None
+        full_details = full_details and self._needs_order_details(fields)
+
+        if resume:
+            checkpoint = Checkpoint(self.config, "order-history", {
+                "account": self._get_sync_state_key(),
+                "year": year,
+                "start_index": current_index,
+                "full_details": full_details,
+                "keep_paging": keep_paging,
+                "time_filter": time_filter,
+                "fields": sorted(fields) if fields is not None else None,
+            })
+            return self._iter_checkpointed_orders(checkpoint, year, keep_paging, full_details, current_index,
+                                                  time_filter, fields, detach, util.Deadline(deadline))
+
+        return self._iter_orders(next_page, keep_paging, full_details, current_index, fields, detach,
+                                 util.Deadline(deadline))
+
+    async def aget_order_history(self,
+                                 year: Optional[int] = None,
+                                 start_index: Optional[int] = None,
+                                 full_details: bool = False,
+                                 keep_paging: bool = True,
+                                 time_filter: Optional[str] = None,
+                                 fields: Optional[Iterable[str]] = None,
+                                 detach: bool = False,
+                                 deadline: Optional[float] = None) -> List[Order]:
+        """
+        The ``async`` equivalent of :func:`get_order_history`, safe to call from an already running event loop.
+        Details requests (when ``full_details`` is ``True``) are multiplexed on the loop, with at most
+        ``thread_pool_size`` in flight at a time. Takes the same parameters as :func:`get_order_history`.
+
+        :param year: The year for which to get history. Ignored if ``time_filter`` is provided.
+        :param start_index: The index of the Order from which to start fetching in the history.
+        :param full_details: Get the full details for each Order in the history. This will execute an additional
+            request per Order.
+        :param keep_paging: ``False`` if only one page should be fetched.
+        :param time_filter: The time filter to use. If provided, this takes precedence over the ``year`` parameter.
+        :param fields: Only parse these fields when building each Order, any others are parsed on first access.
+        :param detach: Drop each Order's references to the parsed history (and details) pages once it is built.
+        :param deadline: The number of seconds to allow for the history to be fetched, see
+            :func:`get_order_history`.
+        :return: A list of the requested Orders.
+        """
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        budget = util.Deadline(deadline)
+        next_page: Optional[str] = self._build_order_history_url(year, start_index, time_filter)
+        current_index = int(start_index) if start_index else 0
+        fields = set(fields) if fields is not None else None
+        full_details = full_details and self._needs_order_details(fields)
+
+        semaphore = asyncio.Semaphore(self.config.thread_pool_size)
+
+        async def build_order(order_tag: Tag,
+                              index: int) -> Order:
+            order: Order = self.config.order_cls(order_tag, self.config, index=index, **_fields_kwargs(fields))
+            if full_details and self._can_get_order_details(order):
+                async with semaphore:
+                    order = await self._aget_order_details(order, fields)
+            if detach:
+                order.detach()
+            return order
+
+        async def get_page(page: str,
+                           index: int) -> Tuple[AmazonSessionResponse, List[Tag], Optional[str]]:
+            async with semaphore:
+                page_response = await self.amazon_session.aget(page, strip_scripts=self.config.strip_scripts)
+            return (page_response,) + self._parse_order_history_page(page_response, keep_paging, index)
+
+        planned_paging = keep_paging and self.config.history_planned_paging
+
+        order_tasks: List[asyncio.Task] = []
+        try:
+            while next_page:
+                page = next_page
+                page_response, order_tags, next_page = await budget.wait_for(get_page(page, current_index))
+                pages = [order_tags]
+
+                if planned_paging:
+                    planned_paging = False
+                    planned_pages = self._plan_order_history_pages(page, page_response, current_index,
+                                                                   len(order_tags))
+                    if planned_pages:
+                        results = await budget.wait_for(asyncio.gather(*(get_page(p, i) for p, i in planned_pages)))
+                        pages.extend(order_tags for _, order_tags, _ in results)
+                        next_page = results[-1][2]
+
+                for order_tags in pages:
+                    for order_tag in order_tags:
+                        order_tasks.append(asyncio.ensure_future(build_order(order_tag, current_index)))
+
+                        current_index += 1
+
+            return await budget.wait_for(asyncio.gather(*order_tasks))
+        except AmazonOrdersDeadlineError as e:
+            # Orders are returned up to the first that isn't complete, so the history can be continued from there
+            orders = []
+            for task in order_tasks:
+                if not task.done() or task.cancelled() or task.exception():
+                    break
+                orders.append(task.result())
+            e.meta = {"index": (int(start_index) if start_index else 0) + len(orders)}
+            e.results = orders
+            raise
+        finally:
+            for task in order_tasks:
+                task.cancel()
+
+    def get_order_history_range(self,
+                                start_year: int,
+                                end_year: Optional[int] = None,
+                                full_details: bool = False,
+                                progress_callback: Optional[Callable[[int, List[Order]], None]] = None) -> List[Order]:
+        """
+        Get the Amazon Order history for each year in a range (inclusive). Each year is paged concurrently on the
+        shared thread pool, as are details requests (when ``full_details`` is ``True``), so ``thread_pool_size``
+        caps the number of requests in flight across all years, and the range takes about as long as its slowest
+        year rather than the sum of them.
+
+        Orders are returned grouped by year, oldest year first. Each Order's
+        :attr:`~amazonorders.entity.order.Order.index` is its position within its own year's history, the same as it
+        would be from :func:`get_order_history`.
+
+        :param start_year: The first year for which to get history.
+        :param end_year: The last year for which to get history. Defaults to the current year.
+        :param full_details: Get the full details for each Order in the history. This will execute an additional
+            request per Order. As with :func:`get_order_history`, an Order whose details can't be fetched is returned
+            partially populated, with the error in its :attr:`~amazonorders.entity.order.Order.details_error`.
+        :param progress_callback: Called with the year and its Orders as soon as each year is complete (which may
+            not be in year order). Partially populated Orders are included, so check their ``details_error``.
+        :return: A list of the requested Orders.
+        """
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        if end_year is None:
+            end_year = datetime.date.today().year
+        if start_year > end_year:
+            raise AmazonOrdersError("'start_year' must not be after 'end_year'.")
+
+        executor = self._get_executor()
+        years = range(start_year, end_year + 1)
+
+        # Year futures only page through history and never wait on other futures; details requests are submitted
+        # from here as each year's history arrives, so all requests share the pool without risk of deadlock
+        year_futures: Dict[concurrent.futures.Future, int] = {
+            executor.submit(self._get_year_order_history, year): year for year in years
+        }
+        details_futures: Dict[concurrent.futures.Future, Tuple[int, int]] = {}
+        orders_by_year: Dict[int, List[Order]] = {}
+        details_remaining: Dict[int, int] = {}
+
+        pending = set(year_futures)
+        try:
+            while pending:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    if future in year_futures:
+                        year = year_futures.pop(future)
+                        orders_by_year[year] = future.result()
+                        details_remaining[year] = 0
+
+                        if full_details:
+                            for i, order in enumerate(orders_by_year[year]):
+                                if self._can_get_order_details(order):
+                                    details_future = executor.submit(self._get_order_details, order)
+                                    details_futures[details_future] = (year, i)
+                                    details_remaining[year] += 1
+                                    pending.add(details_future)
+                    else:
+                        year, i = details_futures.pop(future)
+                        orders_by_year[year][i] = future.result()
+                        details_remaining[year] -= 1
+
+                    if progress_callback and not details_remaining[year]:
+                        progress_callback(year, orders_by_year[year])
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return [order for year in years for order in orders_by_year[year]]
+
+    def _get_year_order_history(self,
+                                year: int) -> List[Order]:
+        orders: List[Order] = []
+
+        next_page: Optional[str] = self._build_order_history_url(year, None, None)
+        while next_page:
+            order_tags, next_page = self._get_order_history_page(next_page, True, len(orders))
+
+            for order_tag in order_tags:
+                orders.append(self._build_order(order_tag, False, len(orders)))
+
+        return orders
+
+    def sync_order_history(self,
+                           full_details: bool = False) -> List[Order]:
+        """
+        Get only the Orders placed since the last time this was called for the same account and domain. History is
+        paged (newest first, serially, and across years if necessary) only until an Order that was already seen is
+        reached, so when there are few new Orders, this is usually a single request. The newest Orders seen are then
+        persisted to ``sync_state_path`` in the config (``sync-state.json`` alongside ``cookie_jar_path`` by default),
+        while holding a cross-process lock on it, so concurrent syncs (ex. for different accounts sharing a config
+        directory) don't lose each other's state.
+
+        The first sync for an account returns the history for the current year.
+
+        :param full_details: Get the full details for each new Order. This will execute an additional request per
+            Order.
+        :return: A list of the Orders placed since the last sync, newest first. If the details of any Order could not
+            be fetched (its ``details_error`` is set), it and any newer Orders are not marked as seen, so they are
+            returned again by the next sync.
+        """
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        sync_state_key = self._get_sync_state_key()
+        sync_state_path = self._get_sync_state_path()
+        sync_state_dir = os.path.dirname(sync_state_path)
+        if not os.path.exists(sync_state_dir):
+            os.makedirs(sync_state_dir, exist_ok=True)
+
+        with util.file_lock(sync_state_path, sync_state_file_lock):
+            sync_state = self._load_sync_state(sync_state_path).get(sync_state_key, {})
+
+        known_order_numbers = set(sync_state.get("order_numbers", []))
+        known_order_placed_date = datetime.date.fromisoformat(sync_state["order_placed_date"]) \
+            if sync_state.get("order_placed_date") else None
+
+        orders: List[Order] = []
+        year = datetime.date.today().year
+        last_year = known_order_placed_date.year if known_order_placed_date else year
+        synced = False
+        while not synced and year >= last_year:
+            next_page: Optional[str] = self._build_order_history_url(year, None, None)
+            current_index = 0
+            while not synced and next_page:
+                order_tags, next_page = self._get_order_history_page(next_page, True, current_index)
+
+                for order_tag in order_tags:
+                    order = self._build_order(order_tag, False, current_index)
+                    current_index += 1
+
+                    if order.order_number in known_order_numbers or (
+                            known_order_placed_date and order.order_placed_date and
+                            order.order_placed_date < known_order_placed_date):
+                        synced = True
+                        break
+
+                    orders.append(order)
+
+            year -= 1
+
+        if full_details:
+            orders = list(self._get_executor().map(
+                lambda o: self._get_order_details(o) if self._can_get_order_details(o) else o,
+                orders))
+
+        # An Order whose details couldn't be fetched, and those before it, are left out of the persisted state, so the
+        # next sync pages back to them and returns them again
+        failed_indexes = [i for i, o in enumerate(orders) if o.details_error]
+        synced_orders = orders[failed_indexes[-1] + 1:] if failed_indexes else orders
+        if failed_indexes:
+            logger.warning(f"The details of {len(failed_indexes)} Order(s) could not be fetched, so the next sync "
+                           f"will return the {len(orders) - len(synced_orders)} newest Order(s) again")
+
+        dated_orders = [o for o in synced_orders if o.order_placed_date and o.order_number]
+        if dated_orders:
+            newest_order_placed_date = max(o.order_placed_date for o in dated_orders)
+            order_numbers = [o.order_number for o in dated_orders if o.order_placed_date == newest_order_placed_date]
+            if newest_order_placed_date == known_order_placed_date:
+                order_numbers += list(known_order_numbers)
+
+            # Re-read under the lock, so only this account and domain's state is replaced
+            with util.file_lock(sync_state_path, sync_state_file_lock):
+                state = self._load_sync_state(sync_state_path)
+                state[sync_state_key] = {
+                    "order_placed_date": newest_order_placed_date.isoformat(),
+                    "order_numbers": sorted(set(order_numbers))
+                }
+                util.atomic_write(sync_state_path, json.dumps(state).encode("utf-8"))
+
+        return orders
+
+    def _get_sync_state_key(self) -> str:
+        domain = urllib.parse.urlsplit(self.config.constants.BASE_URL).netloc
+        return f"{self.amazon_session.username}@{domain}"
+
+    def _get_sync_state_path(self) -> str:
+        return self.config.sync_state_path or os.path.join(os.path.dirname(self.config.cookie_jar_path),
+                                                           "sync-state.json")
+
+    def _load_sync_state(self,
+                         sync_state_path: str) -> Dict[str, Any]:
+        if not os.path.exists(sync_state_path):
+            return {}
+
+        with open(sync_state_path, "r", encoding="utf-8") as f:
+            return json.loads(f.read())
+
+    def _build_order_history_url(self,
+                                 year: Optional[int],
+                                 start_index: Optional[int],
+                                 time_filter: Optional[str]) -> str:
         if time_filter and year:
             raise AmazonOrdersError("Only one of 'year' or 'time_filter' may be used at a time.")
 
@@ -123,7 +745,7 @@ class AmazonOrders:
             filter_value = f"year-{year}"
 
         optional_start_index = f"&startIndex={start_index}" if start_index else ""
-        next_page: Optional[str] = (
+        return (
             "{url}?{query_param}={filter_value}{optional_start_index}"
         ).format(
             url=self.config.constants.ORDER_HISTORY_URL,
@@ -132,76 +754,448 @@ class AmazonOrders:
             optional_start_index=optional_start_index
         )
 
-        current_index = int(start_index) if start_index else 0
+    def _iter_orders(self,
+                     next_page: Optional[str],
+                     keep_paging: bool,
+                     full_details: bool,
+                     current_index: int,
+                     fields: Optional[Iterable[str]] = None,
+                     detach: bool = False,
+                     deadline: Optional[util.Deadline] = None) -> Iterator[Order]:
+        deadline = deadline or util.Deadline()
+        pending: Deque[concurrent.futures.Future] = collections.deque()
+        # The index of the next Order to be yielded, from which paging can be continued if the deadline is exceeded
+        next_index = current_index
 
-        return asyncio.run(self._build_orders_async(next_page, keep_paging, full_details, current_index))
+        pages = self._iter_order_history_pages(next_page, keep_paging, current_index, deadline)
+        try:
+            for order_tags in pages:
+                for order_tag in order_tags:
+                    if full_details:
+                        pending.append(self._get_executor().submit(self._build_order, order_tag, full_details,
+                                                                   current_index, fields, detach))
+                    else:
+                        yield self._build_order(order_tag, full_details, current_index, fields, detach)
+                        next_index += 1
 
-    async def _build_orders_async(self,
-                                  next_page: Optional[str],
+                    current_index += 1
+
+                # Yield Orders whose details are ready, keeping at most ``thread_pool_size`` in flight ahead of
+                # the caller so the next page can be fetched while details requests complete
+                while pending and (pending[0].done() or len(pending) > self.config.thread_pool_size):
+                    order = deadline.result(pending[0])
+                    pending.popleft()
+                    yield order
+                    next_index += 1
+
+            while pending:
+                order = deadline.result(pending[0])
+                pending.popleft()
+                yield order
+                next_index += 1
+        except AmazonOrdersDeadlineError as e:
+            e.meta = {"index": next_index}
+            raise
+        finally:
+            pages.close()
+            for future in pending:
+                future.cancel()
+
+    def _iter_checkpointed_orders(self,
+                                  checkpoint: Checkpoint,
+                                  year: Optional[int],
                                   keep_paging: bool,
                                   full_details: bool,
-                                  current_index: int) -> List[Order]:
-        order_tasks = []
+                                  current_index: int,
+                                  time_filter: Optional[str],
+                                  fields: Optional[Iterable[str]],
+                                  detach: bool,
+                                  deadline: util.Deadline) -> Iterator[Order]:
+        details_futures: Dict[int, concurrent.futures.Future] = {}
+        details_errors = 0
+        try:
+            # A later record for an index (ex. an Order whose details were fetched on resume) replaces an earlier one
+            loaded_orders: Dict[int, Order] = {}
+            for next_index, orders in checkpoint.load():
+                for order in orders:
+                    loaded_orders[order.index] = order  # type: ignore[index]
+                current_index = max(current_index, next_index)
 
-        while next_page:
-            page_response = self.amazon_session.get(next_page)
-            self.amazon_session.check_response(page_response, meta={"index": current_index})
+            if loaded_orders:
+                logger.debug(f"Resuming Order history from checkpoint at index {current_index}")
+
+            # Orders whose details couldn't be fetched weren't finished, so their details are requested again
+            details_futures = {
+                index: self._get_executor().submit(self._get_order_details, order, fields)
+                for index, order in loaded_orders.items() if full_details and order.details_error
+            }
+            for index in sorted(loaded_orders):
+                if index in details_futures:
+                    order = deadline.result(details_futures.pop(index))
+                    if detach:
+                        order.detach()
+                    checkpoint.append(current_index, [order])
+                else:
+                    order = loaded_orders[index]
+                details_errors += bool(order.details_error)
+                yield order
+
+            next_page = self._build_order_history_url(year, current_index, time_filter)
+            for order in self._iter_orders(next_page, keep_paging, full_details, current_index, fields, detach,
+                                           deadline):
+                # Checkpointed before it's yielded, so an Order is never lost if the caller is interrupted
+                current_index += 1
+                checkpoint.append(current_index, [order])
+                details_errors += bool(order.details_error)
+                yield order
+
+            if details_errors:
+                # Kept, so resuming again requests only the details that failed
+                logger.warning(f"The details of {details_errors} Order(s) could not be fetched, resume again to "
+                               f"retry them")
+            else:
+                checkpoint.clear()
+        except AmazonOrdersDeadlineError as e:
+            if e.meta is None:
+                e.meta = {"index": current_index}
+            raise
+        finally:
+            for future in details_futures.values():
+                future.cancel()
+            checkpoint.close()
+
+    def _iter_order_history_pages(self,
+                                  next_page: Optional[str],
+                                  keep_paging: bool,
+                                  current_index: int,
+                                  deadline: util.Deadline) -> Iterator[List[Tag]]:
+        if next_page and keep_paging and self.config.history_planned_paging:
+            return self._iter_planned_order_history_pages(next_page, current_index, deadline)
+
+        return self._iter_linked_order_history_pages(next_page, keep_paging, current_index, deadline)
+
+    def _iter_planned_order_history_pages(self,
+                                          next_page: str,
+                                          current_index: int,
+                                          deadline: util.Deadline) -> Iterator[List[Tag]]:
+        deadline.check()
+        page_response = self.amazon_session.get(next_page, strip_scripts=self.config.strip_scripts)
+        order_tags, link_page = self._parse_order_history_page(page_response, True, current_index)
+
+        yield order_tags
+
+        planned_pages = self._plan_order_history_pages(next_page, page_response, current_index, len(order_tags))
+        current_index += len(order_tags)
+        if link_page and not planned_pages:
+            logger.debug("Order count could not be parsed, following next page links")
+
+        # Page fetches only parse, never waiting on other futures, so they can share the pool with details requests
+        pending: Deque[concurrent.futures.Future] = collections.deque(
+            self._get_executor().submit(self._get_order_history_page, page, True, index)
+            for page, index in planned_pages
+        )
+        try:
+            while pending:
+                order_tags, link_page = deadline.result(pending[0])
+                pending.popleft()
+                current_index += len(order_tags)
+
+                yield order_tags
+        finally:
+            for future in pending:
+                future.cancel()
+
+        # If Orders were added since the count was read, the last planned page will still link to another
+        yield from self._iter_linked_order_history_pages(link_page, True, current_index, deadline)
+
+    def _plan_order_history_pages(self,
+                                  first_page: str,
+                                  first_page_response: AmazonSessionResponse,
+                                  current_index: int,
+                                  page_size: int) -> List[Tuple[str, int]]:
+        order_count = self._parse_order_count(first_page_response)
+        if not order_count or not page_size:
+            return []
+
+        return [(_with_start_index(first_page, start_index), start_index)
+                for start_index in range(current_index + page_size, order_count, page_size)]
+
+    def _iter_linked_order_history_pages(self,
+                                         next_page: Optional[str],
+                                         keep_paging: bool,
+                                         current_index: int,
+                                         deadline: util.Deadline) -> Iterator[List[Tag]]:
+        prefetch_depth = self.config.history_prefetch_depth or 0
+
+        if not keep_paging or prefetch_depth < 1:
+            while next_page:
+                deadline.check()
+                order_tags, next_page = self._get_order_history_page(next_page, keep_paging, current_index)
+                current_index += len(order_tags)
+
+                yield order_tags
 
-            order_tags = util.select(page_response.parsed,
-                                     self.config.selectors.ORDER_HISTORY_ENTITY_SELECTOR)
+            return
 
-            if not order_tags:
-                order_count_tag = util.select_one(page_response.parsed,
-                                                  self.config.selectors.ORDER_HISTORY_COUNT_SELECTOR)
-                (order_count, _) = order_count_tag.text.split(" ", 2) if order_count_tag else ("0", None)
+        # Pages are fetched on a dedicated thread (not the shared pool, which may be saturated by details requests
+        # that this thread's pages produce), so the next page is requested while the caller builds Orders from the
+        # current one. ``slots`` bounds how many fetched pages may be waiting on the caller.
+        pages: queue.Queue = queue.Queue()
+        slots = threading.Semaphore(prefetch_depth)
+        stop = threading.Event()
 
-                if order_count_tag and int(order_count) <= current_index:
+        def fetch_pages(page: Optional[str],
+                        index: int) -> None:
+            try:
+                while page:
+                    slots.acquire()
+                    if stop.is_set():
+                        return
+
+                    order_tags, page = self._get_order_history_page(page, keep_paging, index)
+                    index += len(order_tags)
+
+                    pages.put(order_tags)
+            except Exception as e:
+                pages.put(e)
+            finally:
+                pages.put(None)
+
+        threading.Thread(target=fetch_pages, args=(next_page, current_index),
+                         name="amazonorders-prefetch", daemon=True).start()
+
+        try:
+            while True:
+                page = deadline.get(pages)
+                if page is None:
                     break
-                else:
-                    raise AmazonOrdersError("Could not parse Order history. Check if Amazon changed the HTML.")
+                elif isinstance(page, Exception):
+                    raise page
 
-            for order_tag in order_tags:
-                order_tasks.append(self._async_wrapper(self._build_order, order_tag, full_details, current_index))
+                slots.release()
 
-                current_index += 1
+                yield page
+        finally:
+            stop.set()
+            slots.release()
 
-            next_page = None
-            if keep_paging:
-                next_page_tag = util.select_one(page_response.parsed,
-                                                self.config.selectors.NEXT_PAGE_LINK_SELECTOR)
-                if next_page_tag:
-                    next_page = str(next_page_tag["href"])
-                    if not next_page.startswith("http"):
-                        next_page = f"{self.config.constants.BASE_URL}{next_page}"
-                else:
-                    logger.debug("No next page")
+    def _get_order_history_page(self,
+                                page: str,
+                                keep_paging: bool,
+                                current_index: int) -> Tuple[List[Tag], Optional[str]]:
+        page_response = self.amazon_session.get(page, strip_scripts=self.config.strip_scripts)
+
+        return self._parse_order_history_page(page_response, keep_paging, current_index)
+
+    def _parse_order_history_page(self,
+                                  page_response: AmazonSessionResponse,
+                                  keep_paging: bool,
+                                  current_index: int) -> Tuple[List[Tag], Optional[str]]:
+        self.amazon_session.check_response(page_response, meta={"index": current_index})
+
+        order_tags = util.select(page_response.parsed,
+                                 self.config.selectors.ORDER_HISTORY_ENTITY_SELECTOR)
+
+        if not order_tags:
+            order_count = self._parse_order_count(page_response)
+
+            if order_count is not None and order_count <= current_index:
+                return [], None
             else:
-                logger.debug("keep_paging is False, not paging")
+                raise AmazonOrdersError("Could not parse Order history. Check if Amazon changed the HTML.")
 
-        return await asyncio.gather(*order_tasks)
+        next_page = None
+        if keep_paging:
+            next_page_tag = util.select_one(page_response.parsed,
+                                            self.config.selectors.NEXT_PAGE_LINK_SELECTOR)
+            if next_page_tag:
+                next_page = str(next_page_tag["href"])
+                if not next_page.startswith("http"):
+                    next_page = f"{self.config.constants.BASE_URL}{next_page}"
+            else:
+                logger.debug("No next page")
+        else:
+            logger.debug("keep_paging is False, not paging")
+
+        return order_tags, next_page
+
+    def _parse_order_count(self,
+                           page_response: AmazonSessionResponse) -> Optional[int]:
+        order_count_tag = util.select_one(page_response.parsed,
+                                          self.config.selectors.ORDER_HISTORY_COUNT_SELECTOR)
+        if not order_count_tag:
+            return None
+
+        try:
+            return int(order_count_tag.text.strip().split(" ", 1)[0].replace(",", ""))
+        except ValueError:
+            return None
 
     def _build_order(self,
                      order_tag: List[Tag],
                      full_details: bool,
-                     current_index: int) -> Order:
-        order: Order = self.config.order_cls(order_tag, self.config, index=current_index)
+                     current_index: int,
+                     fields: Optional[Iterable[str]] = None,
+                     detach: bool = False) -> Order:
+        order: Order = self.config.order_cls(order_tag, self.config, index=current_index, **_fields_kwargs(fields))
 
-        if full_details:
-            if len(util.select(order.parsed, self.config.selectors.ORDER_SKIP_ITEMS)) > 0:
-                logger.warning(f"Order {order.order_number} was partially populated, "
-                               f"since it is an unsupported Order type.")
-            elif not order.order_number:
-                logger.warning(f"Order at index {current_index} was partially populated, "
-                               f"since its order number could not be parsed from the history page.")
-            else:
-                order = self.get_order(order.order_number, clone=order)
+        if full_details and self._can_get_order_details(order):
+            order = self._get_order_details(order, fields)
+
+        if detach:
+            order.detach()
 
         return order
 
-    async def _async_wrapper(self,
-                             func: Callable,
-                             *args: Any) -> Order:
-        loop = asyncio.get_running_loop()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.thread_pool_size) as pool:
-            result = await loop.run_in_executor(pool, func, *args)
-        return result
+    def _get_order_details(self,
+                           order: Order,
+                           fields: Optional[Iterable[str]] = None) -> Order:
+        attempt = 0
+        while True:
+            try:
+                return self.get_order(order.order_number, clone=order, fields=fields)
+            except (AmazonOrdersError,) + _CONNECTION_ERRORS as e:
+                retry_wait = self._get_details_retry_wait(order, e, attempt)
+                if retry_wait is None:
+                    return self._with_details_error(order, e, attempt + 1)
+
+            time.sleep(retry_wait)
+            attempt += 1
+
+    async def _aget_order_details(self,
+                                  order: Order,
+                                  fields: Optional[Iterable[str]] = None) -> Order:
+        attempt = 0
+        while True:
+            try:
+                return await self.aget_order(order.order_number, clone=order, fields=fields)
+            except (AmazonOrdersError,) + _CONNECTION_ERRORS as e:
+                retry_wait = self._get_details_retry_wait(order, e, attempt)
+                if retry_wait is None:
+                    return self._with_details_error(order, e, attempt + 1)
+
+            await asyncio.sleep(retry_wait)
+            attempt += 1
+
+    def _get_details_retry_wait(self,
+                                order: Order,
+                                error: Exception,
+                                attempt: int) -> Optional[float]:
+        # The session is no longer authenticated, so no other Order's details can be fetched either
+        if isinstance(error, AmazonOrdersAuthError):
+            raise error
+
+        return self._get_retry_wait(order.order_number, error, attempt)
+
+    def _get_retry_wait(self,
+                        order_id: str,
+                        error: Exception,
+                        attempt: int) -> Optional[float]:
+        if not _is_transient_error(error) or attempt >= self.config.details_max_retries:
+            return None
+
+        # Exponential backoff, with jitter so Orders that failed together aren't all retried at once
+        retry_wait = self.config.details_retry_wait * 2 ** attempt * random.uniform(0.5, 1.5)
+        logger.debug(f"Getting details for Order {order_id} failed ({error}), retrying in {retry_wait:.2f} seconds")
+
+        return retry_wait
+
+    def _with_details_error(self,
+                            order: Order,
+                            error: Exception,
+                            attempts: int) -> Order:
+        details_error = _as_amazon_orders_error(error, f"Getting details for Order {order.order_number} failed")
+        details_error.meta = {**(details_error.meta or {}), "index": order.index, "order_number": order.order_number,
+                              "attempts": attempts}
+
+        logger.warning(f"Order {order.order_number} was partially populated, since its details could not be "
+                       f"fetched after {attempts} attempt(s): {details_error}")
+
+        # The tracebacks' frames reference the response and its parsed HTML, which would otherwise be kept alive (and
+        # pickled into a checkpoint) for as long as the Order is
+        _clear_tracebacks(details_error)
+        order.details_error = details_error
+        return order
+
+    def _needs_order_details(self,
+                             fields: Optional[Iterable[str]]) -> bool:
+        if fields is None or any(f.split(".", 1)[0] in self.config.order_cls.DETAILS_FIELDS for f in fields):
+            return True
+
+        logger.debug("No details fields were requested, so Order details will not be fetched")
+
+        return False
+
+    def _can_get_order_details(self,
+                               order: Order) -> bool:
+        if len(util.select(order.parsed, self.config.selectors.ORDER_SKIP_ITEMS)) > 0:
+            logger.warning(f"Order {order.order_number} was partially populated, "
+                           f"since it is an unsupported Order type.")
+            return False
+        elif not order.order_number:
+            logger.warning(f"Order at index {order.index} was partially populated, "
+                           f"since its order number could not be parsed from the history page.")
+            return False
+
+        return True
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.config.thread_pool_size,
+                                                                       thread_name_prefix="amazonorders")
+            return self._executor
+
+
+def _is_transient_error(error: Exception) -> bool:
+    if isinstance(error, AmazonOrdersResponseError):
+        return error.status_code == 429 or (error.status_code or 0) >= 500
+
+    return isinstance(error, (AmazonOrdersTimeoutError,) + _CONNECTION_ERRORS) and \
+        not isinstance(error, AmazonOrdersDeadlineError)
+
+
+def _as_amazon_orders_error(error: Exception,
+                            message: str) -> AmazonOrdersError:
+    if isinstance(error, AmazonOrdersError):
+        return error
+
+    amazon_orders_error = AmazonOrdersError(f"{message}: {error}")
+    amazon_orders_error.__cause__ = error
+    return amazon_orders_error
+
+
+def _clear_tracebacks(error: BaseException) -> None:
+    # Clear the tracebacks of the error and of those it was raised from, guarding against a cycle in the chain
+    chained_error: Optional[BaseException] = error
+    seen = set()
+    while chained_error is not None and id(chained_error) not in seen:
+        seen.add(id(chained_error))
+        chained_error.__traceback__ = None
+        chained_error = chained_error.__cause__ or chained_error.__context__
+
+
+def _to_order_error(order_id: str,
+                    error: Exception,
+                    attempts: int) -> AmazonOrdersError:
+    order_error = _as_amazon_orders_error(error, f"Getting Order {order_id} failed")
+    order_error.meta = {**(order_error.meta or {}), "order_id": order_id, "attempts": attempts}
+
+    logger.debug(f"Order {order_id} could not be fetched after {attempts} attempt(s)", exc_info=error)
+
+    return order_error
+
+
+def _fields_kwargs(fields: Optional[Iterable[str]]) -> Dict[str, Any]:
+    # Only pass ``fields`` when given, so custom ``order_class``'s that don't accept it still work without it
+    return {} if fields is None else {"fields": fields}
+
+
+def _with_start_index(url: str,
+                      start_index: int) -> str:
+    parsed_url = urllib.parse.urlsplit(url)
+    query = [(key, value) for key, value in urllib.parse.parse_qsl(parsed_url.query, keep_blank_values=True)
+             if key not in ("startIndex", "ref_")]
+    query.append(("startIndex", str(start_index)))
+
+    return urllib.parse.urlunsplit(parsed_url._replace(query=urllib.parse.urlencode(query)))
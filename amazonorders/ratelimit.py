@@ -0,0 +1,111 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter for requests to Amazon, shared by all threads (and event loops) using an
+    :class:`~amazonorders.session.AmazonSession`. Requests are limited both by a token bucket, refilled at
+    :attr:`rate` requests per second, and by a maximum number of requests in flight.
+
+    :attr:`rate` adapts to how Amazon responds (AIMD): each successful request increases it by
+    :attr:`ADDITIVE_INCREASE`, up to ``max_rate``, and each throttled request (ex. a ``429``, a ``5xx``, or a bot
+    check page) multiplies it by :attr:`MULTIPLICATIVE_DECREASE`, down to ``min_rate``.
+    """
+
+    #: The number of requests per second :attr:`rate` is increased by after a successful request.
+    ADDITIVE_INCREASE = 0.1
+    #: The factor :attr:`rate` is multiplied by after a throttled request.
+    MULTIPLICATIVE_DECREASE = 0.5
+
+    def __init__(self,
+                 max_rate: float,
+                 min_rate: float,
+                 max_in_flight: Optional[int] = None) -> None:
+        #: The maximum number of requests per second.
+        self.max_rate: float = max_rate
+        #: The minimum number of requests per second, regardless of how many requests are throttled.
+        self.min_rate: float = min(min_rate, max_rate)
+        #: The maximum number of requests in flight at a time, ``None`` for no limit.
+        self.max_in_flight: Optional[int] = max_in_flight
+        #: The current number of requests per second.
+        self.rate: float = max_rate
+
+        self._burst: float = max(1.0, max_rate)
+        self._tokens: float = self._burst
+        self._updated_at: float = time.monotonic()
+        self._decreased_at: float = 0.0
+        self._in_flight: int = 0
+        self._condition: threading.Condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """
+        Block until a request may be made. Every call must be followed by a call to :func:`release` once the
+        request completes.
+        """
+        with self._condition:
+            while True:
+                wait = self._try_acquire()
+                if wait == 0:
+                    return
+                self._condition.wait(wait)
+
+    async def aacquire(self) -> None:
+        """
+        The ``async`` equivalent of :func:`acquire`, which waits without blocking the event loop.
+        """
+        while True:
+            with self._condition:
+                wait = self._try_acquire()
+            if wait == 0:
+                return
+            await asyncio.sleep(wait)
+
+    def release(self,
+                throttled: bool = False) -> None:
+        """
+        Mark a request acquired with :func:`acquire` as complete, adapting :attr:`rate` to its outcome.
+
+        :param throttled: ``True`` if Amazon throttled the request.
+        """
+        with self._condition:
+            self._in_flight -= 1
+
+            if throttled:
+                # Only back off once per interval, so a burst of concurrent throttled requests (all sent at the old
+                # rate) is treated as a single signal
+                now = time.monotonic()
+                if now - self._decreased_at >= 1.0 / self.rate:
+                    self._decreased_at = now
+                    self.rate = max(self.min_rate, self.rate * self.MULTIPLICATIVE_DECREASE)
+                    self._tokens = min(self._tokens, 1.0)
+
+                    logger.debug(f"Request throttled, reduced rate to {self.rate:.2f} requests per second")
+            else:
+                self.rate = min(self.max_rate, self.rate + self.ADDITIVE_INCREASE)
+
+            self._condition.notify()
+
+    def _try_acquire(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+        if self.max_in_flight and self._in_flight >= self.max_in_flight:
+            # Woken by ``release()`` when waiting synchronously, otherwise poll
+            return 1.0 / self.max_rate
+        elif self._tokens < 1.0:
+            return (1.0 - self._tokens) / self.rate
+
+        self._tokens -= 1.0
+        self._in_flight += 1
+
+        return 0
@@ -1,26 +1,43 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
-import json
+import asyncio
+import functools
+import itertools
 import logging
 import os
+import random
+import re
 import time
-from typing import Any, List, Optional, Dict
-from urllib.parse import urlencode, urlparse
+from typing import Any, List, Optional, Dict, Tuple
+from urllib.parse import urlencode
 
 import requests
 import requests.adapters
 from requests import Response, Session
+from requests.structures import CaseInsensitiveDict
 from requests.utils import dict_from_cookiejar
 
-from amazonorders.conf import AmazonOrdersConfig, config_file_lock, cookies_file_lock, debug_output_file_lock
-from amazonorders.exception import AmazonOrdersAuthError, AmazonOrdersError, AmazonOrdersAuthRedirectError
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+from amazonorders.capture import DebugCaptureWriter
+from amazonorders.conf import AmazonOrdersConfig, config_file_lock
+from amazonorders.cookies import CookieJarPersister
+from amazonorders.exception import (AmazonOrdersAuthError, AmazonOrdersError, AmazonOrdersAuthRedirectError,
+                                    AmazonOrdersResponseError, AmazonOrdersTimeoutError)
 from amazonorders.forms import (AuthForm, CaptchaForm, JSAuthBlocker, MfaDeviceSelectForm, MfaForm,
                                 SignInForm, ClaimForm, IntentForm)
-from amazonorders.util import AmazonSessionResponse, load_class
+from amazonorders.ratelimit import RateLimiter
+from amazonorders.util import AmazonSessionResponse, load_class, select_one
 
 logger = logging.getLogger(__name__)
 
+# Bot check pages are small, so larger pages (ex. Order history and details) aren't scanned for them
+_BOT_CHECK_MAX_CONTENT_LENGTH = 64 * 1024
+
 
 class IODefault:
     """
@@ -129,17 +146,26 @@ class AmazonSession:
         self.session: Session = self._create_session()
         #: If :func:`login` has been executed and successfully logged in the session.
         self.is_authenticated: bool = False
+        #: The rate limiter shared by all requests on the session, populated when ``rate_limit`` is enabled in the
+        #: config.
+        self.rate_limiter: Optional[RateLimiter] = RateLimiter(
+            max_rate=self.config.rate_limit_max_requests_per_second,
+            min_rate=self.config.rate_limit_min_requests_per_second,
+            max_in_flight=self.config.rate_limit_max_in_flight) if self.config.rate_limit else None
+
+        #: Writes the pages captured when :attr:`debug` is enabled, populated on the first capture.
+        self.debug_capture_writer: Optional[DebugCaptureWriter] = None
+
+        self._async_client: Optional[Tuple[asyncio.AbstractEventLoop, "httpx.AsyncClient"]] = None
 
         cookie_dir = os.path.dirname(self.config.cookie_jar_path)
         with config_file_lock:
             if not os.path.exists(cookie_dir):
                 os.makedirs(cookie_dir)
-        with cookies_file_lock:
-            if os.path.exists(self.config.cookie_jar_path):
-                with open(self.config.cookie_jar_path, "r", encoding="utf-8") as f:
-                    data = json.loads(f.read())
-                    cookies = requests.utils.cookiejar_from_dict(data)
-                    self.session.cookies.update(cookies)
+        #: Persists the session's cookies to ``cookie_jar_path``, safely shared with other sessions and processes.
+        self.cookie_persister: CookieJarPersister = CookieJarPersister(self.config.cookie_jar_path,
+                                                                       delay=self.config.cookie_persist_delay)
+        self.session.cookies.update(requests.utils.cookiejar_from_dict(self.cookie_persister.load()))
 
     @staticmethod
     def default_auth_forms(config: AmazonOrdersConfig) -> List[AuthForm]:
@@ -171,6 +197,8 @@ class AmazonSession:
                 method: str,
                 url: str,
                 persist_cookies: bool = False,
+                parse: bool = True,
+                strip_scripts: bool = False,
                 **kwargs: Any) -> AmazonSessionResponse:
         """
         Execute the request against Amazon with base headers, parsing and storing the response.
@@ -178,9 +206,123 @@ class AmazonSession:
         :param method: The request method to execute.
         :param url: The URL to execute ``method`` on.
         :param persist_cookies: If ``True``, cookies from the response will be persisted to a file.
-        :param kwargs: Remaining ``kwargs`` will be passed to :func:`requests.request`.
+        :param parse: If ``False``, the response is raw-only, and its HTML will never be parsed. Otherwise, it is
+            parsed the first time :attr:`~amazonorders.util.AmazonSessionResponse.parsed` is accessed.
+        :param strip_scripts: If ``True``, ``<script>`` and ``<style>`` blocks (except those matching
+            ``KEEP_SCRIPT_TAG_REGEX``) are removed from the response before it is parsed.
+        :param kwargs: Remaining ``kwargs`` will be passed to :func:`requests.request`. If no ``timeout`` is given,
+            ``request_connect_timeout`` and ``request_read_timeout`` from the config are used.
         :return: The response from the executed request.
         """
+        url_to_log = self._prepare_request(method, url, kwargs)
+        kwargs.setdefault("timeout", (self.config.request_connect_timeout, self.config.request_read_timeout))
+
+        for attempt in itertools.count():
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            response = None
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.Timeout as e:
+                raise AmazonOrdersTimeoutError(f"The request to {url_to_log} timed out.", meta={"url": url}) from e
+            finally:
+                if self.rate_limiter:
+                    self.rate_limiter.release(throttled=self._is_throttled(response))
+
+            retry_wait = self._get_retry_wait(response, attempt)
+            if retry_wait is None:
+                break
+
+            logger.debug(f"Request throttled with {response.status_code}, retrying in {retry_wait:.2f} seconds")
+            time.sleep(retry_wait)
+
+        return self._process_response(response, url_to_log, persist_cookies, parse, strip_scripts)
+
+    async def arequest(self,
+                       method: str,
+                       url: str,
+                       persist_cookies: bool = False,
+                       parse: bool = True,
+                       strip_scripts: bool = False,
+                       **kwargs: Any) -> AmazonSessionResponse:
+        """
+        The ``async`` equivalent of :func:`request`, sharing the same cookies and headers.
+
+        When ``httpx`` is installed (``pip install amazon-orders[httpx]``), requests are multiplexed on the running
+        event loop. Otherwise, :func:`request` is executed on the loop's default executor.
+
+        :param method: The request method to execute.
+        :param url: The URL to execute ``method`` on.
+        :param persist_cookies: If ``True``, cookies from the response will be persisted to a file.
+        :param parse: If ``False``, the response is raw-only, and its HTML will never be parsed.
+        :param strip_scripts: If ``True``, ``<script>`` and ``<style>`` blocks are removed before parsing.
+        :param kwargs: Remaining ``kwargs`` will be passed to :func:`httpx.AsyncClient.request`. If no ``timeout``
+            is given, ``request_connect_timeout`` and ``request_read_timeout`` from the config are used.
+        :return: The response from the executed request.
+        """
+        if httpx is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, functools.partial(self.request, method, url,
+                                                                      persist_cookies=persist_cookies, parse=parse,
+                                                                      strip_scripts=strip_scripts, **kwargs))
+
+        url_to_log = self._prepare_request(method, url, kwargs)
+        kwargs.setdefault("timeout", httpx.Timeout(self.config.request_read_timeout,
+                                                   connect=self.config.request_connect_timeout))
+
+        for attempt in itertools.count():
+            if self.rate_limiter:
+                await self.rate_limiter.aacquire()
+            response = None
+            try:
+                response = _to_requests_response(await self._get_async_client().request(method, url, **kwargs))
+            except httpx.TimeoutException as e:
+                raise AmazonOrdersTimeoutError(f"The request to {url_to_log} timed out.", meta={"url": url}) from e
+            finally:
+                if self.rate_limiter:
+                    self.rate_limiter.release(throttled=self._is_throttled(response))
+
+            retry_wait = self._get_retry_wait(response, attempt)
+            if retry_wait is None:
+                break
+
+            logger.debug(f"Request throttled with {response.status_code}, retrying in {retry_wait:.2f} seconds")
+            await asyncio.sleep(retry_wait)
+
+        return self._process_response(response, url_to_log, persist_cookies, parse, strip_scripts)
+
+    def _is_throttled(self,
+                      response: Optional[Response]) -> bool:
+        if response is None or response.status_code == 429 or response.status_code >= 500:
+            return True
+
+        if len(response.content) > _BOT_CHECK_MAX_CONTENT_LENGTH:
+            return False
+
+        # Search the raw bytes, so the page isn't decoded an extra time just to be checked
+        return re.search(self.config.constants.BOT_CHECK_TEXT_REGEX.encode("utf-8"), response.content) is not None
+
+    def _get_retry_wait(self,
+                        response: Response,
+                        attempt: int) -> Optional[float]:
+        if not self.rate_limiter or attempt >= self.config.rate_limit_max_retries or \
+                (response.status_code != 429 and response.status_code < 500):
+            return None
+
+        # Capped at the longest backoff, so a large Retry-After can't stall a thread for as long as it asks
+        max_retry_wait = self.config.rate_limit_retry_wait * 2 ** self.config.rate_limit_max_retries
+
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), max_retry_wait)
+
+        # Exponential backoff, with jitter so concurrent retries don't all land at once
+        return self.config.rate_limit_retry_wait * 2 ** attempt * random.uniform(0.5, 1.5)
+
+    def _prepare_request(self,
+                         method: str,
+                         url: str,
+                         kwargs: Dict[str, Any]) -> str:
         if "headers" not in kwargs:
             kwargs["headers"] = {}
         kwargs["headers"].update(self.config.constants.BASE_HEADERS)
@@ -193,15 +335,22 @@ class AmazonSession:
                     url_to_log += "?" + encoded_params
             logger.debug(f"{method} request: {url_to_log}")
 
-        response = self.session.request(method, url, **kwargs)
+        return url_to_log
+
+    def _process_response(self,
+                          response: Response,
+                          url_to_log: str,
+                          persist_cookies: bool,
+                          parse: bool = True,
+                          strip_scripts: bool = False) -> AmazonSessionResponse:
         amazon_session_response = AmazonSessionResponse(response,
-                                                        self.config.bs4_parser)
+                                                        self.config.bs4_parser,
+                                                        parse=parse,
+                                                        strip_scripts=strip_scripts,
+                                                        keep_script_regex=self.config.constants.KEEP_SCRIPT_TAG_REGEX)
 
         if persist_cookies:
-            cookies = dict_from_cookiejar(self.session.cookies)
-            with cookies_file_lock:
-                with open(self.config.cookie_jar_path, "w", encoding="utf-8") as f:
-                    f.write(json.dumps(cookies))
+            self.cookie_persister.persist(dict_from_cookiejar(self.session.cookies))
 
         if self.debug:
             url_str = ""
@@ -209,12 +358,9 @@ class AmazonSession:
                 url_str = f" - (redirected) {amazon_session_response.response.url}"
             logger.debug(f"Response: {amazon_session_response.response.status_code}{url_str}")
 
-            page_name = self._get_page_from_url(self.config.output_dir, amazon_session_response.response.url)
-            with open(os.path.join(self.config.output_dir, page_name), "w",
-                      encoding="utf-8") as html_file:
-                logger.debug(
-                    f"Response written to file: {html_file.name}")
-                html_file.write(amazon_session_response.response.text)
+            path = self._get_debug_capture_writer().capture(amazon_session_response.response.url,
+                                                            amazon_session_response.response.text)
+            logger.debug(f"Response queued to be written to file: {path}")
 
         return amazon_session_response
 
@@ -242,6 +388,40 @@ class AmazonSession:
         """
         return self.request("POST", url, **kwargs)
 
+    async def aget(self,
+                   url: str,
+                   **kwargs: Any) -> AmazonSessionResponse:
+        """
+        Perform an ``async`` ``GET`` request.
+
+        :param url: The URL to request.
+        :param kwargs: Remaining ``kwargs`` will be passed to :func:`AmazonSession.arequest`.
+        :return: The response from the executed request.
+        """
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self,
+                    url: str,
+                    **kwargs: Any) -> AmazonSessionResponse:
+        """
+        Perform an ``async`` ``POST`` request.
+
+        :param url: The URL to request.
+        :param kwargs: Remaining ``kwargs`` will be passed to :func:`AmazonSession.arequest`.
+        :return: The response from the executed request.
+        """
+        return await self.arequest("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """
+        Close the ``async`` HTTP client used by :func:`arequest`, if one was opened on the running event loop.
+        """
+        if self._async_client is not None:
+            loop, client = self._async_client
+            self._async_client = None
+            if loop is asyncio.get_running_loop():
+                await client.aclose()
+
     def auth_cookies_stored(self) -> bool:
         cookies = dict_from_cookiejar(self.session.cookies)
         for cookie in self.config.constants.COOKIES_SET_WHEN_AUTHENTICATED:
@@ -307,21 +487,26 @@ class AmazonSession:
                 "Authentication attempts exhausted. If authentication is correct, "
                 "try increasing AmazonOrdersConfig.max_auth_attempts.")
 
+        # Authenticated cookies are persisted now, rather than when the delay elapses, so other processes can use them
+        self.cookie_persister.flush()
+
     def logout(self) -> None:
         """
         Logout and close the existing Amazon session and clear cookies.
         """
-        self.get(self.config.constants.SIGN_OUT_URL, persist_cookies=True)
+        # Only the cookies set by signing out are needed, so the page is never parsed
+        self.get(self.config.constants.SIGN_OUT_URL, persist_cookies=True, parse=False)
         self.session.close()
         self.session = self._create_session()
+        # The async client shares the old session's cookie jar, so it is discarded and lazily rebuilt on next use
+        self._async_client = None
 
         # Ensure authentication cookies are unset, since we can get inconsistent persistence behavior otherwise
-        with cookies_file_lock:
-            cookies = dict_from_cookiejar(self.session.cookies)
-            for cookie in self.config.constants.COOKIES_SET_WHEN_AUTHENTICATED:
-                cookies.pop(cookie, None)
-            with open(self.config.cookie_jar_path, "w") as f:
-                f.write(json.dumps(cookies))
+        cookies = dict_from_cookiejar(self.session.cookies)
+        for cookie in self.config.constants.COOKIES_SET_WHEN_AUTHENTICATED:
+            cookies.pop(cookie, None)
+        self.cookie_persister.persist(cookies, replace=True)
+        self.cookie_persister.flush()
 
         self.is_authenticated = False
 
@@ -351,28 +536,24 @@ class AmazonSession:
         :param meta: Metadata to be added to any errors raised.
         """
         if not amazon_session_response.response.ok:
-            raise AmazonOrdersError(self.build_response_error(amazon_session_response.response), meta=meta)
+            raise AmazonOrdersResponseError(self.build_response_error(amazon_session_response.response), meta=meta,
+                                            status_code=amazon_session_response.response.status_code)
         if (amazon_session_response.response.url.startswith(self.config.constants.SIGN_IN_URL) or
-                (amazon_session_response.parsed and
-                 amazon_session_response.parsed.select_one(self.config.selectors.SIGN_IN_FORM_SELECTOR) is not None)):
+                (self._may_contain_sign_in_form(amazon_session_response) and
+                 amazon_session_response.parsed and
+                 select_one(amazon_session_response.parsed,
+                            self.config.selectors.SIGN_IN_FORM_SELECTOR) is not None)):
             logger.debug("Amazon redirect to login, so persisted AmazonSession will be logged out.")
             self.logout()
             raise AmazonOrdersAuthRedirectError("Amazon redirected to login. Call AmazonSession.login() to "
                                                 "reauthenticate first.", meta=meta)
 
-    def _get_page_from_url(self,
-                           output_dir: str,
-                           url: str) -> str:
-        page_name = os.path.splitext(os.path.basename(urlparse(url).path))[0]
-        if not page_name:
-            page_name = "index"
-
-        with debug_output_file_lock:
-            i = 0
-            filename_frmt = "{page_name}_{index}.html"
-            while os.path.isfile(os.path.join(output_dir, filename_frmt.format(page_name=page_name, index=i))):
-                i += 1
-        return filename_frmt.format(page_name=page_name, index=i)
+    def _may_contain_sign_in_form(self,
+                                  amazon_session_response: AmazonSessionResponse) -> bool:
+        # Check the raw bytes first, so a page that can't contain the form isn't parsed just to look for it
+        return amazon_session_response.is_parsed or re.search(
+            self.config.constants.SIGN_IN_FORM_TEXT_REGEX.encode("utf-8"),
+            amazon_session_response.response.content) is not None
 
     def _raise_auth_error(self,
                           response: Response) -> None:
@@ -394,6 +575,26 @@ class AmazonSession:
         session.mount('https://', adapter)
         return session
 
+    def _get_debug_capture_writer(self) -> DebugCaptureWriter:
+        # debug can be enabled after the session is created, so the writer (and its thread) is only created if needed
+        if self.debug_capture_writer is None:
+            self.debug_capture_writer = DebugCaptureWriter(self.config.output_dir,
+                                                           compression=self.config.debug_output_compression,
+                                                           max_files=self.config.debug_output_max_files,
+                                                           max_bytes=self.config.debug_output_max_bytes)
+        return self.debug_capture_writer
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        loop = asyncio.get_running_loop()
+        # An httpx client's connection pool is bound to the loop it was first used on, so a new one is needed if
+        # this is called from a different loop (for instance, across separate asyncio.run() calls)
+        if self._async_client is None or self._async_client[0] is not loop:
+            client = httpx.AsyncClient(cookies=self.session.cookies,
+                                       follow_redirects=True,
+                                       limits=httpx.Limits(max_connections=self.config.connection_pool_size))
+            self._async_client = (loop, client)
+        return self._async_client[1]
+
     def _process_forms(self, last_response):
         for form in self.auth_forms:
             if form.select_form(self, last_response.parsed):
@@ -409,7 +610,7 @@ class AmazonSession:
         # don't implement this logic, Amazon will sometimes return a mobile version of teh site (regardless of
         # User-Agent headers)
         while last_response is None or \
-                (last_response.parsed.select_one(self.config.selectors.BAD_INDEX_SELECTOR) is not None
+                (select_one(last_response.parsed, self.config.selectors.BAD_INDEX_SELECTOR) is not None
                  and attempts < self.config.max_cookie_attempts):
             if attempts > 0:
                 logger.debug(f"Retrying cookie provisioning, attempt {attempts} in "
@@ -427,3 +628,14 @@ class AmazonSession:
             raise AmazonOrdersAuthError("Amazon is not returning a parsable home page. Try waiting a while, "
                                         "increasing AmazonOrdersConfig.max_cookie_attempts, or using a different IP "
                                         "address, as this one may be flagged as a bot.")
+
+
+def _to_requests_response(response: "httpx.Response") -> Response:
+    requests_response = Response()
+    requests_response.status_code = response.status_code
+    requests_response.headers = CaseInsensitiveDict(response.headers)
+    requests_response.url = str(response.url)
+    requests_response.encoding = response.encoding
+    requests_response.reason = response.reason_phrase
+    requests_response._content = response.content
+    return requests_response
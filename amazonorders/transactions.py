@@ -3,22 +3,25 @@ __license__ = "MIT"
 
 import datetime
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import urllib.parse
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 
 from bs4 import Tag
-from dateutil import parser
 
 from amazonorders import util
+from amazonorders.checkpoint import Checkpoint
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.transaction import Transaction
-from amazonorders.exception import AmazonOrdersError
+from amazonorders.exception import AmazonOrdersDeadlineError, AmazonOrdersError
 from amazonorders.session import AmazonSession
+from amazonorders.util import AmazonSessionResponse
 
 logger = logging.getLogger(__name__)
 
 
 def _parse_transaction_form_tag(form_tag: Tag,
-                                config: AmazonOrdersConfig) \
+                                config: AmazonOrdersConfig,
+                                fields: Optional[Iterable[str]] = None) \
         -> Tuple[List[Transaction], Optional[Dict[str, str]]]:
     transactions = []
     date_container_tags = util.select(form_tag, config.selectors.TRANSACTION_DATE_CONTAINERS_SELECTOR)
@@ -28,8 +31,10 @@ def _parse_transaction_form_tag(form_tag: Tag,
             logger.warning("Could not find date tag in Transaction form.")
             continue
 
-        date_str = date_tag.text
-        date = parser.parse(date_str).date()
+        date = util.parse_date(date_tag.text.strip(), config.constants.DATE_DAY_FIRST, fuzzy=False)
+        if not date:
+            raise AmazonOrdersError(f"Could not parse Transaction date \"{date_tag.text.strip()}\". Check if Amazon "
+                                    f"changed the HTML.")
 
         transactions_container_tag = date_container_tag.find_next_sibling(
             config.selectors.TRANSACTIONS_CONTAINER_SELECTOR)
@@ -39,7 +44,7 @@ def _parse_transaction_form_tag(form_tag: Tag,
 
         transaction_tags = util.select(transactions_container_tag, config.selectors.TRANSACTIONS_SELECTOR)
         for transaction_tag in transaction_tags:
-            transaction = Transaction(transaction_tag, config, date)
+            transaction = Transaction(transaction_tag, config, date, fields)
             transactions.append(transaction)
 
     form_state_input = util.select_one(form_tag, config.selectors.TRANSACTIONS_NEXT_PAGE_INPUT_STATE_SELECTOR)
@@ -85,7 +90,11 @@ class AmazonTransactions:
     def get_transactions(self,
                          days: int = 365,
                          next_page_data: Optional[Dict[str, Any]] = None,
-                         keep_paging: bool = True) -> List[Transaction]:
+                         keep_paging: bool = True,
+                         fields: Optional[Iterable[str]] = None,
+                         detach: bool = False,
+                         deadline: Optional[float] = None,
+                         resume: bool = False) -> List[Transaction]:
         """
         Get Amazon Transaction history for a given number of days.
 
@@ -93,45 +102,160 @@ class AmazonTransactions:
         :param next_page_data: If a call to this method previously errored out, passing the exception's
             :attr:`~amazonorders.exception.AmazonOrdersError.meta` will continue paging where it left off.
         :param keep_paging: ``False`` if only one page should be fetched.
+        :param fields: Only parse these fields when building each Transaction (see
+            :class:`~amazonorders.entity.parsable.Parsable`), any others are parsed on first access.
+        :param detach: Drop each Transaction's references to the parsed history page once it is built (see
+            :func:`~amazonorders.entity.parsable.Parsable.detach`), so pages can be garbage collected as history is
+            paged.
+        :param deadline: The number of seconds to allow for the Transactions to be fetched. If it's exceeded,
+            :class:`~amazonorders.exception.AmazonOrdersDeadlineError` is raised, with the Transactions fetched so far
+            in its ``results``, and its ``meta`` can be passed as ``next_page_data`` to continue where it left off.
+        :param resume: Checkpoint the Transactions to ``checkpoint_dir`` as each page is parsed (see
+            :class:`~amazonorders.checkpoint.Checkpoint`), and if a previous call with the same parameters was
+            interrupted (ex. it crashed, was killed, or exceeded its ``deadline``), continue from its checkpoint, so
+            pages it already fetched are not fetched again. The checkpoint is deleted once the Transactions have been
+            fetched.
         :return: A list of the requested Transactions.
         """
         if not self.amazon_session.is_authenticated:
             raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
 
+        budget = util.Deadline(deadline)
         min_date = datetime.date.today() - datetime.timedelta(days=days)
+        fields = set(fields) if fields is not None else None
 
         transactions: List[Transaction] = []
         first_page = True
-        while first_page or keep_paging:
-            first_page = False
-
-            page_response = self.amazon_session.post(self.config.constants.TRANSACTION_HISTORY_URL,
-                                                     data=next_page_data)
-            self.amazon_session.check_response(page_response, meta=next_page_data)
-
-            form_tag = util.select_one(page_response.parsed,
-                                       self.config.selectors.TRANSACTION_HISTORY_FORM_SELECTOR)
-
-            if not form_tag:
-                transaction_container = util.select_one(page_response.parsed,
-                                                        self.config.selectors.TRANSACTION_HISTORY_CONTAINER_SELECTOR)
-                if transaction_container and "don't have any transactions" in transaction_container.text:
-                    break
-                else:
-                    raise AmazonOrdersError("Could not parse Transaction history. Check if Amazon changed the HTML.")
-
-            loaded_transactions, next_page_data = (
-                _parse_transaction_form_tag(form_tag, self.config)
-            )
-
-            for transaction in loaded_transactions:
-                if transaction.completed_date >= min_date:
-                    transactions.append(transaction)
-                else:
-                    next_page_data = None
-                    break
-
-            if not next_page_data:
-                keep_paging = False
+        checkpoint = None
+        if resume:
+            checkpoint = Checkpoint(self.config, "transactions", {
+                "account": self._get_checkpoint_account(),
+                "days": days,
+                "next_page_data": next_page_data,
+                "keep_paging": keep_paging,
+                "fields": sorted(fields) if fields is not None else None,
+            })
+            records = checkpoint.load()
+            for _, page_transactions in records:
+                transactions.extend(page_transactions)  # type: ignore[arg-type]
+            if records:
+                first_page = False
+                next_page_data = records[-1][0]
+                keep_paging = keep_paging and bool(next_page_data)
+                logger.debug(f"Resuming Transactions from checkpoint with {len(transactions)} Transactions")
+
+        try:
+            while first_page or keep_paging:
+                first_page = False
+
+                budget.check()
+                page_response = self.amazon_session.post(self.config.constants.TRANSACTION_HISTORY_URL,
+                                                         data=next_page_data)
+                page_start = len(transactions)
+                next_page_data = self._parse_transactions_page(page_response, next_page_data, min_date,
+                                                               transactions, fields, detach)
+                if checkpoint:
+                    checkpoint.append(next_page_data, transactions[page_start:])
+
+                if not next_page_data:
+                    keep_paging = False
+        except AmazonOrdersDeadlineError as e:
+            e.meta = next_page_data
+            e.results = transactions
+            raise
+        finally:
+            if checkpoint:
+                checkpoint.close()
+
+        if checkpoint:
+            checkpoint.clear()
 
         return transactions
+
+    async def aget_transactions(self,
+                                days: int = 365,
+                                next_page_data: Optional[Dict[str, Any]] = None,
+                                keep_paging: bool = True,
+                                fields: Optional[Iterable[str]] = None,
+                                detach: bool = False,
+                                deadline: Optional[float] = None) -> List[Transaction]:
+        """
+        The ``async`` equivalent of :func:`get_transactions`, safe to call from an already running event loop.
+
+        :param days: The number of days worth of Transactions to get.
+        :param next_page_data: If a call to this method previously errored out, passing the exception's
+            :attr:`~amazonorders.exception.AmazonOrdersError.meta` will continue paging where it left off.
+        :param keep_paging: ``False`` if only one page should be fetched.
+        :param fields: Only parse these fields when building each Transaction (see
+            :class:`~amazonorders.entity.parsable.Parsable`), any others are parsed on first access.
+        :param detach: Drop each Transaction's references to the parsed history page once it is built (see
+            :func:`~amazonorders.entity.parsable.Parsable.detach`), so pages can be garbage collected as history is
+            paged.
+        :param deadline: The number of seconds to allow for the Transactions to be fetched, see
+            :func:`get_transactions`.
+        :return: A list of the requested Transactions.
+        """
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        budget = util.Deadline(deadline)
+        min_date = datetime.date.today() - datetime.timedelta(days=days)
+        fields = set(fields) if fields is not None else None
+
+        transactions: List[Transaction] = []
+        first_page = True
+        try:
+            while first_page or keep_paging:
+                first_page = False
+
+                page_response = await budget.wait_for(
+                    self.amazon_session.apost(self.config.constants.TRANSACTION_HISTORY_URL, data=next_page_data))
+                next_page_data = self._parse_transactions_page(page_response, next_page_data, min_date,
+                                                               transactions, fields, detach)
+
+                if not next_page_data:
+                    keep_paging = False
+        except AmazonOrdersDeadlineError as e:
+            e.meta = next_page_data
+            e.results = transactions
+            raise
+
+        return transactions
+
+    def _get_checkpoint_account(self) -> str:
+        domain = urllib.parse.urlsplit(self.config.constants.BASE_URL).netloc
+        return f"{self.amazon_session.username}@{domain}"
+
+    def _parse_transactions_page(self,
+                                 page_response: AmazonSessionResponse,
+                                 page_data: Optional[Dict[str, Any]],
+                                 min_date: datetime.date,
+                                 transactions: List[Transaction],
+                                 fields: Optional[Iterable[str]] = None,
+                                 detach: bool = False) -> Optional[Dict[str, str]]:
+        self.amazon_session.check_response(page_response, meta=page_data)
+
+        form_tag = util.select_one(page_response.parsed,
+                                   self.config.selectors.TRANSACTION_HISTORY_FORM_SELECTOR)
+
+        if not form_tag:
+            transaction_container = util.select_one(page_response.parsed,
+                                                    self.config.selectors.TRANSACTION_HISTORY_CONTAINER_SELECTOR)
+            if transaction_container and "don't have any transactions" in transaction_container.text:
+                return None
+            else:
+                raise AmazonOrdersError("Could not parse Transaction history. Check if Amazon changed the HTML.")
+
+        loaded_transactions, next_page_data = (
+            _parse_transaction_form_tag(form_tag, self.config, fields)
+        )
+
+        for transaction in loaded_transactions:
+            if transaction.completed_date >= min_date:
+                if detach:
+                    transaction.detach()
+                transactions.append(transaction)
+            else:
+                return None
+
+        return next_page_data
@@ -1,29 +1,251 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import asyncio
+import calendar
+import concurrent.futures
+import contextlib
+import functools
 import importlib
 import logging
+import os
+import queue
 import re
-from typing import List, Union, Optional, Callable, Any
+import tempfile
+import threading
+import time
+from datetime import date
+from typing import Awaitable, List, Union, Optional, Callable, Any, Iterator
 
 from bs4 import Tag, BeautifulSoup
+from dateutil import parser
 from requests import Response
 
+from amazonorders.exception import AmazonOrdersDeadlineError, AmazonOrdersError
 from amazonorders.selectors import Selector
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Unrolled, rather than a lazy ``.*?``, so the (often very long) contents of a block are consumed a run at a time
+_SCRIPT_TAG_RE = re.compile(r"<(script|style)\b([^>]*)>[^<]*(?:<(?!/\1\s*>)[^<]*)*</\1\s*>", re.IGNORECASE)
+
+# An amount split at its number, which starts at the first digit and can't be followed by a separator, so the split is
+# unambiguous (and linear)
+_AMOUNT_RE = re.compile(r"(\D*)(\d[\d.,\u00a0\u202f]*)((?:[^\d.,\u00a0\u202f]\D*)?)")
+# A currency symbol or code (ex. ``$``, ``CDN$``, ``Rs.``, or ``EUR``) before or after an amount's number
+_CURRENCY_RE = re.compile(r"[$£€₹¥]*(?:[^\W\d_]+\.?[$£€₹¥]*)?")
+_CURRENCY_SYMBOLS = frozenset(["", "$", "£", "€", "₹", "¥"])
+_NEGATIVE_SIGNS = frozenset(["-", "\u2212"])
+_SIGNS = _NEGATIVE_SIGNS | {"+"}
+
+# The formats Amazon renders dates in, ex. ``October 5, 2023`` (or ``Oct 5, 2023``) and ``5 October 2023``
+_DATE_MONTH_FIRST_RE = re.compile(r"\b([A-Za-z]{3,9})\.?\s+(\d{1,2}),?\s+(\d{4})\b")
+_DATE_DAY_FIRST_RE = re.compile(r"\b(\d{1,2})\.?\s+([A-Za-z]{3,9})\.?,?\s+(\d{4})\b")
+_MONTHS = {name: i for i, month in enumerate(["january", "february", "march", "april", "may", "june", "july",
+                                              "august", "september", "october", "november", "december"], 1)
+           for name in (month, month[:3])}
+_MONTHS["sept"] = 9
+
 
 class AmazonSessionResponse:
     """
     A wrapper for the :class:`requests.Response` object, which also contains the parsed HTML.
+
+    The HTML is not parsed until :attr:`parsed` is first accessed, so responses that are only inspected for their
+    status or URL never pay for a parse. If ``parse`` is ``False``, the response is raw-only, and :attr:`parsed` is
+    always ``None``.
     """
 
-    def __init__(self, response: Response, bs4_parser: str) -> None:
+    def __init__(self,
+                 response: Response,
+                 bs4_parser: str,
+                 parse: bool = True,
+                 strip_scripts: bool = False,
+                 keep_script_regex: Optional[str] = None) -> None:
         #: The request's response object.
         self.response: Response = response
-        #: The parsed HTML from the response.
-        self.parsed: Tag = BeautifulSoup(self.response.text, bs4_parser)
+        #: The BeautifulSoup parser used to parse the response.
+        self.bs4_parser: str = bs4_parser
+        #: ``False`` if the response is raw-only and will never be parsed.
+        self.parse: bool = parse
+        #: ``True`` if ``<script>`` and ``<style>`` blocks are removed before parsing (see :func:`strip_scripts`).
+        self.strip_scripts: bool = strip_scripts
+        #: When :attr:`strip_scripts` is ``True``, blocks whose opening tag matches this are kept.
+        self.keep_script_regex: Optional[str] = keep_script_regex
+
+        self._parsed: Optional[Tag] = None
+
+    @property
+    def parsed(self) -> Optional[Tag]:
+        """
+        The parsed HTML from the response, parsed on first access, or ``None`` if the response is raw-only.
+        """
+        if self._parsed is None and self.parse:
+            html = self.response.text
+            if self.strip_scripts:
+                html = strip_scripts(html, self.keep_script_regex)
+            self._parsed = parse_html(html, self.bs4_parser)
+        return self._parsed
+
+    @property
+    def is_parsed(self) -> bool:
+        """
+        ``True`` if the HTML from the response has been parsed.
+        """
+        return self._parsed is not None
+
+
+class Deadline:
+    """
+    A time budget for a call that makes many requests, shared by everything waiting on its behalf. Each wait is
+    given only the time :func:`remaining`, and :class:`~amazonorders.exception.AmazonOrdersDeadlineError` is raised
+    once the budget is exhausted.
+
+    Requests already in flight aren't interrupted, so a deadline may be overrun by up to a request's timeout (see
+    ``request_connect_timeout`` and ``request_read_timeout`` in the config).
+    """
+
+    def __init__(self,
+                 seconds: Optional[float] = None) -> None:
+        #: The number of seconds in the budget, ``None`` for no deadline.
+        self.seconds: Optional[float] = seconds
+
+        self._expires_at: Optional[float] = time.monotonic() + seconds if seconds is not None else None
+
+    def remaining(self) -> Optional[float]:
+        """
+        Get the number of seconds left in the budget.
+
+        :return: The number of seconds left, ``0`` if the budget is exhausted, or ``None`` if there is no deadline.
+        """
+        if self._expires_at is None:
+            return None
+
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def check(self) -> None:
+        """
+        Raise if the budget is exhausted.
+        """
+        if self.remaining() == 0:
+            raise self._error()
+
+    def result(self,
+               future: "concurrent.futures.Future[Any]") -> Any:
+        """
+        Wait for the given future's result, for at most the time remaining.
+
+        :param future: The future to wait on.
+        :return: The future's result.
+        """
+        try:
+            return future.result(timeout=self.remaining())
+        except concurrent.futures.TimeoutError:
+            raise self._error() from None
+
+    def get(self,
+            items: "queue.Queue[Any]") -> Any:
+        """
+        Wait for the next item on the given queue, for at most the time remaining.
+
+        :param items: The queue to get from.
+        :return: The next item.
+        """
+        try:
+            return items.get(timeout=self.remaining())
+        except queue.Empty:
+            raise self._error() from None
+
+    async def wait_for(self,
+                       awaitable: Awaitable[Any]) -> Any:
+        """
+        Await the given awaitable, for at most the time remaining, cancelling it if the budget is exhausted.
+
+        :param awaitable: The awaitable to wait on.
+        :return: The awaitable's result.
+        """
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.remaining())
+        except asyncio.TimeoutError:
+            raise self._error() from None
+
+    def _error(self) -> AmazonOrdersDeadlineError:
+        return AmazonOrdersDeadlineError(f"The deadline of {self.seconds} seconds was exceeded.")
+
+
+def parse_html(html: str,
+               bs4_parser: str) -> BeautifulSoup:
+    """
+    Parse the given HTML in to a tree that can be queried with :func:`select` and :func:`select_one`. All HTML parsed
+    by ``amazon-orders`` goes through this function.
+
+    :param html: The HTML to parse.
+    :param bs4_parser: The BeautifulSoup parser to use, ex. ``html.parser`` or ``lxml``.
+    :return: The parsed HTML.
+    """
+    return BeautifulSoup(html, bs4_parser)
+
+
+def strip_scripts(html: str,
+                  keep_regex: Optional[str] = None) -> str:
+    """
+    Remove ``<script>`` and ``<style>`` blocks from the given HTML, so they don't need to be parsed. On Amazon's
+    Order pages, these make up much of the document, but contain no Order data.
+
+    :param html: The HTML to strip.
+    :param keep_regex: Blocks whose opening tag matches this regex are kept.
+    :return: The stripped HTML.
+    """
+    def replace(match: re.Match) -> str:
+        if keep_regex and re.search(keep_regex, match.group(2)):
+            return match.group(0)
+        return ""
+
+    return _SCRIPT_TAG_RE.sub(replace, html)
+
+
+def validate_selectors(selectors: Any) -> int:
+    """
+    Validate every selector declared on the given ``selectors`` object (every upper case attribute that is a
+    ``str``, a :class:`~amazonorders.selectors.Selector`, or a ``list`` of them), so invalid selectors fail fast,
+    rather than when a page is first parsed.
+
+    :param selectors: The ``Selectors`` instance to validate.
+    :return: The number of selectors validated.
+    """
+    empty = BeautifulSoup("", "html.parser")
+
+    count = 0
+    for name in dir(selectors):
+        if not name.isupper():
+            continue
+
+        value = getattr(selectors, name)
+        for s in (value if isinstance(value, list) else [value]):
+            if isinstance(s, Selector):
+                s = s.css_selector
+            elif not isinstance(s, str):
+                continue
+
+            # Selecting from an empty document can only fail if the selector itself is invalid
+            try:
+                empty.select_one(s)
+            except Exception as e:
+                raise AmazonOrdersError(f"{type(selectors).__name__}.{name} has an invalid CSS selector "
+                                        f"`{s}`: {e}", meta={"selector": name}) from e
+
+            count += 1
+
+    return count
 
 
 def _selector_text_matches(tag: Tag, selector: Selector) -> bool:
@@ -130,6 +352,120 @@ def to_type(value: str) -> Union[int, float, bool, str, None]:
     return rv
 
 
+def parse_amount(value: Union[str, int, float, None],
+                 decimal_comma: bool = False) -> Union[int, float, None]:
+    """
+    Parse a currency amount to a primitive, without relying on exceptions for control flow.
+
+    Recognizes currency symbols and codes before or after the number (ex. ``$``, ``£``, ``€``, ``₹``, ``CDN$``, or
+    ``EUR``), accepts a leading sign or accounting-style negatives in parentheses (ex. ``($1.99)``), and treats a
+    literal ``FREE`` as ``0.0``. Amounts without a decimal part are returned as an ``int``.
+
+    :param value: The amount to parse.
+    :param decimal_comma: ``True`` if ``,`` is the decimal separator (and ``.`` groups thousands), as on many
+        non-English Amazon sites (see :attr:`~amazonorders.constants.Constants.DECIMAL_COMMA`).
+    :return: The amount, or ``None`` if ``value`` is not an amount.
+    """
+    if value is None or isinstance(value, (int, float)):
+        return value
+
+    value = value.strip()
+
+    negative = value.startswith("(") and value.endswith(")")
+    if negative:
+        value = value[1:-1]
+
+    match = _AMOUNT_RE.fullmatch(value)
+    if not match:
+        return 0.0 if value.lower() == "free" else None
+
+    prefix, number, suffix = match.groups()
+    if prefix:
+        prefix = prefix.strip()
+        if prefix[:1] in _SIGNS:
+            negative = negative != (prefix[0] in _NEGATIVE_SIGNS)
+            prefix = prefix[1:].lstrip()
+        elif prefix[-1:] in _SIGNS:
+            negative = negative != (prefix[-1] in _NEGATIVE_SIGNS)
+            prefix = prefix[:-1].rstrip()
+
+        if prefix not in _CURRENCY_SYMBOLS and not _CURRENCY_RE.fullmatch(prefix):
+            return None
+    if suffix and not _CURRENCY_RE.fullmatch(suffix.strip()):
+        return None
+
+    # Remove grouping separators, and normalize the decimal separator to a ``.``
+    if not number.isascii():
+        number = number.replace("\u00a0", "").replace("\u202f", "")
+    if decimal_comma:
+        number = number.replace(".", "").replace(",", ".")
+    elif "," in number:
+        number = number.replace(",", "")
+
+    decimal_points = number.count(".")
+    if decimal_points > 1:
+        return None
+
+    amount: Union[int, float] = float(number) if decimal_points else int(number)
+
+    return -amount if negative else amount
+
+
+def parse_amounts(values: List[Union[str, int, float, None]],
+                  decimal_comma: bool = False) -> List[Union[int, float, None]]:
+    """
+    Parse many currency amounts at once. See :func:`parse_amount`.
+
+    :param values: The amounts to parse.
+    :param decimal_comma: ``True`` if ``,`` is the decimal separator (and ``.`` groups thousands).
+    :return: The amounts, each ``None`` if its value is not an amount.
+    """
+    return [parse_amount(value, decimal_comma) for value in values]
+
+
+def parse_date(value: str,
+               day_first: bool = False,
+               fuzzy: bool = True) -> Optional[date]:
+    """
+    Parse a date from the given text, which may contain other words (ex. ``Return window closed on Jun 20, 2010``).
+
+    The formats Amazon renders dates in (ex. ``October 5, 2023`` or ``5 October 2023``) are matched directly, and
+    only if neither is found is the text parsed with :func:`dateutil.parser.parse`. Results are cached, since the
+    same dates repeat heavily across pages.
+
+    :param value: The text to parse.
+    :param day_first: ``True`` if the domain writes dates day first (see
+        :attr:`~amazonorders.constants.Constants.DATE_DAY_FIRST`), so ``5 October 2023`` is tried first and
+        ambiguous numeric dates are parsed day first.
+    :param fuzzy: ``False`` if the text should only contain a date, rather than a date among other words, when falling
+        back to :func:`dateutil.parser.parse`.
+    :return: The date, or ``None`` if one could not be parsed.
+    """
+    return _parse_date(value, day_first, fuzzy)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(value: str,
+                day_first: bool,
+                fuzzy: bool) -> Optional[date]:
+    patterns = ((_DATE_DAY_FIRST_RE, 1, 0), (_DATE_MONTH_FIRST_RE, 0, 1))
+    for pattern, month_group, day_group in (patterns if day_first else reversed(patterns)):
+        for match in pattern.finditer(value):
+            groups = match.groups()
+            month = _MONTHS.get(groups[month_group].lower())
+            if not month:
+                continue
+
+            year, day = int(groups[2]), int(groups[day_group])
+            if year and 1 <= day <= calendar.monthrange(year, month)[1]:
+                return date(year, month, day)
+
+    try:
+        return parser.parse(value, fuzzy=fuzzy, dayfirst=day_first).date()
+    except (ValueError, OverflowError):
+        return None
+
+
 def load_class(package: List[str], clazz: str) -> Union[Callable, Any]:
     """
     Import the given class from the given package, and return it.
@@ -161,3 +497,58 @@ def cleanup_html_text(text: str) -> str:
     if not text.endswith("."):
         text += "."
     return text
+
+
+def atomic_write(path: str,
+                 data: bytes) -> None:
+    """
+    Write ``data`` to a temporary file alongside ``path``, then move it in to place, so readers (including other
+    processes) never see a partially written file.
+
+    :param path: The path of the file to write.
+    :param data: The data to write.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@contextlib.contextmanager
+def file_lock(path: str,
+              thread_lock: threading.Lock) -> Iterator[None]:
+    """
+    Hold an exclusive lock on ``path`` for the duration of the context, so a read-modify-write of it is safe across
+    both threads and processes. Threads in this process are serialized by ``thread_lock``, other processes by an OS
+    lock on a ``.lock`` file alongside ``path``.
+
+    :param path: The path of the file to lock.
+    :param thread_lock: The lock that serializes this process's threads' access to ``path``.
+    """
+    with thread_lock, open(f"{path}.lock", "a+b") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        elif msvcrt:  # pragma: no cover
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            elif msvcrt:  # pragma: no cover
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
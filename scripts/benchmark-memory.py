@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import argparse
+import glob
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.normpath(
+    os.path.join(os.path.abspath(os.path.dirname(__file__)), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from amazonorders import util  # noqa: E402
+from amazonorders.conf import AmazonOrdersConfig  # noqa: E402
+
+MODES = ["attached", "detached", "snapshot"]
+
+
+def _peak_rss_mib():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ``ru_maxrss`` is in bytes on macOS, kilobytes elsewhere
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def _build_history(args):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = AmazonOrdersConfig(config_path=os.path.join(tmp_dir, "config.yml"),
+                                    data={"output_dir": tmp_dir,
+                                          "cookie_jar_path": os.path.join(tmp_dir, "cookies.json"),
+                                          "bs4_parser": args.bs4_parser})
+
+        pages = []
+        for path in sorted(glob.glob(os.path.join(ROOT_DIR, "tests", "resources", "orders", "order-history-*.html"))):
+            with open(path, "r", encoding="utf-8") as f:
+                pages.append(f.read())
+
+        start = time.perf_counter()
+        orders = []
+        page_count = 0
+        while len(orders) < args.orders:
+            # Each synthetic page is parsed anew, as it would be when paging through history
+            html = util.strip_scripts(pages[page_count % len(pages)], config.constants.KEEP_SCRIPT_TAG_REGEX)
+            parsed = util.parse_html(html, config.bs4_parser)
+            page_count += 1
+
+            for tag in util.select(parsed, config.selectors.ORDER_HISTORY_ENTITY_SELECTOR):
+                order = config.order_cls(tag, config)
+                if args.mode == "detached":
+                    order.detach()
+                elif args.mode == "snapshot":
+                    order = order.snapshot()
+                orders.append(order)
+
+        elapsed = time.perf_counter() - start
+
+    print(f"{len(orders)} {page_count} {elapsed} {_peak_rss_mib()}")
+
+
+def benchmark_memory(args):
+    """
+    The purpose of this script is to measure the peak memory (RSS) used to build and hold a synthetic history of
+    many Orders, made by repeatedly parsing the Order history pages in tests/resources/orders, when each Order keeps
+    its reference to the parsed page, when it is detached (:func:`amazonorders.entity.parsable.Parsable.detach`),
+    and when only its snapshot (:func:`amazonorders.entity.parsable.Parsable.snapshot`) is kept. Each is run in its
+    own process, so no one's peak affects another's.
+
+    This script can be invoked with `python scripts/benchmark-memory.py`.
+    """
+    results = {}
+    for mode in MODES:
+        output = subprocess.check_output([sys.executable, __file__, "--mode", mode, "--orders", str(args.orders),
+                                          "--bs4-parser", args.bs4_parser], text=True).split()
+        orders, page_count, elapsed, peak = int(output[0]), int(output[1]), float(output[2]), float(output[3])
+
+        results[mode] = peak
+        print(f"{mode:>10}: {orders} Orders from {page_count} pages in {elapsed:.3f}s, peak RSS {peak:.1f} MiB")
+
+    for mode in MODES[1:]:
+        print(f"{mode} vs attached: {results['attached'] / results[mode]:.2f}x less peak RSS")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the memory used to hold a large Order history.")
+    parser.add_argument("--orders", type=int, default=3000,
+                        help="The number of Orders in the synthetic history.")
+    parser.add_argument("--bs4-parser", default="auto",
+                        help="The bs4_parser to use.")
+    parser.add_argument("--mode", choices=MODES,
+                        help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+    if args.mode:
+        _build_history(args)
+    else:
+        benchmark_memory(args)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.normpath(
+    os.path.join(os.path.abspath(os.path.dirname(__file__)), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from amazonorders import util  # noqa: E402
+from amazonorders.conf import AmazonOrdersConfig  # noqa: E402
+
+
+def _build_entities(config, path, parsed):
+    if "order-history" in path:
+        return [config.order_cls(tag, config)
+                for tag in util.select(parsed, config.selectors.ORDER_HISTORY_ENTITY_SELECTOR)]
+    elif "order-details" in path:
+        tag = util.select_one(parsed, config.selectors.ORDER_DETAILS_ENTITY_SELECTOR)
+        return [config.order_cls(tag, config, full_details=True)] if tag else []
+    return []
+
+
+def _parse(config, html, strip_scripts):
+    if strip_scripts:
+        html = util.strip_scripts(html, config.constants.KEEP_SCRIPT_TAG_REGEX)
+    return util.parse_html(html, config.bs4_parser)
+
+
+def benchmark_parsing(args):
+    """
+    The purpose of this script is to measure how long it takes to parse the Order pages in tests/resources/orders
+    with each given ``bs4_parser``, both to build the HTML tree and to build Order entities from it. With
+    ``--strip-scripts``, ``<script>`` and ``<style>`` blocks are stripped before parsing (and timed as part of it),
+    as is done by default for Order pages, and with ``--memory``, the peak memory used to parse a page is reported.
+
+    This script can be invoked with `python scripts/benchmark-parsing.py`. Parsers that are not installed are
+    skipped.
+    """
+    paths = sorted(glob.glob(os.path.join(ROOT_DIR, "tests", "resources", "orders", "order-*.html")))
+    pages = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            pages.append((path, f.read()))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = {}
+        for bs4_parser in args.parsers:
+            config = AmazonOrdersConfig(config_path=os.path.join(tmp_dir, "config.yml"),
+                                        data={"output_dir": tmp_dir,
+                                              "cookie_jar_path": os.path.join(tmp_dir, "cookies.json"),
+                                              "bs4_parser": bs4_parser})
+            if config.bs4_parser != bs4_parser:
+                print(f"Skipping {bs4_parser}, it is not installed")
+                continue
+
+            parse_time = 0.0
+            entity_time = 0.0
+            entities = 0
+            for _ in range(args.iterations):
+                for path, html in pages:
+                    start = time.perf_counter()
+                    parsed = _parse(config, html, args.strip_scripts)
+                    parse_time += time.perf_counter() - start
+
+                    start = time.perf_counter()
+                    entities += len(_build_entities(config, path, parsed))
+                    entity_time += time.perf_counter() - start
+
+            results[bs4_parser] = (parse_time, entity_time)
+            print(f"{bs4_parser:>12}: parse {parse_time:.3f}s, build {entities} Orders {entity_time:.3f}s, "
+                  f"total {parse_time + entity_time:.3f}s ({len(pages)} pages x {args.iterations})")
+
+            if args.memory:
+                peak = 0
+                for _, html in pages:
+                    tracemalloc.start()
+                    _parse(config, html, args.strip_scripts)
+                    peak = max(peak, tracemalloc.get_traced_memory()[1])
+                    tracemalloc.stop()
+                print(f"{bs4_parser:>12}: peak memory to parse a page {peak / 1024 / 1024:.1f} MiB")
+
+    if len(results) > 1:
+        baseline_parser = args.parsers[0]
+        baseline = results.get(baseline_parser)
+        for bs4_parser, (parse_time, entity_time) in results.items():
+            if baseline and bs4_parser != baseline_parser:
+                print(f"{bs4_parser} vs {baseline_parser}: parse {baseline[0] / parse_time:.2f}x, "
+                      f"total {sum(baseline) / (parse_time + entity_time):.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parsing the Order pages in tests/resources.")
+    parser.add_argument("--parsers", nargs="+", default=["html.parser", "lxml"],
+                        help="The bs4_parser values to benchmark, the first is the baseline.")
+    parser.add_argument("--iterations", type=int, default=1,
+                        help="The number of times to parse each page.")
+    parser.add_argument("--strip-scripts", action="store_true",
+                        help="Strip <script> and <style> blocks before parsing.")
+    parser.add_argument("--memory", action="store_true",
+                        help="Also report the peak memory used to parse a page.")
+
+    benchmark_parsing(parser.parse_args())
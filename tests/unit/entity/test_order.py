@@ -1,11 +1,15 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import gc
 import os
+import pickle
+import weakref
 from unittest.mock import patch
 
 from bs4 import BeautifulSoup
 
+from amazonorders import util
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.order import Order
 from amazonorders.exception import AmazonOrdersError
@@ -85,6 +89,103 @@ class TestOrder(UnitTestCase):
         # THEN
         self.assertEqual(order.free_shipping, -2.99)
 
+    def test_order_subtotals_selected_once(self):
+        # GIVEN
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-coupon-savings-multiple.html"),
+                  "r",
+                  encoding="utf-8") as f:
+            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+
+        # WHEN
+        with patch("amazonorders.util.select", wraps=util.select) as select_mock:
+            order = Order(parsed, self.test_config, full_details=True)
+
+        # THEN
+        self.assertEqual(order.coupon_savings, -1.29)
+        self.assertIsNotNone(order.subtotal)
+        subtotals_selector = self.test_config.selectors.FIELD_ORDER_SUBTOTALS_TAG_ITERATOR_SELECTOR
+        self.assertEqual(1, len([c for c in select_mock.call_args_list if c.args[1] == subtotals_selector]))
+
+    def test_order_fields(self):
+        # GIVEN
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-112-2961628-4757846.html"),
+                  "r",
+                  encoding="utf-8") as f:
+            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+        order = Order(parsed, self.test_config, full_details=True)
+
+        # WHEN
+        with patch.object(Order, "_parse_recipient") as parse_recipient_mock:
+            projected_order = Order(parsed, self.test_config, full_details=True,
+                                    fields=["order_number", "grand_total", "items.title"])
+
+        # THEN
+        parse_recipient_mock.assert_not_called()
+        self.assertEqual({"order_number", "grand_total", "items.title"}, projected_order.fields)
+        self.assertIn("grand_total", projected_order.__dict__)
+        self.assertIn("items", projected_order.__dict__)
+        self.assertNotIn("recipient", projected_order.__dict__)
+        self.assertNotIn("subtotal", projected_order.__dict__)
+        self.assertIn("title", projected_order.items[0].__dict__)
+        self.assertNotIn("seller", projected_order.items[0].__dict__)
+        self.assertEqual(order.order_number, projected_order.order_number)
+        self.assertEqual(order.grand_total, projected_order.grand_total)
+        self.assertEqual([i.title for i in order.items], [i.title for i in projected_order.items])
+
+        # WHEN
+        subtotal = projected_order.subtotal
+
+        # THEN
+        self.assertEqual(order.subtotal, subtotal)
+        self.assertIn("subtotal", projected_order.__dict__)
+        self.assertEqual(order.recipient.name, projected_order.recipient.name)
+        self.assertEqual(order.items[0].seller.name, projected_order.items[0].seller.name)
+
+    def test_order_fields_parsed_when_pickled(self):
+        # GIVEN
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-112-2961628-4757846.html"),
+                  "r",
+                  encoding="utf-8") as f:
+            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+        order = Order(parsed, self.test_config, full_details=True, fields=["order_number"])
+
+        # WHEN
+        unpickled_order = pickle.loads(pickle.dumps(order))
+
+        # THEN
+        self.assertEqual(order.order_number, unpickled_order.order_number)
+        self.assertEqual(order.grand_total, unpickled_order.grand_total)
+        self.assertEqual(order.recipient.name, unpickled_order.recipient.name)
+        self.assertEqual(order.items[0].title, unpickled_order.items[0].title)
+        with self.assertRaises(AttributeError):
+            unpickled_order.not_a_field
+
+    def test_order_detach(self):
+        # GIVEN
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-112-2961628-4757846.html"),
+                  "r",
+                  encoding="utf-8") as f:
+            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+        order = Order(parsed, self.test_config, full_details=True, fields=["order_number"])
+        parsed_ref = weakref.ref(parsed)
+
+        # WHEN
+        order.detach()
+        del parsed
+        gc.collect()
+
+        # THEN
+        self.assertIsNone(parsed_ref())
+        self.assertIsNone(order.parsed)
+        self.assertIsNone(order.items[0].parsed)
+        self.assertIsNone(order.items[0].seller.parsed)
+        self.assertIsNone(order.shipments[0].parsed)
+        self.assertIsNone(order.recipient.parsed)
+        self.assertEqual("112-2961628-4757846", order.order_number)
+        self.assertIsNotNone(order.grand_total)
+        self.assertIsNotNone(order.recipient.name)
+        self.assertIsNotNone(order.items[0].title)
+
     def test_order_coupon_savings_multiple(self):
         # GIVEN
         with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-coupon-savings-multiple.html"),
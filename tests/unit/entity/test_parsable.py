@@ -24,3 +24,19 @@ class TestItem(UnitTestCase):
         self.assertEqual(parsable.to_currency("1,234.99"), 1234.99)
         self.assertEqual(parsable.to_currency("$1,234.99"), 1234.99)
         self.assertIsNone(parsable.to_currency("not currency"))
+        self.assertEqual(parsable.to_currency("($1.99)"), -1.99)
+        self.assertEqual(parsable.to_currency("FREE"), 0.0)
+
+    def test_to_currency_decimal_comma(self):
+        # GIVEN
+        html = "<html />"
+        parsed = BeautifulSoup(html, self.test_config.bs4_parser)
+        self.test_config.set_domain("amazon.de")
+
+        # WHEN
+        parsable = Parsable(parsed, self.test_config)
+
+        # THEN
+        self.assertTrue(self.test_config.constants.DECIMAL_COMMA)
+        self.assertEqual(parsable.to_currency("1.234,99 €"), 1234.99)
+        self.assertEqual(parsable.to_currency("EUR 12,34"), 12.34)
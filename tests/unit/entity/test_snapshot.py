@@ -0,0 +1,115 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import os
+import pickle
+
+from bs4 import BeautifulSoup
+
+from amazonorders.entity.item import Item
+from amazonorders.entity.order import Order
+from amazonorders.entity.snapshot import ItemSnapshot, OrderSnapshot, RecipientSnapshot, SellerSnapshot
+from amazonorders.exception import AmazonOrdersResponseError
+from tests.unittestcase import UnitTestCase
+
+
+class CustomItem(Item):
+    def __init__(self, parsed, config, fields=None):
+        super().__init__(parsed, config, fields)
+
+        self.custom_field = "custom"
+
+
+class CustomItemSnapshot(ItemSnapshot):
+    __slots__ = ("custom_field",)
+
+
+class TestSnapshot(UnitTestCase):
+    def _given_order(self, **kwargs):
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-112-2961628-4757846.html"),
+                  "r",
+                  encoding="utf-8") as f:
+            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+        return Order(parsed, self.test_config, full_details=True, **kwargs)
+
+    def test_order_snapshot(self):
+        # GIVEN
+        order = self._given_order(fields=["order_number"])
+
+        # WHEN
+        snapshot = order.snapshot()
+
+        # THEN
+        self.assertIsInstance(snapshot, OrderSnapshot)
+        self.assertFalse(hasattr(snapshot, "__dict__"))
+        self.assertEqual(order.order_number, snapshot.order_number)
+        self.assertEqual(order.grand_total, snapshot.grand_total)
+        self.assertEqual(order.order_placed_date, snapshot.order_placed_date)
+        self.assertIsInstance(snapshot.recipient, RecipientSnapshot)
+        self.assertEqual(order.recipient.name, snapshot.recipient.name)
+        self.assertIsInstance(snapshot.items, tuple)
+        self.assertEqual(len(order.items), len(snapshot.items))
+        self.assertEqual(order.items[0].title, snapshot.items[0].title)
+        self.assertIsInstance(snapshot.items[0].seller, SellerSnapshot)
+        self.assertEqual(order.items[0].seller.name, snapshot.items[0].seller.name)
+        self.assertEqual(order.shipments[0].delivery_status, snapshot.shipments[0].delivery_status)
+        self.assertEqual(order.order_number, snapshot.to_dict()["order_number"])
+        with self.assertRaises(AttributeError):
+            snapshot.order_number = "123"
+
+    def test_order_snapshot_details_error(self):
+        # GIVEN
+        order = self._given_order()
+        partial_order = self._given_order()
+        partial_order.details_error = AmazonOrdersResponseError("Error getting Order details", status_code=503)
+
+        # WHEN
+        snapshot = order.snapshot()
+        partial_snapshot = partial_order.snapshot()
+
+        # THEN
+        self.assertIsNone(snapshot.details_error)
+        self.assertEqual("Error getting Order details", partial_snapshot.details_error)
+        self.assertNotEqual(snapshot, partial_snapshot)
+        self.assertEqual(partial_snapshot, pickle.loads(pickle.dumps(partial_snapshot)))
+
+    def test_order_snapshot_equality_and_pickling(self):
+        # GIVEN
+        snapshot = self._given_order().snapshot()
+
+        # WHEN
+        other_snapshot = self._given_order().snapshot()
+        unpickled_snapshot = pickle.loads(pickle.dumps(snapshot))
+
+        # THEN
+        self.assertEqual(snapshot, other_snapshot)
+        self.assertEqual(hash(snapshot), hash(other_snapshot))
+        self.assertEqual(1, len({snapshot, other_snapshot, unpickled_snapshot}))
+        self.assertEqual(snapshot, unpickled_snapshot)
+        self.assertEqual(snapshot.items[0].seller, unpickled_snapshot.items[0].seller)
+        self.assertNotEqual(snapshot, snapshot.items[0])
+        self.assertLess(len(pickle.dumps(snapshot)), len(pickle.dumps(self._given_order())))
+
+    def test_custom_item_class_snapshot(self):
+        # GIVEN
+        self.test_config.item_cls = CustomItem
+        order = self._given_order()
+
+        # WHEN
+        snapshot = order.snapshot()
+
+        # THEN
+        self.assertIsInstance(snapshot.items[0], ItemSnapshot)
+        self.assertFalse(hasattr(snapshot.items[0], "custom_field"))
+
+        # WHEN
+        CustomItem.snapshot_class = CustomItemSnapshot
+        try:
+            snapshot = order.snapshot()
+        finally:
+            del CustomItem.snapshot_class
+
+        # THEN
+        self.assertIsInstance(snapshot.items[0], CustomItemSnapshot)
+        self.assertEqual("custom", snapshot.items[0].custom_field)
+        self.assertEqual(order.items[0].title, snapshot.items[0].title)
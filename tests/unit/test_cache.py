@@ -0,0 +1,108 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import datetime
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from amazonorders.cache import OrderDetailsCache, is_settled
+from tests.unittestcase import UnitTestCase
+
+
+class TestCache(UnitTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.order_details_cache = OrderDetailsCache(self.test_config)
+
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-112-2961628-4757846.html"), "r",
+                  encoding="utf-8") as f:
+            self.order_details_html = f.read()
+        parsed = BeautifulSoup(self.order_details_html, self.test_config.bs4_parser)
+        self.order = self.test_config.order_cls(parsed, self.test_config, full_details=True)
+
+    def test_cache_dir_defaults_alongside_cookie_jar(self):
+        # THEN
+        self.assertEqual(os.path.join(os.path.dirname(self.test_config.cookie_jar_path), "order-details"),
+                         self.order_details_cache.cache_dir)
+        self.assertTrue(os.path.isdir(self.order_details_cache.cache_dir))
+
+    def test_put_get(self):
+        # GIVEN
+        order_id = "112-2961628-4757846"
+        self.assertIsNone(self.order_details_cache.get(order_id))
+
+        # WHEN
+        self.order_details_cache.put(order_id, self.order_details_html, self.order)
+
+        # THEN
+        parsed = self.order_details_cache.get(order_id)
+        self.assertIsNotNone(parsed)
+        order = self.test_config.order_cls(parsed, self.test_config, full_details=True)
+        self.assertEqual(self.order.order_number, order.order_number)
+        self.assertEqual(self.order.grand_total, order.grand_total)
+        self.assertEqual(self.order.recipient.name, order.recipient.name)
+        self.assertEqual(["112-2961628-4757846.json.gz"], os.listdir(self.order_details_cache.cache_dir))
+
+    @patch("amazonorders.cache.is_settled", return_value=False)
+    def test_unsettled_order_expires(self, _):
+        # GIVEN
+        order_id = "112-2961628-4757846"
+        self.order_details_cache.put(order_id, self.order_details_html, self.order)
+
+        # WHEN
+        with patch("amazonorders.cache.time.time",
+                   return_value=datetime.datetime.now().timestamp() + self.test_config.order_details_cache_ttl + 1):
+            parsed = self.order_details_cache.get(order_id)
+
+        # THEN
+        self.assertIsNone(parsed)
+
+    def test_settled_order_does_not_expire(self):
+        # GIVEN
+        order_id = "112-2961628-4757846"
+        self.order_details_cache.put(order_id, self.order_details_html, self.order)
+
+        # WHEN
+        with patch("amazonorders.cache.time.time",
+                   return_value=datetime.datetime.now().timestamp() + self.test_config.order_details_cache_ttl + 1):
+            parsed = self.order_details_cache.get(order_id)
+
+        # THEN
+        self.assertIsNotNone(parsed)
+
+    def test_corrupt_entry_is_invalidated(self):
+        # GIVEN
+        order_id = "112-2961628-4757846"
+        path = os.path.join(self.order_details_cache.cache_dir, f"{order_id}.json.gz")
+        with open(path, "wb") as f:
+            f.write(b"not-gzip")
+
+        # WHEN
+        parsed = self.order_details_cache.get(order_id)
+
+        # THEN
+        self.assertIsNone(parsed)
+        self.assertFalse(os.path.exists(path))
+
+    def test_is_settled(self):
+        # GIVEN
+        today = datetime.date(2025, 1, 1)
+
+        def order(delivery_statuses, return_eligible_dates, cancelled=False):
+            return SimpleNamespace(cancelled=cancelled,
+                                   shipments=[SimpleNamespace(delivery_status=s) for s in delivery_statuses],
+                                   items=[SimpleNamespace(return_eligible_date=d) for d in return_eligible_dates])
+
+        # THEN
+        self.assertTrue(is_settled(self.order))
+        self.assertTrue(is_settled(order([], [], cancelled=True), today))
+        self.assertTrue(is_settled(order(["Delivered Dec 1, 2024"], [datetime.date(2024, 12, 31)]), today))
+        self.assertTrue(is_settled(order(["Delivered Dec 1, 2024", "Return complete"], [None]), today))
+        self.assertFalse(is_settled(order(["Delivered Dec 30, 2024"], [datetime.date(2025, 1, 30)]), today))
+        self.assertFalse(is_settled(order(["Delivered Dec 30, 2024", "Arriving tomorrow"], [None]), today))
+        self.assertFalse(is_settled(order([None], [None]), today))
+        self.assertFalse(is_settled(order([], []), today))
@@ -0,0 +1,144 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import gzip
+import os
+import time
+from unittest.mock import patch
+
+from amazonorders.capture import DebugCaptureWriter
+from amazonorders.exception import AmazonOrdersError
+from tests.unittestcase import UnitTestCase
+
+
+class TestCapture(UnitTestCase):
+    def test_capture(self):
+        # GIVEN
+        writer = DebugCaptureWriter(self.test_output_dir)
+
+        # WHEN
+        path1 = writer.capture("https://www.amazon.com/your-orders/orders?timeFilter=year-2023", "<html>1</html>")
+        path2 = writer.capture("https://www.amazon.com/your-orders/orders", "<html>2</html>")
+        path3 = writer.capture("https://www.amazon.com/", "<html>3</html>")
+        writer.close()
+
+        # THEN
+        self.assertEqual(os.path.join(self.test_output_dir, f"orders_{writer.run_id}_0.html"), path1)
+        self.assertEqual(os.path.join(self.test_output_dir, f"orders_{writer.run_id}_1.html"), path2)
+        self.assertEqual(os.path.join(self.test_output_dir, f"index_{writer.run_id}_2.html"), path3)
+        with open(path2, "r", encoding="utf-8") as f:
+            self.assertEqual("<html>2</html>", f.read())
+
+    def test_capture_does_not_probe_output_dir(self):
+        # GIVEN
+        writer = DebugCaptureWriter(self.test_output_dir)
+
+        # WHEN
+        with patch("os.path.isfile") as mock_isfile, patch("os.path.exists") as mock_exists:
+            for i in range(100):
+                writer.capture("https://www.amazon.com/your-orders/orders", f"<html>{i}</html>")
+        writer.flush()
+
+        # THEN
+        mock_isfile.assert_not_called()
+        mock_exists.assert_not_called()
+        self.assertEqual(100, len(os.listdir(self.test_output_dir)))
+        writer.close()
+
+    def test_capture_gzip(self):
+        # GIVEN
+        writer = DebugCaptureWriter(self.test_output_dir, compression="gzip")
+
+        # WHEN
+        path = writer.capture("https://www.amazon.com/your-orders/orders", "<html>1</html>")
+        writer.flush()
+
+        # THEN
+        self.assertTrue(path.endswith(".html.gz"))
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            self.assertEqual("<html>1</html>", f.read())
+        writer.close()
+
+    def test_unsupported_compression(self):
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            DebugCaptureWriter(self.test_output_dir, compression="bz2")
+
+        # THEN
+        self.assertIn("'bz2' is not supported", str(cm.exception))
+
+    def test_rotate_max_files(self):
+        # GIVEN
+        old_path = os.path.join(self.test_output_dir, "orders_0.html")
+        with open(old_path, "w", encoding="utf-8") as f:
+            f.write("<html>old</html>")
+        os.utime(old_path, (time.time() - 60, time.time() - 60))
+        unrelated_path = os.path.join(self.test_output_dir, "orders.json")
+        with open(unrelated_path, "w", encoding="utf-8") as f:
+            f.write("{}")
+        writer = DebugCaptureWriter(self.test_output_dir, max_files=3)
+
+        # WHEN
+        paths = [writer.capture("https://www.amazon.com/your-orders/orders", f"<html>{i}</html>") for i in range(4)]
+        writer.close()
+
+        # THEN
+        self.assertEqual(sorted([os.path.basename(p) for p in paths[1:]] + ["orders.json"]),
+                         sorted(os.listdir(self.test_output_dir)))
+
+    def test_rotate_max_bytes(self):
+        # GIVEN
+        writer = DebugCaptureWriter(self.test_output_dir, max_bytes=25)
+
+        # WHEN
+        paths = [writer.capture("https://www.amazon.com/your-orders/orders", "<html>page</html>") for _ in range(3)]
+        writer.close()
+
+        # THEN
+        self.assertEqual([os.path.basename(paths[-1])], os.listdir(self.test_output_dir))
+
+    def test_close_restarts_on_capture(self):
+        # GIVEN
+        writer = DebugCaptureWriter(self.test_output_dir)
+        writer.capture("https://www.amazon.com/your-orders/orders", "<html>1</html>")
+        writer.close()
+
+        # WHEN
+        path = writer.capture("https://www.amazon.com/your-orders/orders", "<html>2</html>")
+        writer.close()
+
+        # THEN
+        self.assertTrue(os.path.exists(path))
+
+    def test_capture_output_dir_missing_with_rotation(self):
+        # GIVEN
+        writer = DebugCaptureWriter(os.path.join(self.test_output_dir, "missing"), max_files=3)
+
+        # WHEN
+        with self.assertLogs("amazonorders.capture", level="WARNING") as cm:
+            writer.capture("https://www.amazon.com/your-orders/orders", "<html>1</html>")
+            writer.flush()
+
+        # THEN
+        self.assertTrue(writer._thread.is_alive())
+        self.assertTrue(any("could not be found for rotation" in line for line in cm.output))
+        self.assertTrue(any("could not be written" in line for line in cm.output))
+        writer.close()
+
+    def test_capture_restarts_dead_thread(self):
+        # GIVEN
+        writer = DebugCaptureWriter(self.test_output_dir, max_queued=1)
+        with patch.object(writer, "_run", return_value=None):
+            writer.capture("https://www.amazon.com/your-orders/orders", "<html>1</html>")
+            writer._thread.join(5)
+        self.assertFalse(writer._thread.is_alive())
+        self.assertTrue(writer._queue.full())
+
+        # WHEN
+        with self.assertLogs("amazonorders.capture", level="WARNING"):
+            path = writer.capture("https://www.amazon.com/your-orders/orders", "<html>2</html>")
+        writer.close()
+
+        # THEN
+        with open(path, "r", encoding="utf-8") as f:
+            self.assertEqual("<html>2</html>", f.read())
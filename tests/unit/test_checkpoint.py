@@ -0,0 +1,117 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import os
+
+from bs4 import BeautifulSoup
+
+from amazonorders.checkpoint import Checkpoint
+from amazonorders.entity.order import Order
+from tests.unittestcase import UnitTestCase
+
+
+class TestCheckpoint(UnitTestCase):
+    def setUp(self):
+        super().setUp()
+
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-112-2961628-4757846.html"),
+                  "r",
+                  encoding="utf-8") as f:
+            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+        self.order = Order(parsed, self.test_config, full_details=True, index=0)
+
+        self.query = {"account": "some-username@gmail.com@www.amazon.com", "year": 2010}
+
+    def test_load_no_checkpoint(self):
+        # GIVEN
+        checkpoint = Checkpoint(self.test_config, "order-history", self.query)
+
+        # WHEN
+        records = checkpoint.load()
+
+        # THEN
+        self.assertEqual([], records)
+        self.assertFalse(os.path.exists(checkpoint.path))
+
+    def test_append_and_load(self):
+        # GIVEN
+        checkpoint = Checkpoint(self.test_config, "order-history", self.query)
+
+        # WHEN
+        checkpoint.append(1, [self.order])
+        checkpoint.append(2, [])
+        checkpoint.close()
+        records = Checkpoint(self.test_config, "order-history", self.query).load()
+
+        # THEN
+        self.assertEqual(os.path.join(os.path.dirname(self.test_cookie_jar_path), "checkpoints"),
+                         checkpoint.checkpoint_dir)
+        self.assertEqual([1, 2], [progress for progress, _ in records])
+        loaded_order = records[0][1][0]
+        self.assertIsNone(loaded_order.parsed)
+        self.assertIs(self.test_config, loaded_order.config)
+        self.assertIs(self.test_config, loaded_order.items[0].config)
+        self.assertEqual(0, loaded_order.index)
+        self.assertEqual(self.order.order_number, loaded_order.order_number)
+        self.assertEqual(self.order.grand_total, loaded_order.grand_total)
+        self.assertEqual(self.order.items[0].title, loaded_order.items[0].title)
+
+    def test_append_continues_loaded_checkpoint(self):
+        # GIVEN
+        checkpoint = Checkpoint(self.test_config, "order-history", self.query)
+        checkpoint.append(1, [self.order])
+        checkpoint.close()
+
+        # WHEN
+        checkpoint = Checkpoint(self.test_config, "order-history", self.query)
+        checkpoint.append(2, [self.order])
+        checkpoint.close()
+
+        # THEN
+        self.assertEqual([1, 2], [progress for progress, _ in checkpoint.load()])
+
+    def test_load_discards_partial_record(self):
+        # GIVEN
+        checkpoint = Checkpoint(self.test_config, "order-history", self.query)
+        checkpoint.append(1, [])
+        checkpoint.append(2, [self.order])
+        checkpoint.close()
+        with open(checkpoint.path, "rb+") as f:
+            f.truncate(os.path.getsize(checkpoint.path) - 10)
+
+        # WHEN
+        records = checkpoint.load()
+        checkpoint.append(3, [])
+        checkpoint.close()
+
+        # THEN
+        self.assertEqual([(1, [])], records)
+        self.assertEqual([1, 3], [progress for progress, _ in checkpoint.load()])
+
+    def test_load_different_query(self):
+        # GIVEN
+        checkpoint = Checkpoint(self.test_config, "order-history", self.query)
+        checkpoint.append(1, [self.order])
+        checkpoint.close()
+
+        # WHEN
+        other_checkpoint = Checkpoint(self.test_config, "order-history", {**self.query, "year": 2011})
+
+        # THEN
+        self.assertNotEqual(checkpoint.path, other_checkpoint.path)
+        self.assertEqual([], other_checkpoint.load())
+
+    def test_clear(self):
+        # GIVEN
+        self.test_config.update_config("checkpoint_dir", os.path.join(self.test_output_dir, "checkpoints"),
+                                       save=False)
+        checkpoint = Checkpoint(self.test_config, "order-history", self.query)
+        checkpoint.append(1, [self.order])
+
+        # WHEN
+        checkpoint.clear()
+
+        # THEN
+        self.assertEqual(os.path.join(self.test_output_dir, "checkpoints"), checkpoint.checkpoint_dir)
+        self.assertFalse(os.path.exists(checkpoint.path))
+        self.assertEqual([], checkpoint.load())
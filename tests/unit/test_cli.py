@@ -3,7 +3,7 @@ __license__ = "MIT"
 
 import datetime
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import responses
 from click.testing import CliRunner
@@ -116,6 +116,90 @@ class TestCli(UnitTestCase):
         self.assertIn("Order #113-4970960-6452217", response.output)
         self.assertIn("Order #112-9733602-9062669", response.output)
 
+    @responses.activate
+    def test_history_command_years(self):
+        # GIVEN
+        self.given_unauthenticated_home_page()
+        self.given_login_responses_success()
+        resp1 = self.given_order_history_exists(2010, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2010-10.html"), "r",
+                  encoding="utf-8") as f:
+            resp2 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+                body=f.read(),
+                status=200,
+            )
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2023-zero-orders.html"), "r",
+                  encoding="utf-8") as f:
+            resp3 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2011",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        response = self.runner.invoke(amazon_orders_cli,
+                                      [
+                                          "--config-path", self.test_config.config_path,
+                                          "--username", "some-username@gmail.com",
+                                          "--password", "some-password",
+                                          "history", "--years", "2010-2011"])
+
+        # THEN
+        self.assertEqual(0, response.exit_code)
+        self.assert_login_responses_success()
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(1, resp3.call_count)
+        self.assertIn("Order History for 2010-2011", response.output)
+        self.assertIn("12 Orders fetched for 2010", response.output)
+        self.assertIn("0 Orders fetched for 2011", response.output)
+        self.assertIn("... 12 Orders parsed", response.output)
+
+    @responses.activate
+    def test_history_command_resume(self):
+        # GIVEN
+        self.given_unauthenticated_home_page()
+        self.given_login_responses_success()
+        resp1 = self.given_order_history_exists(2010, start_index=0)
+        resp2 = responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+            "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+            status=503,
+        )
+        args = ["--config-path", self.test_config.config_path,
+                "--username", "some-username@gmail.com",
+                "--password", "some-password",
+                "history", "--year", "2010", "--resume"]
+        response = self.runner.invoke(amazon_orders_cli, args)
+        self.assertEqual(2, response.exit_code)
+        resp3 = self.given_order_history_exists(2010, start_index=10)
+
+        # WHEN
+        response = self.runner.invoke(amazon_orders_cli, args)
+
+        # THEN
+        self.assertEqual(0, response.exit_code)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(1, resp3.call_count)
+        self.assertIn("... 12 Orders parsed", response.output)
+
+    def test_history_command_years_invalid(self):
+        # WHEN
+        response = self.runner.invoke(amazon_orders_cli,
+                                      [
+                                          "--config-path", self.test_config.config_path,
+                                          "history", "--years", "2010-2011", "--year", "2010"])
+
+        # THEN
+        self.assertEqual(2, response.exit_code)
+        self.assertIn("--years may not be used with", response.output)
+
     @responses.activate
     def test_order_command(self):
         # GIVEN
@@ -182,6 +266,70 @@ class TestCli(UnitTestCase):
         self.assertIn("1 Transactions parsed", response.output)
         self.assertIn("Transaction: 2024-10-11\n  Order #123-4567890-1234567\n  Grand Total: -$45.19", response.output)
 
+    @responses.activate
+    def test_order_command_multiple_from_stdin(self):
+        # GIVEN
+        found_order_id = "112-2961628-4757846"
+        not_found_order_id = "111-0000000-0000000"
+        self.given_unauthenticated_home_page()
+        self.given_login_responses_success()
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-details-{found_order_id}.html"), "r",
+                  encoding="utf-8") as f:
+            resp1 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={found_order_id}",
+                body=f.read(),
+                status=200,
+            )
+        resp2 = responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={not_found_order_id}",
+            status=302,
+            headers={"Location": self.test_config.constants.ORDER_HISTORY_URL}
+        )
+        responses.add(
+            responses.GET,
+            self.test_config.constants.ORDER_HISTORY_URL,
+            status=200
+        )
+
+        # WHEN
+        response = self.runner.invoke(amazon_orders_cli,
+                                      [
+                                          "--config-path", self.test_config.config_path,
+                                          "--username", "some-username@gmail.com",
+                                          "--password", "some-password",
+                                          "order", "-"],
+                                      input=f"{found_order_id}\n{not_found_order_id}\n{found_order_id}\n")
+
+        # THEN
+        self.assertEqual(2, response.exit_code)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertIn(f"Order #{found_order_id}", response.output)
+        self.assertIn(f"Error: Order {not_found_order_id} could not be fetched", response.output)
+        self.assertIn("1 of 2 Orders could not be fetched.", response.output)
+
+    def test_order_command_no_ids_from_tty(self):
+        # GIVEN
+        stdin = MagicMock()
+        stdin.isatty.return_value = True
+
+        # WHEN
+        with patch("amazonorders.cli.click.get_text_stream", return_value=stdin):
+            response = self.runner.invoke(amazon_orders_cli,
+                                          [
+                                              "--config-path", self.test_config.config_path,
+                                              "--username", "some-username@gmail.com",
+                                              "--password", "some-password",
+                                              "order"
+                                          ])
+
+        # THEN
+        self.assertEqual(2, response.exit_code)
+        self.assertIn("At least one Order ID must be given.", response.output)
+        stdin.__iter__.assert_not_called()
+
     @responses.activate
     def test_history_command_error(self):
         # GIVEN
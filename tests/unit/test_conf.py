@@ -3,13 +3,23 @@ __license__ = "MIT"
 
 import os
 import shutil
-from unittest import TestCase
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
 
 import yaml
+from bs4 import BeautifulSoup
+from bs4.exceptions import FeatureNotFound
 
 from amazonorders import conf
 from amazonorders.conf import AmazonOrdersConfig
 
+try:
+    import lxml  # noqa: F401
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 
 class TestConf(TestCase):
     def setUp(self):
@@ -48,6 +58,11 @@ class TestConf(TestCase):
         self.assertEqual(self.test_output_dir, config.output_dir)
         self.assertEqual(self.test_cookie_jar_path, config.cookie_jar_path)
         self.assertEqual("html.parser", config.bs4_parser)
+        self.assertEqual(1, config.history_prefetch_depth)
+        self.assertFalse(config.history_planned_paging)
+        self.assertFalse(config.order_details_cache)
+        self.assertFalse(config.rate_limit)
+        self.assertFalse(config.strip_scripts)
         self.assertFalse(config.warn_on_missing_required_field)
 
         # GIVEN
@@ -60,18 +75,40 @@ class TestConf(TestCase):
             self.assertEqual("""auth_forms_classes: []
 auth_reattempt_wait: 5
 bs4_parser: html.parser
+checkpoint_dir: null
 connection_pool_size: {connection_pool_size}
 constants_class: amazonorders.constants.Constants
 cookie_jar_path: {cookie_jar_path}
+cookie_persist_delay: 1
 cookie_reattempt_wait: 0.5
+debug_output_compression: null
+debug_output_max_bytes: 0
+debug_output_max_files: 0
+details_max_retries: 3
+details_retry_wait: 1
+history_planned_paging: false
+history_prefetch_depth: 1
 item_class: amazonorders.entity.item.Item
 max_auth_attempts: 10
 max_auth_retries: 1
 max_cookie_attempts: 10
 order_class: amazonorders.entity.order.Order
+order_details_cache: false
+order_details_cache_dir: null
+order_details_cache_ttl: 86400
 output_dir: {output_dir}
+rate_limit: false
+rate_limit_max_in_flight: {thread_pool_size}
+rate_limit_max_requests_per_second: 10
+rate_limit_max_retries: 3
+rate_limit_min_requests_per_second: 0.5
+rate_limit_retry_wait: 1
+request_connect_timeout: 10
+request_read_timeout: 30
 selectors_class: amazonorders.selectors.Selectors
 shipment_class: amazonorders.entity.shipment.Shipment
+strip_scripts: false
+sync_state_path: null
 thread_pool_size: {thread_pool_size}
 warn_on_missing_required_field: false
 """
@@ -125,6 +162,34 @@ some_custom_config: {custom_config}
         self.assertEqual("html.parser", config.bs4_parser)
         self.assertTrue(any("this-parser-does-not-exist" in m for m in logs.output))
 
+    @skipUnless(HAS_LXML, "lxml optional dependency not installed")
+    def test_auto_bs4_parser_uses_lxml(self):
+        # GIVEN / WHEN
+        config = AmazonOrdersConfig(data={
+            "bs4_parser": "auto"
+        })
+
+        # THEN
+        self.assertEqual("lxml", config.bs4_parser)
+
+    def test_auto_bs4_parser_falls_back_to_html_parser(self):
+        # GIVEN
+        def beautiful_soup(markup, features):
+            if features == "lxml":
+                raise FeatureNotFound(f"Couldn't find a tree builder with the features you requested: {features}.")
+            return BeautifulSoup(markup, features)
+
+        # WHEN
+        with patch("amazonorders.conf.BeautifulSoup", side_effect=beautiful_soup):
+            with self.assertLogs("amazonorders.conf", level="DEBUG") as logs:
+                config = AmazonOrdersConfig(data={
+                    "bs4_parser": "auto"
+                })
+
+        # THEN
+        self.assertEqual("html.parser", config.bs4_parser)
+        self.assertTrue(any("'lxml' isn't installed" in m for m in logs.output))
+
     def test_update_config(self):
         # GIVEN
         config = AmazonOrdersConfig(data={
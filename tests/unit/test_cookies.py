@@ -0,0 +1,121 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import json
+import os
+from unittest.mock import patch
+
+from amazonorders import util
+from amazonorders.cookies import CookieJarPersister
+from tests.unittestcase import UnitTestCase
+
+
+class TestCookies(UnitTestCase):
+    def setUp(self):
+        super().setUp()
+
+        os.makedirs(os.path.dirname(self.test_cookie_jar_path), exist_ok=True)
+
+    def _read_cookie_jar(self):
+        with open(self.test_cookie_jar_path, "r", encoding="utf-8") as f:
+            return json.loads(f.read())
+
+    def test_persist(self):
+        # GIVEN
+        persister = CookieJarPersister(self.test_cookie_jar_path)
+
+        # WHEN
+        persister.persist({"session-id": "my-session-id"})
+
+        # THEN
+        self.assertEqual({"session-id": "my-session-id"}, self._read_cookie_jar())
+        self.assertEqual({"session-id": "my-session-id"}, CookieJarPersister(self.test_cookie_jar_path).load())
+        self.assertEqual([os.path.basename(self.test_cookie_jar_path)],
+                         [f for f in os.listdir(os.path.dirname(self.test_cookie_jar_path)) if f.endswith(".json")])
+
+    def test_persist_unchanged_not_written(self):
+        # GIVEN
+        persister = CookieJarPersister(self.test_cookie_jar_path)
+        persister.persist({"session-id": "my-session-id"})
+
+        # WHEN
+        with patch("amazonorders.cookies.util.atomic_write", wraps=util.atomic_write) as mock_atomic_write:
+            persister.persist({"session-id": "my-session-id"})
+
+        # THEN
+        mock_atomic_write.assert_not_called()
+
+    def test_persist_delay_coalesces_writes(self):
+        # GIVEN
+        persister = CookieJarPersister(self.test_cookie_jar_path, delay=0.2)
+
+        # WHEN
+        with patch("amazonorders.cookies.util.atomic_write", wraps=util.atomic_write) as mock_atomic_write:
+            for i in range(10):
+                persister.persist({"session-id": "my-session-id", "session-token": f"my-session-token-{i}"})
+            timer = persister._timer
+
+            # THEN
+            mock_atomic_write.assert_not_called()
+            self.assertFalse(os.path.exists(self.test_cookie_jar_path))
+
+            # WHEN
+            timer.join(5)
+
+        # THEN
+        self.assertEqual(1, mock_atomic_write.call_count)
+        self.assertIsNone(persister._timer)
+        self.assertEqual({"session-id": "my-session-id", "session-token": "my-session-token-9"},
+                         self._read_cookie_jar())
+
+    def test_flush(self):
+        # GIVEN
+        persister = CookieJarPersister(self.test_cookie_jar_path, delay=60)
+        persister.persist({"session-id": "my-session-id"})
+
+        # WHEN
+        persister.flush()
+
+        # THEN
+        self.assertIsNone(persister._timer)
+        self.assertEqual({"session-id": "my-session-id"}, self._read_cookie_jar())
+
+    def test_persist_merges_changes_from_other_persisters(self):
+        # GIVEN
+        with open(self.test_cookie_jar_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"session-id": "my-session-id", "skin": "noskin"}))
+        persister1 = CookieJarPersister(self.test_cookie_jar_path)
+        persister2 = CookieJarPersister(self.test_cookie_jar_path)
+        persister1.load()
+        persister2.load()
+
+        # WHEN
+        persister1.persist({"session-id": "my-session-id", "skin": "noskin", "session-token": "my-session-token"})
+        persister2.persist({"session-id": "my-other-session-id"})
+
+        # THEN
+        self.assertEqual({"session-id": "my-other-session-id", "session-token": "my-session-token"},
+                         self._read_cookie_jar())
+
+    def test_persist_replace(self):
+        # GIVEN
+        with open(self.test_cookie_jar_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"session-id": "my-session-id", "x-main": "bleep-bleep-bloop"}))
+        persister = CookieJarPersister(self.test_cookie_jar_path)
+
+        # WHEN
+        persister.persist({"skin": "noskin"}, replace=True)
+
+        # THEN
+        self.assertEqual({"skin": "noskin"}, self._read_cookie_jar())
+
+    def test_load_corrupt_cookie_jar(self):
+        # GIVEN
+        with open(self.test_cookie_jar_path, "w", encoding="utf-8") as f:
+            f.write("{\"session-id\": ")
+
+        # WHEN
+        cookies = CookieJarPersister(self.test_cookie_jar_path).load()
+
+        # THEN
+        self.assertEqual({}, cookies)
@@ -1,17 +1,36 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import asyncio
+import collections
+import datetime
+import json
 import os
+import re
+import threading
 import unittest
+import urllib.parse
 from datetime import date
+from unittest.mock import patch
 
+import requests
 import responses
 
-from amazonorders.exception import AmazonOrdersError, AmazonOrdersNotFoundError, AmazonOrdersAuthRedirectError
+from amazonorders import util
+from amazonorders.exception import (AmazonOrdersError, AmazonOrdersNotFoundError, AmazonOrdersAuthRedirectError,
+                                    AmazonOrdersDeadlineError, AmazonOrdersResponseError)
 from amazonorders.orders import AmazonOrders
 from amazonorders.session import AmazonSession
 from tests.unittestcase import UnitTestCase
 
+try:
+    import httpx
+    import respx
+
+    HAS_RESPX = True
+except ImportError:
+    HAS_RESPX = False
+
 
 class TestOrders(UnitTestCase):
     temp_order_history_file_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "output",
@@ -27,6 +46,12 @@ class TestOrders(UnitTestCase):
                                             config=self.test_config)
 
         self.amazon_orders = AmazonOrders(self.amazon_session)
+        self.sync_state_path = os.path.join(os.path.dirname(self.test_cookie_jar_path), "sync-state.json")
+
+    def tearDown(self):
+        self.amazon_orders.close()
+
+        super().tearDown()
 
     def test_get_order_unauthenticated(self):
         # WHEN
@@ -89,6 +114,26 @@ class TestOrders(UnitTestCase):
         self.assert_orders_list_index(orders)
         self.assertEqual(1, resp.call_count)
 
+    @responses.activate
+    def test_get_order_history_strip_scripts(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2018
+        self.given_order_history_exists(year)
+        self.test_config.update_config("strip_scripts", False, save=False)
+        orders = self.amazon_orders.get_order_history(year=year, keep_paging=False)
+        self.test_config.update_config("strip_scripts", True, save=False)
+
+        # WHEN
+        stripped_orders = self.amazon_orders.get_order_history(year=year, keep_paging=False)
+
+        # THEN
+        self.assertEqual(10, len(stripped_orders))
+        self.assert_order_112_0399923_3070642(stripped_orders[3], False)
+        self.assertEqual([(o.order_number, o.grand_total, o.recipient.name if o.recipient else None) for o in orders],
+                         [(o.order_number, o.grand_total, o.recipient.name if o.recipient else None)
+                          for o in stripped_orders])
+
     @responses.activate
     def test_get_order_history_errors_with_meta(self):
         # GIVEN
@@ -272,212 +317,1259 @@ class TestOrders(UnitTestCase):
         self.assertEqual(1, resp2.call_count)
 
     @responses.activate
-    def test_get_order_history_fresh(self):
+    def test_get_order_history_planned_paging(self):
         # GIVEN
+        self.test_config.update_config("history_planned_paging", True, save=False)
         self.amazon_session.is_authenticated = True
-        year = 2024
-        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-fresh.html"), "r",
-                  encoding="utf-8") as f:
-            resp = responses.add(
-                responses.GET,
-                self.test_config.constants.ORDER_HISTORY_URL,
-                body=f.read(),
-                status=200,
-            )
+        year = 2010
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        resp2 = self.given_order_history_exists(year, start_index=10)
 
         # WHEN
-        orders = self.amazon_orders.get_order_history(year=year, keep_paging=False)
+        orders = self.amazon_orders.get_order_history(year=year)
 
         # THEN
-        self.assertEqual(10, len(orders))
-        self.assertEqual(1, resp.call_count)
-        order = orders[4]
-        self.assertEqual("111-2072777-8279433", order.order_number)
-        self.assertEqual(4, order.index)
-        self.assertIsNone(order.grand_total)  # Amazon Fresh orders are unsupported order types
-        self.assertIsNotNone(order.order_details_link)
-        self.assertEqual(date(2025, 1, 3), order.order_placed_date)
-        self.assertEqual(0, len(order.items))
+        self.assertEqual(12, len(orders))
+        self.assertEqual(list(range(12)), [o.index for o in orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
 
     @responses.activate
-    def test_get_order_history_wholefoods(self):
+    @patch("amazonorders.session.httpx", None)
+    def test_aget_order_history_planned_paging(self):
         # GIVEN
+        self.test_config.update_config("history_planned_paging", True, save=False)
         self.amazon_session.is_authenticated = True
-        year = 2024
-        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-wholefoods.html"), "r",
+        year = 2010
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        resp2 = self.given_order_history_exists(year, start_index=10)
+
+        # WHEN
+        orders = asyncio.run(self.amazon_orders.aget_order_history(year=year))
+
+        # THEN
+        self.assertEqual(12, len(orders))
+        self.assertEqual(list(range(12)), [o.index for o in orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_planned_paging_no_count_follows_links(self):
+        # GIVEN
+        self.test_config.update_config("history_planned_paging", True, save=False)
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-10.html"), "r",
                   encoding="utf-8") as f:
-            resp = responses.add(
+            resp2 = responses.add(
                 responses.GET,
-                self.test_config.constants.ORDER_HISTORY_URL,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
                 body=f.read(),
                 status=200,
             )
 
         # WHEN
-        orders = self.amazon_orders.get_order_history(year=year, keep_paging=False)
+        with patch.object(self.amazon_orders, "_parse_order_count", return_value=None):
+            orders = self.amazon_orders.get_order_history(year=year)
 
         # THEN
-        self.assertEqual(10, len(orders))
-        self.assertEqual(1, resp.call_count)
-        order = orders[7]
-        self.assertEqual("113-6307059-7336242", order.order_number)
-        self.assertIsNone(order.grand_total)  # Whole Foods orders are unsupported order types
-        self.assertIsNotNone(order.order_details_link)
-        self.assertEqual(date(2024, 12, 12), order.order_placed_date)
-        self.assertEqual(0, len(order.items))
+        self.assertEqual(12, len(orders))
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
 
-    @responses.activate
-    def test_get_order_history_full_details_wholefood_skip(self):
-        # GIVEN
-        self.amazon_session.is_authenticated = True
-        year = 2024
-        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-wholefoods-catering.html"), "r",
+    def given_sync_order_history_exists(self):
+        resp1 = self.given_order_history_exists(2010, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2010-10.html"), "r",
                   encoding="utf-8") as f:
-            resp1 = responses.add(
+            resp2 = responses.add(
                 responses.GET,
-                self.test_config.constants.ORDER_HISTORY_URL,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
                 body=f.read(),
                 status=200,
             )
-        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+        return resp1, resp2
+
+    @responses.activate
+    @patch("amazonorders.orders.datetime", wraps=datetime)
+    def test_sync_order_history(self, mock_today):
+        # GIVEN
+        mock_today.date.today.return_value = datetime.date(2010, 12, 1)
+        self.amazon_session.is_authenticated = True
+        resp1, resp2 = self.given_sync_order_history_exists()
 
         # WHEN
-        orders = self.amazon_orders.get_order_history(year=year, keep_paging=False, full_details=True)
+        orders = self.amazon_orders.sync_order_history()
 
         # THEN
-        self.assertEqual(10, len(orders))
+        self.assertEqual(12, len(orders))
         self.assertEqual(1, resp1.call_count)
-        self.assertEqual(6, resp2.call_count)
+        self.assertEqual(1, resp2.call_count)
+        with open(self.sync_state_path, "r", encoding="utf-8") as f:
+            self.assertEqual({"some-username@gmail.com@www.amazon.com": {
+                "order_placed_date": "2010-11-17",
+                "order_numbers": ["104-5796370-4938630"]
+            }}, json.loads(f.read()))
+
+        # WHEN
+        orders = self.amazon_orders.sync_order_history()
+
+        # THEN
+        self.assertEqual(0, len(orders))
+        self.assertEqual(2, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
 
     @responses.activate
-    def test_get_order_history_full_details(self):
+    @patch("amazonorders.orders.datetime", wraps=datetime)
+    def test_sync_order_history_details_errors_synced_again(self, mock_today):
         # GIVEN
+        mock_today.date.today.return_value = datetime.date(2010, 12, 1)
         self.amazon_session.is_authenticated = True
-        year = 2020
-        start_index = 40
-        resp1 = self.given_order_history_exists(year, start_index)
-        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+        resp1, resp2 = self.given_sync_order_history_exists()
+        failed_order_id = "104-3986659-2683402"
+        calls = self.given_flaky_order_details_exist({failed_order_id: 4})
 
         # WHEN
-        orders = self.amazon_orders.get_order_history(year=year,
-                                                      start_index=start_index,
-                                                      keep_paging=False,
-                                                      full_details=True)
+        orders = self.amazon_orders.sync_order_history(full_details=True)
 
         # THEN
-        self.assertEqual(10, len(orders))
-        self.assert_order_114_9460922_7737063(orders[3], True)
-        self.assertEqual(43, orders[3].index)
-        self.assert_orders_list_index(orders)
-        self.assertEqual(1, resp1.call_count)
-        self.assertEqual(10, resp2.call_count)
+        self.assertEqual(12, len(orders))
+        self.assertEqual([failed_order_id], [o.order_number for o in orders if o.details_error])
+        self.assertEqual(4, calls[failed_order_id])
+        with open(self.sync_state_path, "r", encoding="utf-8") as f:
+            self.assertEqual({"some-username@gmail.com@www.amazon.com": {
+                "order_placed_date": "2010-05-20",
+                "order_numbers": ["103-2893758-2262654"]
+            }}, json.loads(f.read()))
+
+        # WHEN
+        orders = self.amazon_orders.sync_order_history(full_details=True)
+
+        # THEN
+        self.assertEqual(["104-5796370-4938630", "105-7345337-6583405", failed_order_id],
+                         [o.order_number for o in orders])
+        self.assertTrue(all(o.full_details and o.details_error is None for o in orders))
+        self.assertEqual(2, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        with open(self.sync_state_path, "r", encoding="utf-8") as f:
+            self.assertEqual({"some-username@gmail.com@www.amazon.com": {
+                "order_placed_date": "2010-11-17",
+                "order_numbers": ["104-5796370-4938630"]
+            }}, json.loads(f.read()))
 
     @responses.activate
-    def test_get_order_history_multiple_items(self):
+    @patch("amazonorders.orders.datetime", wraps=datetime)
+    def test_sync_order_history_keeps_other_accounts_state(self, mock_today):
         # GIVEN
+        mock_today.date.today.return_value = datetime.date(2010, 12, 1)
         self.amazon_session.is_authenticated = True
-        year = 2020
-        start_index = 40
-        resp1 = self.given_order_history_exists(year, start_index)
-        resp2 = self.given_any_order_details_exists("order-details-113-1625648-3437067.html")
+        other_state = {"other-username@gmail.com@www.amazon.com": {
+            "order_placed_date": "2024-01-02",
+            "order_numbers": ["111-1111111-1111111"]
+        }}
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2010-0.html"), "r",
+                  encoding="utf-8") as f:
+            order_history_body = f.read()
+
+        # Another process syncs a different account while this sync is paging
+        def order_history_page(request):
+            with open(self.sync_state_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(other_state))
+            return 200, {}, order_history_body
+
+        responses.add_callback(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010",
+            callback=order_history_page,
+        )
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2010-10.html"), "r",
+                  encoding="utf-8") as f:
+            responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+                body=f.read(),
+                status=200,
+            )
 
         # WHEN
-        orders = self.amazon_orders.get_order_history(year=year,
-                                                      start_index=start_index,
-                                                      keep_paging=False,
-                                                      full_details=True)
+        with patch("amazonorders.orders.util.file_lock", wraps=util.file_lock) as mock_file_lock:
+            self.amazon_orders.sync_order_history()
 
         # THEN
-        self.assertEqual(10, len(orders))
-        self.assert_order_113_1625648_3437067_multiple_items(orders[6], True)
-        self.assertEqual(43, orders[3].index)
-        self.assertEqual(1, resp1.call_count)
-        self.assertEqual(10, resp2.call_count)
+        self.assertEqual(2, mock_file_lock.call_count)
+        self.assertTrue(all(c.args[0] == self.sync_state_path for c in mock_file_lock.call_args_list))
+        with open(self.sync_state_path, "r", encoding="utf-8") as f:
+            state = json.loads(f.read())
+        self.assertEqual(other_state["other-username@gmail.com@www.amazon.com"],
+                         state["other-username@gmail.com@www.amazon.com"])
+        self.assertEqual("2010-11-17", state["some-username@gmail.com@www.amazon.com"]["order_placed_date"])
 
     @responses.activate
-    def test_get_order_history_return(self):
+    @patch("amazonorders.orders.datetime", wraps=datetime)
+    def test_sync_order_history_across_years(self, mock_today):
         # GIVEN
+        mock_today.date.today.return_value = datetime.date(2011, 2, 1)
         self.amazon_session.is_authenticated = True
-        year = 2020
-        start_index = 50
-        resp1 = self.given_order_history_exists(year, start_index)
-        resp2 = self.given_any_order_details_exists("order-details-112-2961628-4757846.html")
+        with open(self.sync_state_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"some-username@gmail.com@www.amazon.com": {
+                "order_placed_date": "2010-04-08",
+                "order_numbers": ["102-4543363-8436201"]
+            }}))
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2023-zero-orders.html"), "r",
+                  encoding="utf-8") as f:
+            resp1 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2011",
+                body=f.read(),
+                status=200,
+            )
+        resp2, resp3 = self.given_sync_order_history_exists()
 
         # WHEN
-        orders = self.amazon_orders.get_order_history(year=year,
-                                                      start_index=start_index,
-                                                      keep_paging=False,
-                                                      full_details=True)
+        orders = self.amazon_orders.sync_order_history()
 
         # THEN
-        self.assertEqual(10, len(orders))
-        self.assert_order_112_2961628_4757846_return(orders[1], True)
-        self.assertEqual(53, orders[3].index)
+        self.assertEqual(["104-5796370-4938630", "105-7345337-6583405", "104-3986659-2683402",
+                          "103-2893758-2262654", "002-7207876-5547402", "002-6394652-2038615",
+                          "102-4633722-7165810"], [o.order_number for o in orders])
         self.assertEqual(1, resp1.call_count)
-        self.assertEqual(10, resp2.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(0, resp3.call_count)
+
+    def test_sync_order_history_unauthenticated(self):
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.sync_order_history()
+
+        self.assertEqual("Call AmazonSession.login() to authenticate first.", str(cm.exception))
 
     @responses.activate
-    def test_get_order_history_quantity(self):
+    def test_get_order_history_range(self):
         # GIVEN
         self.amazon_session.is_authenticated = True
-        year = 2020
-        start_index = 50
-        resp = self.given_order_history_exists(year, start_index)
+        resp1 = self.given_order_history_exists(2010, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2010-10.html"), "r",
+                  encoding="utf-8") as f:
+            resp2 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+                body=f.read(),
+                status=200,
+            )
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2023-zero-orders.html"), "r",
+                  encoding="utf-8") as f:
+            resp3 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2011",
+                body=f.read(),
+                status=200,
+            )
+        progress = {}
 
         # WHEN
-        orders = self.amazon_orders.get_order_history(year=year,
-                                                      start_index=start_index,
-                                                      keep_paging=False)
+        orders = self.amazon_orders.get_order_history_range(2010, 2011,
+                                                            progress_callback=lambda y, o: progress.update({y: o}))
 
         # THEN
-        self.assertEqual(10, len(orders))
-        self.assert_order_112_8888666_5244209_quantity(orders[7])
-        self.assertEqual(53, orders[3].index)
-        self.assertEqual(1, resp.call_count)
+        self.assertEqual(12, len(orders))
+        self.assertEqual(list(range(12)), [o.index for o in orders])
+        self.assertEqual({2010: 12, 2011: 0}, {y: len(o) for y, o in progress.items()})
+        self.assertEqual(orders[:12], progress[2010])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(1, resp3.call_count)
 
     @responses.activate
-    def test_get_order_history_multiple_items_shipments_sellers(self):
+    def test_get_order_history_range_full_details(self):
         # GIVEN
         self.amazon_session.is_authenticated = True
-        year = 2023
-        start_index = 10
-        resp1 = self.given_order_history_exists(year, start_index)
-        resp2 = self.given_any_order_details_exists("order-details-112-9685975-5907428.html")
+        resp1 = self.given_order_history_exists(2010, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2010-10.html"), "r",
+                  encoding="utf-8") as f:
+            resp2 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+                body=f.read(),
+                status=200,
+            )
+        resp3 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+        progress = []
 
         # WHEN
-        orders = self.amazon_orders.get_order_history(year=year,
-                                                      start_index=start_index,
-                                                      keep_paging=False,
-                                                      full_details=True)
+        orders = self.amazon_orders.get_order_history_range(2010, 2010, full_details=True,
+                                                            progress_callback=lambda y, o: progress.append(y))
 
         # THEN
-        self.assertEqual(10, len(orders))
-        self.assert_order_112_9685975_5907428_multiple_items_shipments_sellers(orders[3], True)
-        self.assertEqual(13, orders[3].index)
+        self.assertEqual(12, len(orders))
+        self.assertTrue(all(o.full_details for o in orders))
+        self.assertEqual(list(range(12)), [o.index for o in orders])
+        self.assertEqual([2010], progress)
         self.assertEqual(1, resp1.call_count)
-        self.assertEqual(10, resp2.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(12, resp3.call_count)
+
+    def test_get_order_history_range_invalid(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.get_order_history_range(2025, 2010)
+
+        # THEN
+        self.assertEqual("'start_year' must not be after 'end_year'.", str(cm.exception))
 
     @responses.activate
-    def test_get_order(self):
+    def test_iter_order_history_paginated(self):
         # GIVEN
         self.amazon_session.is_authenticated = True
-        order_id = "112-9685975-5907428"
-        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-details-{order_id}.html"), "r",
+        year = 2010
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-10.html"), "r",
                   encoding="utf-8") as f:
-            resp = responses.add(
+            resp2 = responses.add(
                 responses.GET,
-                f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={order_id}",
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
                 body=f.read(),
                 status=200,
             )
 
         # WHEN
-        order = self.amazon_orders.get_order(order_id)
+        orders = self.amazon_orders.iter_order_history(year=year)
+        first_order = next(orders)
 
         # THEN
-        self.assert_order_112_9685975_5907428_multiple_items_shipments_sellers(order, True)
-        self.assertIsNone(order.index)
-        self.assertEqual(1, resp.call_count)
+        self.assertEqual(0, first_order.index)
+        self.assertEqual(1, resp1.call_count)
+
+        # WHEN
+        remaining_orders = list(orders)
+
+        # THEN
+        self.assertEqual(11, len(remaining_orders))
+        self.assertEqual(list(range(1, 12)), [o.index for o in remaining_orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
+    @responses.activate
+    def test_iter_order_history_prefetches_next_page(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-10.html"), "r",
+                  encoding="utf-8") as f:
+            order_history_body = f.read()
+        next_page_requested = threading.Event()
+
+        def order_history_page(request):
+            next_page_requested.set()
+            return 200, {}, order_history_body
+
+        resp2 = responses.add_callback(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+            "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+            callback=order_history_page,
+        )
+
+        # WHEN
+        orders = self.amazon_orders.iter_order_history(year=year)
+        first_order = next(orders)
+
+        # THEN
+        # The consumer is still on the first page, but the second page is requested without waiting on it
+        self.assertEqual(0, first_order.index)
+        self.assertTrue(next_page_requested.wait(timeout=5))
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
+        # WHEN
+        remaining_orders = list(orders)
+
+        # THEN
+        self.assertEqual(list(range(1, 12)), [o.index for o in remaining_orders])
+        self.assertEqual(1, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_paginated_no_prefetch(self):
+        # GIVEN
+        self.test_config.update_config("history_prefetch_depth", 0, save=False)
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-10.html"), "r",
+                  encoding="utf-8") as f:
+            resp2 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year)
+
+        # THEN
+        self.assertEqual(12, len(orders))
+        self.assertEqual(list(range(0, 12)), [o.index for o in orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_deadline(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        self.given_order_history_exists(year, start_index=0)
+        release = threading.Event()
+
+        def stalled_page(request):
+            release.wait(5)
+            return 503, {}, ""
+
+        responses.add_callback(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+            "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+            callback=stalled_page,
+        )
+
+        # WHEN
+        try:
+            with self.assertRaises(AmazonOrdersDeadlineError) as cm:
+                self.amazon_orders.get_order_history(year=year, deadline=1)
+        finally:
+            release.set()
+
+        # THEN
+        self.assertEqual({"index": 10}, cm.exception.meta)
+        self.assertEqual(list(range(0, 10)), [o.index for o in cm.exception.results])
+
+    @responses.activate
+    def test_get_order_history_prefetched_page_errors_with_meta(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        self.given_order_history_exists(year, start_index=0)
+        resp = responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+            "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+            status=503,
+        )
+
+        # WHEN
+        orders = self.amazon_orders.iter_order_history(year=year)
+        first_page = [next(orders) for _ in range(10)]
+        with self.assertRaises(AmazonOrdersError) as cm:
+            next(orders)
+
+        # THEN
+        self.assertEqual(list(range(0, 10)), [o.index for o in first_page])
+        self.assertEqual(1, resp.call_count)
+        self.assertEqual(10, cm.exception.meta["index"])
+
+    @responses.activate
+    def test_get_order_history_resume(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+            "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+            status=503,
+        )
+        with self.assertRaises(AmazonOrdersError):
+            self.amazon_orders.get_order_history(year=year, resume=True)
+        resp2 = self.given_order_history_exists(year, start_index=10)
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year, resume=True)
+
+        # THEN
+        self.assertEqual(list(range(0, 12)), [o.index for o in orders])
+        self.assertIsNone(orders[0].parsed)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual([], os.listdir(os.path.join(os.path.dirname(self.test_cookie_jar_path), "checkpoints")))
+
+    @responses.activate
+    def test_iter_order_history_resume_full_details(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        self.test_config.update_config("history_prefetch_depth", 0, save=False)
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-10.html"), "r",
+                  encoding="utf-8") as f:
+            resp2 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}&startIndex=3",
+                body=f.read(),
+                status=200,
+            )
+        resp3 = self.given_any_order_details_exists("order-details-112-2961628-4757846.html")
+        orders = self.amazon_orders.iter_order_history(year=year, full_details=True, resume=True)
+        interrupted_orders = [next(orders) for _ in range(3)]
+        orders.close()
+        self.amazon_orders.close()
+        details_call_count = resp3.call_count
+
+        # WHEN
+        orders = list(self.amazon_orders.iter_order_history(year=year, full_details=True, resume=True))
+
+        # THEN
+        self.assertEqual([o.order_number for o in interrupted_orders], [o.order_number for o in orders[:3]])
+        self.assertEqual(list(range(0, 5)), [o.index for o in orders])
+        self.assertTrue(all(o.full_details for o in orders))
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(2, resp3.call_count - details_call_count)
+
+    @responses.activate
+    def test_get_order_history_resume_retries_details_errors(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        self.given_order_history_exists(year, start_index)
+        calls = self.given_flaky_order_details_exist({"114-9460922-7737063": 4})
+        orders = self.amazon_orders.get_order_history(year=year, start_index=start_index, keep_paging=False,
+                                                      full_details=True, resume=True)
+        self.assertIsNotNone(orders[3].details_error)
+        self.assertEqual(13, sum(calls.values()))
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2023-zero-orders.html"), "r",
+                  encoding="utf-8") as f:
+            resp = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}&startIndex=50",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year, start_index=start_index, keep_paging=False,
+                                                      full_details=True, resume=True)
+
+        # THEN
+        self.assertEqual(list(range(40, 50)), [o.index for o in orders])
+        self.assertTrue(all(o.full_details and o.details_error is None for o in orders))
+        self.assert_order_114_9460922_7737063(orders[3], True)
+        self.assertEqual(5, calls["114-9460922-7737063"])
+        self.assertEqual(14, sum(calls.values()))
+        self.assertEqual(1, resp.call_count)
+        self.assertEqual([], os.listdir(os.path.join(os.path.dirname(self.test_cookie_jar_path), "checkpoints")))
+
+    def test_iter_order_history_unauthenticated(self):
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.iter_order_history()
+
+        self.assertEqual("Call AmazonSession.login() to authenticate first.", str(cm.exception))
+
+    @responses.activate
+    def test_iter_order_history_full_details(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        self.given_order_history_exists(year, start_index)
+        resp = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = list(self.amazon_orders.iter_order_history(year=year,
+                                                            start_index=start_index,
+                                                            keep_paging=False,
+                                                            full_details=True))
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual(list(range(40, 50)), [o.index for o in orders])
+        self.assertTrue(all(o.full_details for o in orders))
+        self.assertEqual(10, resp.call_count)
+
+    @unittest.skipUnless(HAS_RESPX, "httpx optional dependency not installed")
+    def test_aget_order_history_full_details(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-{start_index}.html"), "r",
+                  encoding="utf-8") as f:
+            order_history_body = f.read()
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-114-9460922-7737063.html"), "r",
+                  encoding="utf-8") as f:
+            order_details_body = f.read()
+
+        async def get_order_history():
+            try:
+                return await self.amazon_orders.aget_order_history(year=year,
+                                                                   start_index=start_index,
+                                                                   keep_paging=False,
+                                                                   full_details=True)
+            finally:
+                await self.amazon_session.aclose()
+
+        # WHEN
+        with respx.mock:
+            resp1 = respx.get(url__startswith=self.test_config.constants.ORDER_HISTORY_URL).mock(
+                return_value=httpx.Response(200, text=order_history_body))
+            resp2 = respx.get(url__startswith=self.test_config.constants.ORDER_DETAILS_URL).mock(
+                return_value=httpx.Response(200, text=order_details_body))
+
+            orders = asyncio.run(get_order_history())
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assert_order_114_9460922_7737063(orders[3], True)
+        self.assertEqual(list(range(40, 50)), [o.index for o in orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @responses.activate
+    @patch("amazonorders.session.httpx", None)
+    def test_aget_order_history_without_httpx(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2018
+        resp = self.given_order_history_exists(year)
+
+        # WHEN
+        orders = asyncio.run(self.amazon_orders.aget_order_history(year=year, keep_paging=False))
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assert_order_112_0399923_3070642(orders[3], False)
+        self.assertEqual(1, resp.call_count)
+
+    def test_aget_order_history_unauthenticated(self):
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            asyncio.run(self.amazon_orders.aget_order_history())
+
+        self.assertEqual("Call AmazonSession.login() to authenticate first.", str(cm.exception))
+
+    @responses.activate
+    def test_get_order_history_fresh(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2024
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-fresh.html"), "r",
+                  encoding="utf-8") as f:
+            resp = responses.add(
+                responses.GET,
+                self.test_config.constants.ORDER_HISTORY_URL,
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year, keep_paging=False)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual(1, resp.call_count)
+        order = orders[4]
+        self.assertEqual("111-2072777-8279433", order.order_number)
+        self.assertEqual(4, order.index)
+        self.assertIsNone(order.grand_total)  # Amazon Fresh orders are unsupported order types
+        self.assertIsNotNone(order.order_details_link)
+        self.assertEqual(date(2025, 1, 3), order.order_placed_date)
+        self.assertEqual(0, len(order.items))
+
+    @responses.activate
+    def test_get_order_history_wholefoods(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2024
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-wholefoods.html"), "r",
+                  encoding="utf-8") as f:
+            resp = responses.add(
+                responses.GET,
+                self.test_config.constants.ORDER_HISTORY_URL,
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year, keep_paging=False)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual(1, resp.call_count)
+        order = orders[7]
+        self.assertEqual("113-6307059-7336242", order.order_number)
+        self.assertIsNone(order.grand_total)  # Whole Foods orders are unsupported order types
+        self.assertIsNotNone(order.order_details_link)
+        self.assertEqual(date(2024, 12, 12), order.order_placed_date)
+        self.assertEqual(0, len(order.items))
+
+    @responses.activate
+    def test_get_order_history_full_details_wholefood_skip(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2024
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-wholefoods-catering.html"), "r",
+                  encoding="utf-8") as f:
+            resp1 = responses.add(
+                responses.GET,
+                self.test_config.constants.ORDER_HISTORY_URL,
+                body=f.read(),
+                status=200,
+            )
+        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year, keep_paging=False, full_details=True)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(6, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_full_details(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year,
+                                                      start_index=start_index,
+                                                      keep_paging=False,
+                                                      full_details=True)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assert_order_114_9460922_7737063(orders[3], True)
+        self.assertEqual(43, orders[3].index)
+        self.assert_orders_list_index(orders)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    def given_flaky_order_details_exist(self, failures):
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-114-9460922-7737063.html"), "r",
+                  encoding="utf-8") as f:
+            body = f.read()
+        calls = collections.Counter()
+
+        def order_details(request):
+            order_id = urllib.parse.parse_qs(urllib.parse.urlsplit(request.url).query)["orderID"][0]
+            calls[order_id] += 1
+            if calls[order_id] <= failures.get(order_id, 0):
+                return 503, {}, ""
+            return 200, {}, body
+
+        responses.add_callback(
+            responses.GET,
+            re.compile(f"{self.test_config.constants.ORDER_DETAILS_URL}?.*"),
+            callback=order_details,
+        )
+        return calls
+
+    @responses.activate
+    def test_get_order_history_full_details_retries_transient_failures(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        self.given_order_history_exists(year, start_index)
+        calls = self.given_flaky_order_details_exist({"114-9460922-7737063": 2})
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year,
+                                                      start_index=start_index,
+                                                      keep_paging=False,
+                                                      full_details=True)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertTrue(all(o.full_details and o.details_error is None for o in orders))
+        self.assert_order_114_9460922_7737063(orders[3], True)
+        self.assertEqual(3, calls["114-9460922-7737063"])
+        self.assertEqual(12, sum(calls.values()))
+
+    @responses.activate
+    def test_get_order_history_full_details_failures_collected(self):
+        # GIVEN
+        self.test_config.update_config("details_max_retries", 2, save=False)
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        self.given_order_history_exists(year, start_index)
+        failed_order_id = "114-9460922-7737063"
+        calls = self.given_flaky_order_details_exist({failed_order_id: 10})
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year,
+                                                      start_index=start_index,
+                                                      keep_paging=False,
+                                                      full_details=True)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual([failed_order_id], [o.order_number for o in orders if o.details_error])
+        self.assertEqual(9, len([o for o in orders if o.full_details]))
+        failed_order = orders[3]
+        self.assertFalse(failed_order.full_details)
+        self.assertEqual(43, failed_order.index)
+        self.assertIsNotNone(failed_order.grand_total)
+        self.assertIsInstance(failed_order.details_error, AmazonOrdersResponseError)
+        self.assertEqual(503, failed_order.details_error.status_code)
+        self.assertEqual({"index": 43, "order_number": failed_order_id, "attempts": 3},
+                         failed_order.details_error.meta)
+        self.assertIsNone(failed_order.details_error.__traceback__)
+        self.assertEqual(3, calls[failed_order_id])
+
+    @responses.activate
+    @patch("amazonorders.session.httpx", None)
+    def test_aget_order_history_full_details_failures_collected(self):
+        # GIVEN
+        self.test_config.update_config("details_max_retries", 1, save=False)
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        self.given_order_history_exists(year, start_index)
+        failed_order_id = "114-9460922-7737063"
+        calls = self.given_flaky_order_details_exist({failed_order_id: 10, "111-6646931-5357866": 1})
+
+        # WHEN
+        orders = asyncio.run(self.amazon_orders.aget_order_history(year=year,
+                                                                   start_index=start_index,
+                                                                   keep_paging=False,
+                                                                   full_details=True))
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual([failed_order_id], [o.order_number for o in orders if o.details_error])
+        self.assertEqual(2, orders[3].details_error.meta["attempts"])
+        self.assertEqual(2, calls[failed_order_id])
+        self.assertEqual(2, calls["111-6646931-5357866"])
+
+    @responses.activate
+    def test_get_order_history_full_details_fields_skip_details(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year,
+                                                      start_index=start_index,
+                                                      keep_paging=False,
+                                                      full_details=True,
+                                                      fields=["order_number", "order_placed_date", "grand_total"])
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual("114-9460922-7737063", orders[3].order_number)
+        self.assertEqual(date(2020, 10, 27), orders[3].order_placed_date)
+        self.assertEqual(35.90, orders[3].grand_total)
+        self.assertFalse(orders[3].full_details)
+        self.assertNotIn("recipient", orders[3].__dict__)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(0, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_full_details_fields(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        self.given_order_history_exists(year, start_index)
+        resp = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year,
+                                                      start_index=start_index,
+                                                      keep_paging=False,
+                                                      full_details=True,
+                                                      fields=["order_number", "subtotal", "items.title"])
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertTrue(orders[3].full_details)
+        self.assertIn("subtotal", orders[3].__dict__)
+        self.assertNotIn("payment_method", orders[3].__dict__)
+        self.assertNotIn("seller", orders[3].items[0].__dict__)
+        self.assert_order_114_9460922_7737063(orders[3], True)
+        self.assertEqual(10, resp.call_count)
+
+    @responses.activate
+    def test_get_order_history_detach(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        self.given_order_history_exists(year, start_index)
+        resp = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year,
+                                                      start_index=start_index,
+                                                      keep_paging=False,
+                                                      full_details=True,
+                                                      fields=["order_number", "subtotal"],
+                                                      detach=True)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        for order in orders:
+            self.assertIsNone(order.parsed)
+            self.assertTrue(all(item.parsed is None for item in order.items))
+        self.assertIn("payment_method", orders[3].__dict__)
+        self.assert_order_114_9460922_7737063(orders[3], True)
+        self.assertEqual(10, resp.call_count)
+
+    @responses.activate
+    def test_get_order_history_full_details_shares_executor(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        self.given_order_history_exists(year, start_index)
+        resp = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        with AmazonOrders(self.amazon_session) as amazon_orders:
+            amazon_orders.get_order_history(year=year, start_index=start_index, keep_paging=False,
+                                            full_details=True)
+            executor = amazon_orders._executor
+            amazon_orders.get_order_history(year=year, start_index=start_index, keep_paging=False,
+                                            full_details=True)
+
+            # THEN
+            self.assertIsNotNone(executor)
+            self.assertIs(executor, amazon_orders._executor)
+            self.assertEqual(self.test_config.thread_pool_size, executor._max_workers)
+        self.assertIsNone(amazon_orders._executor)
+        self.assertEqual(20, resp.call_count)
+
+    @responses.activate
+    def test_get_order_history_multiple_items(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-113-1625648-3437067.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year,
+                                                      start_index=start_index,
+                                                      keep_paging=False,
+                                                      full_details=True)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assert_order_113_1625648_3437067_multiple_items(orders[6], True)
+        self.assertEqual(43, orders[3].index)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_return(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 50
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-112-2961628-4757846.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year,
+                                                      start_index=start_index,
+                                                      keep_paging=False,
+                                                      full_details=True)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assert_order_112_2961628_4757846_return(orders[1], True)
+        self.assertEqual(53, orders[3].index)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_quantity(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 50
+        resp = self.given_order_history_exists(year, start_index)
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year,
+                                                      start_index=start_index,
+                                                      keep_paging=False)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assert_order_112_8888666_5244209_quantity(orders[7])
+        self.assertEqual(53, orders[3].index)
+        self.assertEqual(1, resp.call_count)
+
+    @responses.activate
+    def test_get_order_history_multiple_items_shipments_sellers(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2023
+        start_index = 10
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-112-9685975-5907428.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year,
+                                                      start_index=start_index,
+                                                      keep_paging=False,
+                                                      full_details=True)
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assert_order_112_9685975_5907428_multiple_items_shipments_sellers(orders[3], True)
+        self.assertEqual(13, orders[3].index)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @responses.activate
+    def test_get_order(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        order_id = "112-9685975-5907428"
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-details-{order_id}.html"), "r",
+                  encoding="utf-8") as f:
+            resp = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={order_id}",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        order = self.amazon_orders.get_order(order_id)
+
+        # THEN
+        self.assert_order_112_9685975_5907428_multiple_items_shipments_sellers(order, True)
+        self.assertIsNone(order.index)
+        self.assertEqual(1, resp.call_count)
+
+    @unittest.skipUnless(HAS_RESPX, "httpx optional dependency not installed")
+    def test_aget_order(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        order_id = "112-2961628-4757846"
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-details-{order_id}.html"), "r",
+                  encoding="utf-8") as f:
+            order_details_body = f.read()
+
+        # WHEN
+        with respx.mock:
+            resp = respx.get(re.compile(re.escape(self.test_config.constants.ORDER_DETAILS_URL))).mock(
+                return_value=httpx.Response(200, text=order_details_body))
+
+            order = asyncio.run(self.amazon_orders.aget_order(order_id))
+
+        # THEN
+        self.assert_order_112_2961628_4757846_return(order, True)
+        self.assertEqual(1, resp.call_count)
+
+    @responses.activate
+    def test_get_order_details_cache(self):
+        # GIVEN
+        self.test_config.update_config("order_details_cache", True, save=False)
+        amazon_orders = AmazonOrders(self.amazon_session)
+        self.amazon_session.is_authenticated = True
+        order_id = "112-2961628-4757846"
+        resp = self.given_any_order_details_exists(f"order-details-{order_id}.html")
+
+        # WHEN
+        order1 = amazon_orders.get_order(order_id)
+        order2 = amazon_orders.get_order(order_id)
+
+        # THEN
+        self.assert_order_112_2961628_4757846_return(order1, True)
+        self.assert_order_112_2961628_4757846_return(order2, True)
+        self.assertEqual(1, resp.call_count)
+
+    @responses.activate
+    def test_get_order_history_full_details_cache(self):
+        # GIVEN
+        self.test_config.update_config("order_details_cache", True, save=False)
+        amazon_orders = AmazonOrders(self.amazon_session)
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-112-2961628-4757846.html")
+
+        # WHEN
+        orders1 = amazon_orders.get_order_history(year=year, start_index=start_index, keep_paging=False,
+                                                  full_details=True)
+        orders2 = amazon_orders.get_order_history(year=year, start_index=start_index, keep_paging=False,
+                                                  full_details=True)
+
+        # THEN
+        self.assertEqual(10, len(orders1))
+        self.assertEqual([o.order_number for o in orders1], [o.order_number for o in orders2])
+        self.assertTrue(all(o.full_details for o in orders2))
+        self.assertEqual(2, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    def given_get_orders_responses(self, found_order_id, not_found_order_id):
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-details-{found_order_id}.html"), "r",
+                  encoding="utf-8") as f:
+            resp1 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={found_order_id}",
+                body=f.read(),
+                status=200,
+            )
+        resp2 = responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={not_found_order_id}",
+            status=302,
+            headers={"Location": self.test_config.constants.ORDER_HISTORY_URL}
+        )
+        responses.add(
+            responses.GET,
+            self.test_config.constants.ORDER_HISTORY_URL,
+            status=200
+        )
+        return resp1, resp2
+
+    @responses.activate
+    def test_get_orders(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        found_order_id = "112-2961628-4757846"
+        not_found_order_id = "111-0000000-0000000"
+        resp1, resp2 = self.given_get_orders_responses(found_order_id, not_found_order_id)
+
+        # WHEN
+        orders = self.amazon_orders.get_orders([not_found_order_id, found_order_id, not_found_order_id])
+
+        # THEN
+        self.assertEqual([not_found_order_id, found_order_id], list(orders.keys()))
+        self.assertIsInstance(orders[not_found_order_id], AmazonOrdersNotFoundError)
+        self.assert_order_112_2961628_4757846_return(orders[found_order_id], True)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
+    @responses.activate
+    def test_get_orders_connection_errors(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        found_order_id = "112-2961628-4757846"
+        reset_order_id = "111-0000000-0000000"
+        resp1, _ = self.given_get_orders_responses(found_order_id, "111-1111111-1111111")
+        resp2 = responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={reset_order_id}",
+            body=requests.exceptions.ConnectionError("Connection reset by peer"),
+        )
+
+        # WHEN
+        orders = self.amazon_orders.get_orders([reset_order_id, found_order_id])
+
+        # THEN
+        self.assertEqual([reset_order_id, found_order_id], list(orders.keys()))
+        self.assertIsInstance(orders[reset_order_id], AmazonOrdersError)
+        self.assertIsInstance(orders[reset_order_id].__cause__, requests.exceptions.ConnectionError)
+        self.assertEqual({"order_id": reset_order_id, "attempts": 4}, orders[reset_order_id].meta)
+        self.assert_order_112_2961628_4757846_return(orders[found_order_id], True)
+        self.assertEqual(4, resp2.call_count)
+        self.assertEqual(1, resp1.call_count)
+
+    @responses.activate
+    def test_get_orders_retries_transient_failures(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        order_id = "112-2961628-4757846"
+        resp1 = responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={order_id}",
+            status=503,
+        )
+        resp2, _ = self.given_get_orders_responses(order_id, "111-1111111-1111111")
+
+        # WHEN
+        orders = self.amazon_orders.get_orders([order_id])
+
+        # THEN
+        self.assert_order_112_2961628_4757846_return(orders[order_id], True)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
+    @responses.activate
+    def test_get_orders_deadline(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        found_order_id = "112-2961628-4757846"
+        stalled_order_id = "111-0000000-0000000"
+        self.given_get_orders_responses(found_order_id, "111-1111111-1111111")
+        release = threading.Event()
+
+        def stalled_order(request):
+            release.wait(5)
+            return 404, {}, ""
+
+        responses.add_callback(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={stalled_order_id}",
+            callback=stalled_order,
+        )
+
+        # WHEN
+        try:
+            with self.assertRaises(AmazonOrdersDeadlineError) as cm:
+                self.amazon_orders.get_orders([stalled_order_id, found_order_id], deadline=1)
+        finally:
+            release.set()
+
+        # THEN
+        self.assertEqual({"order_ids": [stalled_order_id]}, cm.exception.meta)
+        self.assertEqual([found_order_id], list(cm.exception.results.keys()))
+        self.assert_order_112_2961628_4757846_return(cm.exception.results[found_order_id], True)
+
+    @responses.activate
+    @patch("amazonorders.session.httpx", None)
+    def test_aget_orders(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        found_order_id = "112-2961628-4757846"
+        not_found_order_id = "111-0000000-0000000"
+        resp1, resp2 = self.given_get_orders_responses(found_order_id, not_found_order_id)
+
+        # WHEN
+        orders = asyncio.run(self.amazon_orders.aget_orders([found_order_id, not_found_order_id, found_order_id]))
+
+        # THEN
+        self.assertEqual([found_order_id, not_found_order_id], list(orders.keys()))
+        self.assert_order_112_2961628_4757846_return(orders[found_order_id], True)
+        self.assertIsInstance(orders[not_found_order_id], AmazonOrdersNotFoundError)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
+    def test_get_orders_unauthenticated(self):
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.get_orders(["112-2961628-4757846"])
+
+        self.assertEqual("Call AmazonSession.login() to authenticate first.", str(cm.exception))
 
     @responses.activate
     def test_get_order_not_found_errors_with_meta(self):
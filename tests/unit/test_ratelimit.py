@@ -0,0 +1,117 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+from amazonorders.ratelimit import RateLimiter
+
+
+class TestRateLimiter(TestCase):
+    def test_additive_increase_multiplicative_decrease(self):
+        # GIVEN
+        rate_limiter = RateLimiter(max_rate=10, min_rate=1)
+
+        # WHEN
+        rate_limiter.acquire()
+        rate_limiter.release(throttled=True)
+
+        # THEN
+        self.assertEqual(5, rate_limiter.rate)
+
+        # WHEN
+        rate_limiter.acquire()
+        rate_limiter.release()
+
+        # THEN
+        self.assertAlmostEqual(5.1, rate_limiter.rate)
+
+        # WHEN
+        rate_limiter.rate = 9.95
+        rate_limiter.acquire()
+        rate_limiter.release()
+
+        # THEN
+        self.assertEqual(10, rate_limiter.rate)
+
+    def test_concurrent_throttles_decrease_once(self):
+        # GIVEN
+        rate_limiter = RateLimiter(max_rate=10, min_rate=1)
+        for _ in range(3):
+            rate_limiter.acquire()
+
+        # WHEN
+        for _ in range(3):
+            rate_limiter.release(throttled=True)
+
+        # THEN
+        self.assertEqual(5, rate_limiter.rate)
+
+    def test_rate_does_not_drop_below_min_rate(self):
+        # GIVEN
+        rate_limiter = RateLimiter(max_rate=10, min_rate=4)
+        rate_limiter._decreased_at = -1000
+
+        # WHEN
+        rate_limiter.acquire()
+        rate_limiter.release(throttled=True)
+        rate_limiter._decreased_at = -1000
+        rate_limiter.acquire()
+        rate_limiter.release(throttled=True)
+
+        # THEN
+        self.assertEqual(4, rate_limiter.rate)
+
+    def test_acquire_waits_for_token(self):
+        # GIVEN
+        rate_limiter = RateLimiter(max_rate=20, min_rate=1)
+        for _ in range(20):
+            rate_limiter.acquire()
+
+        # WHEN
+        start = time.monotonic()
+        rate_limiter.acquire()
+
+        # THEN
+        self.assertGreaterEqual(time.monotonic() - start, 0.03)
+
+    def test_acquire_waits_for_in_flight(self):
+        # GIVEN
+        rate_limiter = RateLimiter(max_rate=100, min_rate=1, max_in_flight=1)
+        rate_limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            rate_limiter.acquire()
+            acquired.set()
+
+        # WHEN
+        threading.Thread(target=acquire, daemon=True).start()
+
+        # THEN
+        self.assertFalse(acquired.wait(0.1))
+
+        # WHEN
+        rate_limiter.release()
+
+        # THEN
+        self.assertTrue(acquired.wait(1))
+
+    def test_aacquire_waits_for_in_flight(self):
+        # GIVEN
+        rate_limiter = RateLimiter(max_rate=100, min_rate=1, max_in_flight=1)
+
+        async def acquire_twice():
+            await rate_limiter.aacquire()
+            asyncio.get_running_loop().call_later(0.05, rate_limiter.release)
+            start = time.monotonic()
+            await rate_limiter.aacquire()
+            return time.monotonic() - start
+
+        # WHEN
+        waited = asyncio.run(acquire_twice())
+
+        # THEN
+        self.assertGreaterEqual(waited, 0.04)
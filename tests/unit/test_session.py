@@ -1,16 +1,19 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import asyncio
 import os
 import sys
 import unittest
 from unittest.mock import patch
 
+import requests
 import responses
 from responses.matchers import query_string_matcher, urlencoded_params_matcher
 
 from amazonorders.conf import AmazonOrdersConfig
-from amazonorders.exception import AmazonOrdersAuthError, AmazonOrdersError
+from amazonorders.exception import (AmazonOrdersAuthError, AmazonOrdersAuthRedirectError, AmazonOrdersError,
+                                    AmazonOrdersTimeoutError)
 from amazonorders.forms import JSAuthBlocker
 from amazonorders.session import AmazonSession
 from tests._auth_form_stubs import OtherStubAuthForm, StubAuthForm
@@ -23,6 +26,14 @@ try:
 except ImportError:
     HAS_AMAZONCAPTCHA = False
 
+try:
+    import httpx
+    import respx
+
+    HAS_RESPX = True
+except ImportError:
+    HAS_RESPX = False
+
 
 class TestSession(UnitTestCase):
     def setUp(self):
@@ -45,6 +56,23 @@ class TestSession(UnitTestCase):
         self.assertTrue(self.amazon_session.is_authenticated)
         self.assert_login_responses_success()
 
+    @responses.activate
+    def test_login_debug_captures_pages(self):
+        # GIVEN
+        self.amazon_session.debug = True
+        self.given_unauthenticated_home_page()
+        self.given_login_responses_success()
+
+        # WHEN
+        self.amazon_session.login()
+        self.amazon_session.debug_capture_writer.close()
+
+        # THEN
+        self.assertTrue(self.amazon_session.is_authenticated)
+        run_id = self.amazon_session.debug_capture_writer.run_id
+        self.assertIn(f"index_{run_id}_0.html", os.listdir(self.test_output_dir))
+        self.assertIn(f"signin_{run_id}_1.html", os.listdir(self.test_output_dir))
+
     @responses.activate
     def test_login_claim(self):
         # GIVEN
@@ -94,6 +122,108 @@ class TestSession(UnitTestCase):
         self.assertNotEqual(old_session, self.amazon_session.session)
         self.assertEqual(1, signout_response.call_count)
 
+    @responses.activate
+    def test_logout_does_not_parse(self):
+        # GIVEN
+        self.given_logout_response_success()
+
+        # WHEN
+        with patch("amazonorders.util.parse_html") as parse_html_mock:
+            self.amazon_session.logout()
+
+        # THEN
+        parse_html_mock.assert_not_called()
+
+    @responses.activate
+    def test_request_parses_lazily(self):
+        # GIVEN
+        self.given_unauthenticated_home_page()
+
+        # WHEN
+        response = self.amazon_session.get(self.test_config.constants.BASE_URL)
+
+        # THEN
+        self.assertFalse(response.is_parsed)
+        self.assertIsNotNone(response.parsed)
+        self.assertTrue(response.is_parsed)
+        self.assertIs(response.parsed, response.parsed)
+
+    @responses.activate
+    def test_request_raw_only(self):
+        # GIVEN
+        self.given_unauthenticated_home_page()
+
+        # WHEN
+        response = self.amazon_session.get(self.test_config.constants.BASE_URL, parse=False)
+
+        # THEN
+        self.assertIsNone(response.parsed)
+        self.assertFalse(response.is_parsed)
+        self.assertTrue(response.response.content)
+
+    @responses.activate
+    def test_request_timeouts(self):
+        # GIVEN
+        self.given_unauthenticated_home_page()
+        self.test_config.update_config("request_connect_timeout", 5, save=False)
+        self.test_config.update_config("request_read_timeout", 15, save=False)
+
+        # WHEN
+        self.amazon_session.get(self.test_config.constants.BASE_URL)
+        self.amazon_session.get(self.test_config.constants.BASE_URL, timeout=1)
+
+        # THEN
+        self.assertEqual((5, 15), responses.calls[0].request.req_kwargs["timeout"])
+        self.assertEqual(1, responses.calls[1].request.req_kwargs["timeout"])
+
+    @responses.activate
+    def test_request_timed_out(self):
+        # GIVEN
+        responses.add(
+            responses.GET,
+            self.test_config.constants.BASE_URL,
+            body=requests.exceptions.ReadTimeout(),
+        )
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersTimeoutError) as cm:
+            self.amazon_session.get(self.test_config.constants.BASE_URL)
+
+        # THEN
+        self.assertEqual(f"The request to {self.test_config.constants.BASE_URL} timed out.", str(cm.exception))
+        self.assertEqual({"url": self.test_config.constants.BASE_URL}, cm.exception.meta)
+
+    @responses.activate
+    def test_check_response_does_not_parse_without_sign_in_form(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        responses.add(responses.GET, url, body="<html><body>Hello</body></html>", status=200)
+        response = self.amazon_session.get(url)
+
+        # WHEN
+        self.amazon_session.check_response(response)
+
+        # THEN
+        self.assertFalse(response.is_parsed)
+
+    @responses.activate
+    def test_check_response_sign_in_form(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        self.given_logout_response_success()
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        with open(os.path.join(self.RESOURCES_DIR, "auth", "signin.html"), "r", encoding="utf-8") as f:
+            responses.add(responses.GET, url, body=f.read(), status=200)
+        response = self.amazon_session.get(url)
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersAuthRedirectError):
+            self.amazon_session.check_response(response)
+
+        # THEN
+        self.assertTrue(response.is_parsed)
+        self.assertFalse(self.amazon_session.is_authenticated)
+
     @responses.activate
     def test_login_claim_invalid_username(self):
         # GIVEN
@@ -742,6 +872,7 @@ class TestSession(UnitTestCase):
         return AmazonOrdersConfig(data={
             "output_dir": self.test_output_dir,
             "cookie_jar_path": self.test_cookie_jar_path,
+            "cookie_persist_delay": 0,
             "auth_reattempt_wait": 0,
             "max_auth_retries": 0,
             **extra,
@@ -818,3 +949,148 @@ class TestSession(UnitTestCase):
         # THEN: config's auth_forms_classes is ignored when auth_forms is passed explicitly
         self.assertEqual(custom_forms, session.auth_forms)
         self.assertEqual(1, len(session.auth_forms))
+
+    @unittest.skipUnless(HAS_RESPX, "httpx optional dependency not installed")
+    def test_aget_shares_cookie_jar(self):
+        # GIVEN
+        self.amazon_session.session.cookies.set("session-id", "some-session-id", domain=".amazon.com", path="/")
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+
+        async def get():
+            try:
+                return await self.amazon_session.aget(url, persist_cookies=False)
+            finally:
+                await self.amazon_session.aclose()
+
+        # WHEN
+        with respx.mock:
+            resp = respx.get(url).mock(return_value=httpx.Response(200,
+                                                                   text="<html><body>Hello</body></html>",
+                                                                   headers={"Set-Cookie": "new-cookie=value"}))
+
+            response = asyncio.run(get())
+
+        # THEN
+        self.assertEqual(1, resp.call_count)
+        self.assertIn("session-id=some-session-id", resp.calls.last.request.headers["Cookie"])
+        self.assertEqual(200, response.response.status_code)
+        self.assertEqual("Hello", response.parsed.select_one("body").text)
+        self.assertEqual("value", self.amazon_session.session.cookies.get("new-cookie"))
+
+    @responses.activate
+    def test_rate_limit_retries_throttled_response(self):
+        # GIVEN
+        self.test_config.update_config("rate_limit", True, save=False)
+        self.test_config.update_config("rate_limit_retry_wait", 0, save=False)
+        amazon_session = AmazonSession("some-username@gmail.com",
+                                       "some-password",
+                                       config=self.test_config)
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp1 = responses.add(responses.GET, url, status=503)
+        resp2 = responses.add(responses.GET, url, status=429)
+        resp3 = responses.add(responses.GET, url, body="<html><body>Hello</body></html>", status=200)
+
+        # WHEN
+        response = amazon_session.get(url)
+
+        # THEN
+        self.assertEqual(200, response.response.status_code)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(1, resp3.call_count)
+        self.assertLess(amazon_session.rate_limiter.rate, self.test_config.rate_limit_max_requests_per_second)
+
+    @responses.activate
+    def test_rate_limit_retries_exhausted(self):
+        # GIVEN
+        self.test_config.update_config("rate_limit", True, save=False)
+        self.test_config.update_config("rate_limit_retry_wait", 0, save=False)
+        self.test_config.update_config("rate_limit_max_retries", 2, save=False)
+        amazon_session = AmazonSession("some-username@gmail.com",
+                                       "some-password",
+                                       config=self.test_config)
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp = responses.add(responses.GET, url, status=503)
+
+        # WHEN
+        response = amazon_session.get(url)
+
+        # THEN
+        self.assertEqual(503, response.response.status_code)
+        self.assertEqual(3, resp.call_count)
+        with self.assertRaises(AmazonOrdersError):
+            amazon_session.check_response(response)
+
+    @responses.activate
+    @patch("amazonorders.session.time.sleep")
+    def test_rate_limit_retry_after_capped(self, mock_sleep):
+        # GIVEN
+        self.test_config.update_config("rate_limit", True, save=False)
+        amazon_session = AmazonSession("some-username@gmail.com",
+                                       "some-password",
+                                       config=self.test_config)
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp1 = responses.add(responses.GET, url, status=429, headers={"Retry-After": "3600"})
+        resp2 = responses.add(responses.GET, url, body="<html><body>Hello</body></html>", status=200)
+
+        # WHEN
+        response = amazon_session.get(url)
+
+        # THEN
+        self.assertEqual(200, response.response.status_code)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        mock_sleep.assert_called_once_with(
+            self.test_config.rate_limit_retry_wait * 2 ** self.test_config.rate_limit_max_retries)
+
+    @responses.activate
+    def test_rate_limit_bot_check_slows_down_without_retry(self):
+        # GIVEN
+        self.test_config.update_config("rate_limit", True, save=False)
+        amazon_session = AmazonSession("some-username@gmail.com",
+                                       "some-password",
+                                       config=self.test_config)
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp = responses.add(responses.GET, url, status=200,
+                             body="<html><body>To discuss automated access to Amazon data please contact "
+                                  "api-services-support@amazon.com.</body></html>")
+
+        # WHEN
+        amazon_session.get(url)
+
+        # THEN
+        self.assertEqual(1, resp.call_count)
+        self.assertEqual(self.test_config.rate_limit_max_requests_per_second / 2, amazon_session.rate_limiter.rate)
+
+    @responses.activate
+    def test_rate_limit_large_page_not_scanned_for_bot_check(self):
+        # GIVEN
+        self.test_config.update_config("rate_limit", True, save=False)
+        amazon_session = AmazonSession("some-username@gmail.com",
+                                       "some-password",
+                                       config=self.test_config)
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp = responses.add(responses.GET, url, status=200,
+                             body="<html><body>{padding}Questions? Contact api-services-support@amazon.com."
+                                  "</body></html>".format(padding="<p>Order</p>" * 10000))
+
+        # WHEN
+        amazon_session.get(url)
+
+        # THEN
+        self.assertEqual(1, resp.call_count)
+        self.assertEqual(self.test_config.rate_limit_max_requests_per_second, amazon_session.rate_limiter.rate)
+
+    @responses.activate
+    def test_no_rate_limit_by_default(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp = responses.add(responses.GET, url, status=503)
+
+        # WHEN
+        response = self.amazon_session.get(url)
+
+        # THEN
+        self.assertIsNone(self.amazon_session.rate_limiter)
+        self.assertEqual(503, response.response.status_code)
+        self.assertEqual(1, resp.call_count)
@@ -1,6 +1,7 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import asyncio
 import datetime
 import os
 from unittest.mock import patch
@@ -8,7 +9,7 @@ from unittest.mock import patch
 import responses
 from bs4 import BeautifulSoup
 
-from amazonorders.exception import AmazonOrdersError, AmazonOrdersAuthRedirectError
+from amazonorders.exception import AmazonOrdersError, AmazonOrdersAuthRedirectError, AmazonOrdersDeadlineError
 from amazonorders.session import AmazonSession
 from amazonorders.transactions import AmazonTransactions, _parse_transaction_form_tag
 from tests.unittestcase import UnitTestCase
@@ -47,6 +48,79 @@ class TestTransactions(UnitTestCase):
         self.assertEqual(1, auth_redirect_response.call_count)
         self.assertEqual(1, signout_response.call_count)
 
+    @responses.activate
+    @patch("amazonorders.transactions.datetime", wraps=datetime)
+    def test_get_transactions_fields(self, mock_today):
+        # GIVEN
+        mock_today.date.today.return_value = datetime.date(2024, 10, 11)
+        self.amazon_session.is_authenticated = True
+        with open(os.path.join(self.RESOURCES_DIR, "transactions", "get-transactions-snippet.html"), "r",
+                  encoding="utf-8") as f:
+            responses.add(
+                responses.POST,
+                f"{self.test_config.constants.TRANSACTION_HISTORY_URL}",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        transactions = self.amazon_transactions.get_transactions(days=1, keep_paging=False,
+                                                                 fields=["order_number", "grand_total"])
+
+        # THEN
+        self.assertEqual(1, len(transactions))
+        transaction = transactions[0]
+        self.assertIn("grand_total", transaction.__dict__)
+        self.assertNotIn("seller", transaction.__dict__)
+        self.assertNotIn("payment_method", transaction.__dict__)
+        self.assertEqual(transaction.order_number, "123-4567890-1234567")
+        self.assertEqual(transaction.payment_method, "Visa ****1234")
+
+    @responses.activate
+    @patch("amazonorders.transactions.datetime", wraps=datetime)
+    def test_get_transactions_detach(self, mock_today):
+        # GIVEN
+        mock_today.date.today.return_value = datetime.date(2024, 10, 11)
+        self.amazon_session.is_authenticated = True
+        with open(os.path.join(self.RESOURCES_DIR, "transactions", "get-transactions-snippet.html"), "r",
+                  encoding="utf-8") as f:
+            responses.add(
+                responses.POST,
+                f"{self.test_config.constants.TRANSACTION_HISTORY_URL}",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        transactions = self.amazon_transactions.get_transactions(days=1, keep_paging=False, detach=True)
+
+        # THEN
+        self.assertEqual(1, len(transactions))
+        transaction = transactions[0]
+        self.assertIsNone(transaction.parsed)
+        self.assertEqual(transaction.order_number, "123-4567890-1234567")
+        self.assertEqual(transaction.payment_method, "Visa ****1234")
+
+    @responses.activate
+    def test_get_transactions_deadline(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        next_page_data = {"ppw-widgetState": "some-state"}
+        resp = responses.add(
+            responses.POST,
+            f"{self.test_config.constants.TRANSACTION_HISTORY_URL}",
+            status=200,
+        )
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersDeadlineError) as cm:
+            self.amazon_transactions.get_transactions(next_page_data=next_page_data, deadline=0)
+
+        # THEN
+        self.assertEqual(next_page_data, cm.exception.meta)
+        self.assertEqual([], cm.exception.results)
+        self.assertEqual(0, resp.call_count)
+
     @responses.activate
     @patch("amazonorders.transactions.datetime", wraps=datetime)
     def test_get_transactions(self, mock_today):
@@ -79,6 +153,32 @@ class TestTransactions(UnitTestCase):
         self.assertEqual(transaction.seller, "AMZN Mktp CA")
         self.assertEqual(1, resp.call_count)
 
+    @responses.activate
+    @patch("amazonorders.session.httpx", None)
+    @patch("amazonorders.transactions.datetime", wraps=datetime)
+    def test_aget_transactions(self, mock_today):
+        # GIVEN
+        mock_today.date.today.return_value = datetime.date(2024, 10, 11)
+        days = 1
+        self.amazon_session.is_authenticated = True
+        with open(os.path.join(self.RESOURCES_DIR, "transactions", "get-transactions-snippet.html"), "r",
+                  encoding="utf-8") as f:
+            resp = responses.add(
+                responses.POST,
+                f"{self.test_config.constants.TRANSACTION_HISTORY_URL}",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        transactions = asyncio.run(self.amazon_transactions.aget_transactions(days=days, keep_paging=False))
+
+        # THEN
+        self.assertEqual(1, len(transactions))
+        self.assertEqual(transactions[0].order_number, "123-4567890-1234567")
+        self.assertEqual(transactions[0].grand_total, -45.19)
+        self.assertEqual(1, resp.call_count)
+
     @responses.activate
     def test_get_transactions_errors_with_meta(self):
         # GIVEN
@@ -184,6 +284,50 @@ class TestTransactions(UnitTestCase):
         self.assertEqual(1, resp1.call_count)
         self.assertEqual(1, resp2.call_count)
 
+    @responses.activate
+    @patch("amazonorders.transactions.datetime", wraps=datetime)
+    def test_get_transactions_resume(self, mock_today):
+        # GIVEN
+        mock_today.date.today.return_value = datetime.date(2025, 5, 27)
+        self.amazon_session.is_authenticated = True
+        with open(os.path.join(self.RESOURCES_DIR, "transactions", "transactions-with-next-page.html"),
+                  "r",
+                  encoding="utf-8") as f:
+            resp1 = responses.add(
+                responses.POST,
+                f"{self.test_config.constants.TRANSACTION_HISTORY_URL}",
+                body=f.read(),
+                status=200,
+            )
+        resp2 = responses.add(
+            responses.POST,
+            f"{self.test_config.constants.TRANSACTION_HISTORY_URL}",
+            status=503,
+        )
+        with self.assertRaises(AmazonOrdersError):
+            self.amazon_transactions.get_transactions(resume=True)
+        responses.remove(resp2)
+        with open(os.path.join(self.RESOURCES_DIR, "transactions", "transactions-in-progress.html"),
+                  "r",
+                  encoding="utf-8") as f:
+            resp3 = responses.add(
+                responses.POST,
+                f"{self.test_config.constants.TRANSACTION_HISTORY_URL}",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        transactions = self.amazon_transactions.get_transactions(resume=True)
+
+        # THEN
+        self.assertEqual(40, len(transactions))
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(1, resp3.call_count)
+        self.assertEqual(resp2.calls[0].request.body, resp3.calls[0].request.body)
+        self.assertEqual([], os.listdir(os.path.join(os.path.dirname(self.test_cookie_jar_path), "checkpoints")))
+
     @responses.activate
     @patch("amazonorders.transactions.datetime", wraps=datetime)
     def test_get_transactions_with_pending(self, mock_today):
@@ -293,3 +437,18 @@ class TestTransactions(UnitTestCase):
                 'ppw-widgetEvent:DefaultNextPageNavigationEvent:{"nextPageKey":"key"}': "",
             },
         )
+
+    def test_parse_transaction_form_tag_invalid_date(self):
+        # GIVEN
+        with open(os.path.join(self.RESOURCES_DIR, "transactions", "transaction-form-tag.html"),
+                  "r",
+                  encoding="utf-8") as f:
+            parsed = BeautifulSoup(f.read().replace("October 11, 2024", "Not a date"), self.test_config.bs4_parser)
+            form_tag = parsed.select_one("form")
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            _parse_transaction_form_tag(form_tag, self.test_config)
+
+        # THEN
+        self.assertIn("Could not parse Transaction date \"Not a date\"", str(cm.exception))
@@ -1,9 +1,33 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
-from amazonorders.util import to_type, cleanup_html_text
+import concurrent.futures
+import datetime
+import os
+import queue
+import threading
+import unittest
+from unittest.mock import patch
+
+from amazonorders.entity.order import Order
+from amazonorders.exception import AmazonOrdersDeadlineError, AmazonOrdersError
+from amazonorders.selectors import Selector, Selectors
+from amazonorders.util import (atomic_write, to_type, cleanup_html_text, parse_html, select_one, validate_selectors,
+                               strip_scripts, parse_amount, parse_amounts, parse_date, Deadline, file_lock)
 from tests.unittestcase import UnitTestCase
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import lxml  # noqa: F401
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 
 class TestUtil(UnitTestCase):
     def test_to_type(self):
@@ -23,6 +47,71 @@ class TestUtil(UnitTestCase):
         self.assertEqual(to_type(" "), " ")
         self.assertEqual(to_type("None"), "None")
 
+    def test_parse_amount(self):
+        self.assertIsNone(parse_amount(None))
+        self.assertIsNone(parse_amount(""))
+        self.assertEqual(parse_amount(1234.99), 1234.99)
+        self.assertEqual(parse_amount("1234"), 1234)
+        self.assertIsInstance(parse_amount("1234"), int)
+        self.assertEqual(parse_amount("$1,234.99"), 1234.99)
+        self.assertEqual(parse_amount(" $0.00 "), 0.0)
+        self.assertEqual(parse_amount("£3.50"), 3.5)
+        self.assertEqual(parse_amount("₹1,234.00"), 1234.0)
+        self.assertEqual(parse_amount("Rs. 1,234.00"), 1234.0)
+        self.assertEqual(parse_amount("CDN$ 12.34"), 12.34)
+        self.assertEqual(parse_amount("12.34 USD"), 12.34)
+        self.assertEqual(parse_amount("($1.99)"), -1.99)
+        self.assertEqual(parse_amount("-$5.00"), -5.0)
+        self.assertEqual(parse_amount("$-5.00"), -5.0)
+        self.assertEqual(parse_amount("+CA$12.34"), 12.34)
+        self.assertEqual(parse_amount("FREE"), 0.0)
+        self.assertEqual(parse_amount("Free"), 0.0)
+
+        self.assertIsNone(parse_amount("not currency"))
+        self.assertIsNone(parse_amount("$"))
+        self.assertIsNone(parse_amount("($1.99"))
+        self.assertIsNone(parse_amount("Total: $5.00"))
+        self.assertIsNone(parse_amount("1.2.3"))
+        self.assertIsNone(parse_amount("$" * 10000 + "!"))
+
+        self.assertEqual(parse_amount("1.234,56 €", decimal_comma=True), 1234.56)
+        self.assertEqual(parse_amount("EUR 12,99", decimal_comma=True), 12.99)
+        self.assertEqual(parse_amount("1\u202f234,56 €", decimal_comma=True), 1234.56)
+        self.assertEqual(parse_amount("-1.234 €", decimal_comma=True), -1234)
+        self.assertIsNone(parse_amount("1,2,3", decimal_comma=True))
+
+    def test_parse_amounts(self):
+        self.assertEqual(parse_amounts(["$1.99", "FREE", None, "not currency", "($2)"]), [1.99, 0.0, None, None, -2])
+        self.assertEqual(parse_amounts(["1,99 €", "1.000 €"], decimal_comma=True), [1.99, 1000])
+
+    def test_parse_date(self):
+        self.assertEqual(parse_date("October 5, 2023"), datetime.date(2023, 10, 5))
+        self.assertEqual(parse_date("Order placed\n\n\n      Oct 5, 2023"), datetime.date(2023, 10, 5))
+        self.assertEqual(parse_date("Return window closed on Sept. 5, 2023"), datetime.date(2023, 9, 5))
+        self.assertEqual(parse_date("Return or replace items: Eligible through 5 October 2023"),
+                         datetime.date(2023, 10, 5))
+        self.assertEqual(parse_date("Delivered 2023-10-05"), datetime.date(2023, 10, 5))
+        self.assertIsNone(parse_date("Return eligibility"))
+        self.assertIsNone(parse_date("Return window closed on February 30, 2023", fuzzy=False))
+
+        self.assertEqual(parse_date("05/10/2023"), datetime.date(2023, 5, 10))
+        self.assertEqual(parse_date("05/10/2023", day_first=True), datetime.date(2023, 10, 5))
+
+    def test_parse_date_cached(self):
+        # GIVEN
+        value = "Return window closed on Jan 29, 2019"
+        parse_date(value)
+
+        # WHEN
+        with patch("amazonorders.util.parser.parse") as parse_mock, \
+                patch("amazonorders.util._DATE_MONTH_FIRST_RE") as date_re_mock:
+            parsed_date = parse_date(value)
+
+        # THEN
+        self.assertEqual(datetime.date(2019, 1, 29), parsed_date)
+        date_re_mock.finditer.assert_not_called()
+        parse_mock.assert_not_called()
+
     def test_cleanup_html_text(self):
         self.assertEqual(cleanup_html_text("""This is a paragraph.
         
@@ -55,3 +144,127 @@ class TestUtil(UnitTestCase):
         
         """  # noqa: W293
                                            ), "This has leading newlines. They should be removed.")
+
+    def test_atomic_write(self):
+        # GIVEN
+        os.makedirs(self.test_output_dir, exist_ok=True)
+        path = os.path.join(self.test_output_dir, "atomic.txt")
+        with open(path, "wb") as f:
+            f.write(b"old")
+
+        # WHEN
+        atomic_write(path, b"new")
+
+        # THEN
+        with open(path, "rb") as f:
+            self.assertEqual(b"new", f.read())
+        self.assertEqual(["atomic.txt"], [f for f in os.listdir(self.test_output_dir) if "atomic" in f])
+
+    @unittest.skipUnless(fcntl, "fcntl is not available on this platform")
+    def test_file_lock(self):
+        # GIVEN
+        os.makedirs(self.test_output_dir, exist_ok=True)
+        path = os.path.join(self.test_output_dir, "state.json")
+        thread_lock = threading.Lock()
+
+        # WHEN
+        with file_lock(path, thread_lock):
+            # THEN
+            self.assertTrue(thread_lock.locked())
+            with open(f"{path}.lock", "a+b") as other_lock_file:
+                with self.assertRaises(BlockingIOError):
+                    fcntl.flock(other_lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        # THEN
+        self.assertFalse(thread_lock.locked())
+        with open(f"{path}.lock", "a+b") as other_lock_file:
+            fcntl.flock(other_lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(other_lock_file.fileno(), fcntl.LOCK_UN)
+
+    def test_parse_html(self):
+        # GIVEN
+        html = "<html><body><div class='a-price'><span>$12.34</span></div></body></html>"
+
+        # WHEN
+        parsed = parse_html(html, "html.parser")
+
+        # THEN
+        self.assertEqual("$12.34", select_one(parsed, "div.a-price span").text)
+
+    @unittest.skipUnless(HAS_LXML, "lxml optional dependency not installed")
+    def test_parse_html_lxml_matches_html_parser(self):
+        # GIVEN
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-details-112-2961628-4757846.html"), "r",
+                  encoding="utf-8") as f:
+            html = f.read()
+
+        # WHEN
+        orders = [Order(parse_html(html, bs4_parser), self.test_config, full_details=True)
+                  for bs4_parser in ("html.parser", "lxml")]
+
+        # THEN
+        self.assertEqual(*[(o.order_number, o.order_placed_date, o.grand_total, o.subtotal,
+                            o.recipient.name, [(i.title, i.price) for i in o.items]) for o in orders])
+
+    def test_validate_selectors(self):
+        # GIVEN
+        selectors = Selectors()
+
+        # WHEN
+        count = validate_selectors(selectors)
+
+        # THEN
+        self.assertGreater(count, 0)
+
+    def test_validate_selectors_invalid(self):
+        # GIVEN
+        class InvalidSelectors(Selectors):
+            FIELD_ORDER_NUMBER_SELECTOR = ["[data-component='orderId']", Selector("div:not(")]
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            validate_selectors(InvalidSelectors())
+
+        # THEN
+        self.assertIn("InvalidSelectors.FIELD_ORDER_NUMBER_SELECTOR", str(cm.exception))
+        self.assertEqual({"selector": "FIELD_ORDER_NUMBER_SELECTOR"}, cm.exception.meta)
+
+    def test_strip_scripts(self):
+        # GIVEN
+        html = ("<div><SCRIPT type='text/javascript'>if (a < b) { html = '</div>'; }</Script >"
+                "<style>.a-price { color: red; }</style><span>$12.34</span>"
+                "<script id='shipToData-123' type='a-state'>{\"name\": \"Alex\"}</script></div>")
+
+        # WHEN
+        stripped = strip_scripts(html, r"\bid=[\"']?shipToData")
+
+        # THEN
+        self.assertEqual("<div><span>$12.34</span>"
+                         "<script id='shipToData-123' type='a-state'>{\"name\": \"Alex\"}</script></div>", stripped)
+        self.assertEqual("<div><span>$12.34</span></div>", strip_scripts(html))
+
+    def test_deadline(self):
+        # GIVEN
+        done_future = concurrent.futures.Future()
+        done_future.set_result("done")
+        pending_future = concurrent.futures.Future()
+
+        # WHEN
+        no_deadline = Deadline()
+        deadline = Deadline(60)
+        exhausted_deadline = Deadline(0)
+
+        # THEN
+        self.assertIsNone(no_deadline.remaining())
+        no_deadline.check()
+        self.assertGreater(deadline.remaining(), 59)
+        deadline.check()
+        self.assertEqual("done", deadline.result(done_future))
+        self.assertEqual(0, exhausted_deadline.remaining())
+        with self.assertRaises(AmazonOrdersDeadlineError):
+            exhausted_deadline.check()
+        with self.assertRaises(AmazonOrdersDeadlineError):
+            exhausted_deadline.result(pending_future)
+        with self.assertRaises(AmazonOrdersDeadlineError) as cm:
+            exhausted_deadline.get(queue.Queue())
+        self.assertEqual("The deadline of 0 seconds was exceeded.", str(cm.exception))
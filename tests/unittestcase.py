@@ -30,6 +30,8 @@ class UnitTestCase(TestCase):
         self.test_config = AmazonOrdersConfig(data={
             "output_dir": self.test_output_dir,
             "cookie_jar_path": self.test_cookie_jar_path,
+            "cookie_persist_delay": 0,
+            "details_retry_wait": 0,
             "auth_reattempt_wait": 0,
             "max_auth_retries": 0
         })